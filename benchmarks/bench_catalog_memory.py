@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Catalog memory benchmark: list-of-dicts vs columnar ProgramCatalog vs lazy
+
+Usage:
+    python benchmarks/bench_catalog_memory.py [rows ...]
+"""
+
+import os
+import sys
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from shareware_gen_v2 import SharewareGeneratorV2  # noqa: E402
+
+DEFAULT_ROWS = (10_000, 100_000, 1_000_000)
+
+
+def _measure(build):
+    tracemalloc.start()
+    catalog = build()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return catalog, current
+
+
+def run(rows_list=DEFAULT_ROWS):
+    """Measure retained memory of both representations for each row count"""
+    results = []
+    for rows in rows_list:
+        gen, dict_bytes = _measure(lambda: SharewareGeneratorV2(seed=1998, size=rows))
+        del gen
+        gen, compact_bytes = _measure(
+            lambda: SharewareGeneratorV2(seed=1998, size=rows, compact=True)
+        )
+        column_bytes = gen.get_all_programs().nbytes()
+        del gen
+        gen, lazy_bytes = _measure(
+            lambda: SharewareGeneratorV2(seed=1998, size=rows, lazy=True)
+        )
+        del gen
+        results.append(
+            {
+                "rows": rows,
+                "dict_bytes": dict_bytes,
+                "compact_bytes": compact_bytes,
+                "column_bytes": column_bytes,
+                "lazy_bytes": lazy_bytes,
+                "ratio": dict_bytes / compact_bytes,
+            }
+        )
+    return results
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    rows_list = [int(a) for a in argv] or DEFAULT_ROWS
+
+    print(
+        f"{'rows':>10} {'dicts MiB':>10} {'compact MiB':>12} {'savings':>8} "
+        f"{'lazy KiB':>9}"
+    )
+    for r in run(rows_list):
+        print(
+            f"{r['rows']:>10} {r['dict_bytes'] / 2**20:>10.1f} "
+            f"{r['compact_bytes'] / 2**20:>12.1f} {r['ratio']:>7.1f}x "
+            f"{r['lazy_bytes'] / 2**10:>9.1f}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+Catalog export throughput for every export format
+
+Usage:
+    python benchmarks/bench_export.py [size]
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from shareware_gen_v2 import EXPORT_FORMATS, SharewareGeneratorV2  # noqa: E402
+
+DEFAULT_SIZE = 200_000
+
+
+def run(size=DEFAULT_SIZE):
+    """Time export_to() into a real file for each format"""
+    gen = SharewareGeneratorV2(seed=1998, size=size, counter=True, compact=True)
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for fmt in EXPORT_FORMATS:
+            path = os.path.join(tmp, f"catalog.{fmt}")
+            if fmt == "columnar":
+                f = open(path, "wb")
+            else:
+                f = open(path, "w", encoding="utf-8", newline="")
+            start = time.perf_counter()
+            with f:
+                gen.export_to(f, fmt)
+            elapsed = time.perf_counter() - start
+            nbytes = os.path.getsize(path)
+            results.append(
+                {
+                    "format": fmt,
+                    "rows": size,
+                    "seconds": elapsed,
+                    "bytes": nbytes,
+                    "rows_per_second": size / elapsed,
+                    "mb_per_second": nbytes / 2**20 / elapsed,
+                }
+            )
+    return results
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    size = int(argv[0]) if argv else DEFAULT_SIZE
+
+    print(f"{'format':>9} {'seconds':>8} {'rows/s':>10} {'MiB':>7} {'MiB/s':>7}")
+    for r in run(size):
+        print(
+            f"{r['format']:>9} {r['seconds']:>8.2f} {r['rows_per_second']:>10,.0f} "
+            f"{r['bytes'] / 2**20:>7.1f} {r['mb_per_second']:>7.1f}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+Integrity hashing of large files: throughput and peak memory
+
+Hashes one large file (1 GiB by default) with each read strategy, every
+one in a fresh interpreter so its peak RSS is its own:
+
+    read_all   f.read() of the whole file into one bytes object
+    read       f.read(READ_SIZE) chunks, a new bytes object per chunk
+    mmap       memoryview slices of an mmap of the file
+    readinto   integrity.hash_file(): readinto() a reusable buffer
+
+The file is read once before the first run, so every strategy hashes
+from the page cache.
+
+Usage:
+    python benchmarks/bench_integrity.py [size_mib]
+"""
+
+import hashlib
+import json
+import mmap
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "tools"))
+
+import integrity  # noqa: E402
+
+DEFAULT_SIZE_MIB = 1024
+METHODS = ("read_all", "read", "mmap", "readinto")
+
+# Random block repeated to fill the file (content does not affect SHA-256 speed)
+BLOCK_SIZE = 16 << 20
+
+
+def _hash(method, path):
+    digest = hashlib.new(integrity.ALGORITHM)
+    if method == "read_all":
+        with open(path, "rb") as f:
+            digest.update(f.read())
+    elif method == "read":
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(integrity.READ_SIZE), b""):
+                digest.update(chunk)
+    elif method == "mmap":
+        with open(path, "rb") as f, mmap.mmap(
+            f.fileno(), 0, access=mmap.ACCESS_READ
+        ) as mapped:
+            view = memoryview(mapped)
+            for start in range(0, len(view), integrity.READ_SIZE):
+                digest.update(view[start : start + integrity.READ_SIZE])
+            view.release()
+    else:
+        return integrity.hash_file(path)
+    return digest.hexdigest()
+
+
+def _max_rss_bytes():
+    # ru_maxrss is in KiB on Linux and in bytes on macOS
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss if sys.platform == "darwin" else rss * 1024
+
+
+def _child(method, path):
+    """Hash path in this process and print the measurements as JSON"""
+    before = _max_rss_bytes()
+    start = time.perf_counter()
+    digest = _hash(method, path)
+    seconds = time.perf_counter() - start
+    peak = _max_rss_bytes()
+    json.dump(
+        {
+            "seconds": seconds,
+            "peak_rss_bytes": peak,
+            "rss_growth_bytes": peak - before,
+            "digest": digest,
+        },
+        sys.stdout,
+    )
+
+
+def _write_file(path, size):
+    block = os.urandom(BLOCK_SIZE)
+    with open(path, "wb") as f:
+        for written in range(0, size, BLOCK_SIZE):
+            f.write(block[: size - written])
+
+
+def run(size_mib=DEFAULT_SIZE_MIB, methods=METHODS):
+    """MB/s and peak RSS of each read strategy on one size_mib file"""
+    size = size_mib << 20
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "artifact.bin")
+        _write_file(path, size)
+        expected = _hash("readinto", path)  # Also warms the page cache
+
+        for method in methods:
+            output = subprocess.run(
+                [sys.executable, __file__, "--child", method, path],
+                capture_output=True,
+                text=True,
+                check=True,
+            ).stdout
+            measured = json.loads(output)
+            if measured.pop("digest") != expected:
+                raise RuntimeError(f"{method} produced a different digest")
+            results.append(
+                {
+                    "size_mib": size_mib,
+                    "method": method,
+                    **measured,
+                    "megabytes_per_second": size / 1e6 / measured["seconds"],
+                }
+            )
+    return results
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if argv[:1] == ["--child"]:
+        _child(*argv[1:3])
+        return 0
+    size_mib = int(argv[0]) if argv else DEFAULT_SIZE_MIB
+
+    print(
+        f"{'MiB':>6} {'method':>9} {'MB/s':>7} {'peak RSS MiB':>13} {'growth MiB':>11}"
+    )
+    for r in run(size_mib):
+        print(
+            f"{r['size_mib']:>6} {r['method']:>9} {r['megabytes_per_second']:>7.0f} "
+            f"{r['peak_rss_bytes'] / 2**20:>13.1f} "
+            f"{r['rss_growth_bytes'] / 2**20:>11.1f}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Bytes the launcher writes to the terminal per keystroke
+
+Runs launcher_gui.py in a pseudo-terminal, sends navigation keys and
+counts the output each one produces, with dirty-region rendering and
+with --full-redraw. A burst of keys written at once (a held arrow key)
+measures how much output the launcher produces while catching up.
+
+Usage:
+    python benchmarks/bench_launcher_output.py [keys]
+"""
+
+import fcntl
+import os
+import pty
+import select
+import signal
+import struct
+import sys
+import tempfile
+import termios
+import time
+
+REPO_ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+
+DEFAULT_KEYS = 40
+BURST_KEYS = 100
+SCREEN_ROWS = 30
+SCREEN_COLS = 100
+
+# xterm application-mode cursor keys (curses enables keypad mode)
+KEY_DOWN = b"\x1bOB"
+KEY_UP = b"\x1bOA"
+
+
+def _read_until_idle(fd, idle=0.1, timeout=5.0):
+    """Read output until the terminal has been quiet for idle seconds"""
+    total = 0
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        ready, _, _ = select.select([fd], [], [], idle)
+        if not ready:
+            if total:
+                break
+            continue
+        try:
+            data = os.read(fd, 65536)
+        except OSError:
+            break
+        if not data:
+            break
+        total += len(data)
+    return total
+
+
+def _session(keys, burst, args, cache_dir):
+    pid, fd = pty.fork()
+    if pid == 0:
+        os.chdir(REPO_ROOT)
+        os.environ.update(TERM="xterm", XDG_CACHE_HOME=cache_dir)
+        os.execv(sys.executable, [sys.executable, "launcher_gui.py", *args])
+
+    try:
+        fcntl.ioctl(
+            fd, termios.TIOCSWINSZ, struct.pack("HHHH", SCREEN_ROWS, SCREEN_COLS, 0, 0)
+        )
+        startup = _read_until_idle(fd, idle=0.5, timeout=30)
+        counts = []
+        for key in keys:
+            os.write(fd, key)
+            counts.append(_read_until_idle(fd))
+        os.write(fd, KEY_DOWN * burst)
+        return startup, counts, _read_until_idle(fd)
+    finally:
+        os.kill(pid, signal.SIGTERM)
+        os.waitpid(pid, 0)
+        os.close(fd)
+
+
+def run(keys=DEFAULT_KEYS, burst=BURST_KEYS):
+    """Measure output bytes per key for both rendering modes"""
+    # Down through a page boundary, then back up: selection and page moves
+    sequence = [KEY_DOWN] * (keys - keys // 4) + [KEY_UP] * (keys // 4)
+    results = []
+    with tempfile.TemporaryDirectory() as cache_dir:
+        for mode, args in (("dirty", []), ("full", ["--full-redraw"])):
+            startup, counts, burst_bytes = _session(sequence, burst, args, cache_dir)
+            results.append(
+                {
+                    "mode": mode,
+                    "keys": keys,
+                    "burst": burst,
+                    "startup_bytes": startup,
+                    "key_bytes": sum(counts) / len(counts),
+                    "max_key_bytes": max(counts),
+                    "burst_bytes": burst_bytes,
+                }
+            )
+    return results
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    keys = int(argv[0]) if argv else DEFAULT_KEYS
+
+    print(f"{'mode':>6} {'startup':>8} {'bytes/key':>10} {'max':>6} {'burst':>7}")
+    for r in run(keys):
+        print(
+            f"{r['mode']:>6} {r['startup_bytes']:>8} {r['key_bytes']:>10.0f} "
+            f"{r['max_key_bytes']:>6} {r['burst_bytes']:>7}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
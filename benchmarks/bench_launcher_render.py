@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Launcher render cost, measured headless
+
+Drives GUI_Launcher on the in-memory curses backend (headless_curses.py)
+and times every frame: selection moves, page moves and typing a filter,
+with dirty-region rendering and with full redraws. Frames are rendered
+back to back (no MAX_FPS cap), so frames/s is the launcher's own limit.
+
+Usage:
+    python benchmarks/bench_launcher_render.py [frames]
+"""
+
+import curses
+import os
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import launcher_gui  # noqa: E402
+from headless_curses import HeadlessCurses  # noqa: E402
+
+DEFAULT_FRAMES = 200
+SCREEN_ROWS = 40
+SCREEN_COLS = 120
+
+# Prefix of names in every generated catalog (e.g. "WINZIP", "CHAOS WIN")
+FILTER_TEXT = "win"
+
+
+def _keys(op, frames):
+    if op == "line":
+        # Down through several pages, then back up
+        return [curses.KEY_DOWN] * (frames // 2) + [curses.KEY_UP] * (frames // 2)
+    if op == "page":
+        return [curses.KEY_NPAGE] * (frames // 2) + [curses.KEY_PPAGE] * (frames // 2)
+    # Type the filter, clear it, and again
+    text = [ord("/")] + [ord(c) for c in FILTER_TEXT] + [launcher_gui.KEY_ESCAPE]
+    return (text * (frames // len(text) + 1))[:frames]
+
+
+def _measure(size, mode, frames):
+    screen = HeadlessCurses(SCREEN_ROWS, SCREEN_COLS)
+    launcher = launcher_gui.GUI_Launcher(
+        screen.stdscr, backend=screen, size=size, full_redraw=mode == "full"
+    )
+    launcher.wait_for_catalog()
+    launcher.render()
+
+    # The filter frames must draw a list of matches, not an empty one
+    launcher.filter_text = FILTER_TEXT
+    launcher.apply_filter()
+    matches = len(launcher.view)
+    launcher.filter_text = ""
+    launcher.apply_filter()
+    if not matches:
+        raise RuntimeError(f"filter {FILTER_TEXT!r} matches no program")
+
+    results = []
+    for op in ("line", "page", "filter"):
+        stats = launcher.frame_stats = launcher_gui.FrameStats()
+        for key in _keys(op, frames):
+            launcher.handle_keys([key])
+            launcher.render()
+        # Region drawing alone, without the backend's screen update
+        draw_seconds = sum(seconds for _, seconds in stats.regions.values())
+        results.append(
+            {
+                "size": size,
+                "mode": mode,
+                "op": op,
+                "frames": stats.frames,
+                "seconds": stats.seconds / stats.frames,
+                "draw_seconds": draw_seconds / stats.frames,
+                "max_seconds": stats.max_seconds,
+                "frames_per_second": stats.fps(),
+                "frame_chars": stats.chars / stats.frames,
+            }
+        )
+        if op == "filter":
+            results[-1]["matches"] = matches
+    return results
+
+
+def run(frames=DEFAULT_FRAMES, sizes=(500, 100_000)):
+    """Frame and region draw times, frames/s and characters written per frame"""
+    results = []
+    user_cache_dir = launcher_gui.CATALOG_CACHE_DIR
+    with tempfile.TemporaryDirectory() as cache_dir:
+        launcher_gui.CATALOG_CACHE_DIR = cache_dir
+        try:
+            for size in sizes:
+                for mode in ("dirty", "full"):
+                    results.extend(_measure(size, mode, frames))
+        finally:
+            launcher_gui.CATALOG_CACHE_DIR = user_cache_dir
+    return results
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    frames = int(argv[0]) if argv else DEFAULT_FRAMES
+
+    print(
+        f"{'size':>7} {'mode':>5} {'op':>6} {'ms/frame':>9} {'draw ms':>8} "
+        f"{'max ms':>7} {'frames/s':>9} {'chars':>6}"
+    )
+    for r in run(frames):
+        print(
+            f"{r['size']:>7} {r['mode']:>5} {r['op']:>6} "
+            f"{r['seconds'] * 1000:>9.3f} {r['draw_seconds'] * 1000:>8.3f} "
+            f"{r['max_seconds'] * 1000:>7.2f} "
+            f"{r['frames_per_second']:>9.0f} {r['frame_chars']:>6.0f}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
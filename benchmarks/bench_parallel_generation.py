@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+Catalog generation throughput: serial vs multi-process generate(workers=N)
+
+Usage:
+    python benchmarks/bench_parallel_generation.py [size] [workers ...]
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from shareware_gen_v2 import SharewareGeneratorV2  # noqa: E402
+
+DEFAULT_SIZE = 1_000_000
+
+
+def _default_workers():
+    cpus = os.cpu_count() or 1
+    return sorted({1, 2, cpus} - {0})
+
+
+def run(size=DEFAULT_SIZE, workers_list=None, compact=True):
+    """Time counter-mode generation for each worker count"""
+    workers_list = workers_list or _default_workers()
+    results = []
+    for workers in workers_list:
+        start = time.perf_counter()
+        SharewareGeneratorV2(
+            seed=1998, size=size, counter=True, compact=compact, workers=workers
+        )
+        elapsed = time.perf_counter() - start
+        results.append(
+            {
+                "size": size,
+                "workers": workers,
+                "compact": compact,
+                "seconds": elapsed,
+                "programs_per_second": size / elapsed,
+            }
+        )
+    return results
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    size = int(argv[0]) if argv else DEFAULT_SIZE
+    workers_list = [int(a) for a in argv[1:]] or None
+
+    results = run(size, workers_list)
+    serial = results[0]["seconds"]
+    print(f"{'workers':>8} {'seconds':>9} {'programs/s':>12} {'speedup':>8}")
+    for r in results:
+        print(
+            f"{r['workers']:>8} {r['seconds']:>9.2f} "
+            f"{r['programs_per_second']:>12,.0f} {serial / r['seconds']:>7.1f}x"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Time to first frame: cold interpreter launch vs a warm_pool worker
+
+Builds a throwaway archive entry that imports a handful of heavy stdlib
+packages before printing its "first frame", then measures how long it
+takes from the launch request until that line arrives.
+
+Usage:
+    python benchmarks/bench_warm_start.py [repeat]
+"""
+
+import os
+import select
+import subprocess
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from launch_table import build_launch_table  # noqa: E402
+from warm_pool import WarmWorker  # noqa: E402
+
+DEFAULT_REPEAT = 5
+
+ENTRY = """\
+import asyncio
+import decimal
+import email.mime.multipart
+import http.client
+import json
+import unittest
+import xml.dom.minidom
+
+print("FIRST FRAME", flush=True)
+"""
+
+
+def _make_target(root):
+    os.makedirs(os.path.join(root, "archive", "v9-bench", "src"))
+    with open(os.path.join(root, "archive", "v9-bench", "src", "main.py"), "w") as f:
+        f.write(ENTRY)
+    manifest = {
+        "versions": {
+            "v9-bench": {"path": "archive/v9-bench", "entry": "src/main.py"},
+        }
+    }
+    return build_launch_table(manifest, root)["v9"]
+
+
+def _read_line(fd, timeout=30):
+    data = b""
+    deadline = time.monotonic() + timeout
+    while not data.endswith(b"\n") and time.monotonic() < deadline:
+        ready, _, _ = select.select([fd], [], [], 0.5)
+        if ready:
+            chunk = os.read(fd, 4096)
+            if not chunk:
+                break
+            data += chunk
+    return data
+
+
+def time_cold(target):
+    start = time.perf_counter()
+    process = subprocess.Popen(target.argv(), cwd=target.cwd, stdout=subprocess.PIPE)
+    _read_line(process.stdout.fileno())
+    elapsed = time.perf_counter() - start
+    process.wait()
+    process.stdout.close()
+    return elapsed
+
+
+def time_warm(target, fifo):
+    worker = WarmWorker(target)
+    worker.wait_ready(30)
+    # The worker writes its "log" into a FIFO we are already reading
+    fd = os.open(fifo, os.O_RDONLY | os.O_NONBLOCK)
+    try:
+        start = time.perf_counter()
+        process = worker.start(fifo)
+        _read_line(fd)
+        elapsed = time.perf_counter() - start
+        process.wait()
+    finally:
+        os.close(fd)
+    return elapsed
+
+
+def run(repeat=DEFAULT_REPEAT):
+    """Time to first frame, cold and warm (minimum and mean of repeats)"""
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        target = _make_target(tmp)
+        fifo = os.path.join(tmp, "frames")
+        os.mkfifo(fifo)
+        for mode, measure in (
+            ("cold", lambda: time_cold(target)),
+            ("warm", lambda: time_warm(target, fifo)),
+        ):
+            times = [measure() for _ in range(repeat)]
+            results.append(
+                {
+                    "mode": mode,
+                    "repeat": repeat,
+                    "seconds": min(times),
+                    "mean_seconds": sum(times) / len(times),
+                }
+            )
+    return results
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    repeat = int(argv[0]) if argv else DEFAULT_REPEAT
+
+    print(f"{'mode':>5} {'min ms':>8} {'mean ms':>8}")
+    results = run(repeat)
+    for r in results:
+        print(
+            f"{r['mode']:>5} {r['seconds'] * 1000:>8.1f} "
+            f"{r['mean_seconds'] * 1000:>8.1f}"
+        )
+    print(f"speedup: {results[0]['seconds'] / results[1]['seconds']:.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,351 @@
+#!/usr/bin/env python3
+"""
+Benchmark suite runner for the generator, export, manifest and launcher paths
+
+Runs every benchmark, stores the results as JSON under benchmarks/results/
+and optionally compares them with an earlier run.
+
+Usage:
+    python benchmarks/run_benchmarks.py [--quick] [--only NAME ...]
+    python benchmarks/run_benchmarks.py --compare benchmarks/results/<old>.json
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_ROOT = os.path.dirname(BENCH_DIR)
+RESULTS_DIR = os.path.join(BENCH_DIR, "results")
+
+sys.path.insert(0, REPO_ROOT)
+sys.path.insert(0, os.path.join(REPO_ROOT, "tools"))
+
+import ai_bot_03  # noqa: E402
+import bench_catalog_memory  # noqa: E402
+import bench_export  # noqa: E402
+import bench_integrity  # noqa: E402
+import bench_launcher_output  # noqa: E402
+import bench_launcher_render  # noqa: E402
+import bench_parallel_generation  # noqa: E402
+import bench_warm_start  # noqa: E402
+import shareware_manifest  # noqa: E402
+import yaml  # noqa: E402
+from shareware_gen_v2 import SharewareGeneratorV2  # noqa: E402
+from shareware_init import init_shareware_structure  # noqa: E402
+from shareware_manifest import load_manifest  # noqa: E402
+
+# Result keys with these suffixes are measurements; all others are parameters
+METRIC_SUFFIXES = ("seconds", "bytes", "chars", "per_second", "ratio")
+
+# Metrics compared by --compare, where a larger new value is a regression
+# (minimum time is far less noisy than the median)
+COMPARED_METRICS = (
+    "seconds",
+    "dict_bytes",
+    "compact_bytes",
+    "lazy_bytes",
+    "key_bytes",
+    "frame_chars",
+    "peak_rss_bytes",
+)
+
+# Relative change reported as a regression by --compare
+DEFAULT_THRESHOLD = 0.20
+
+
+def measure(func, repeat=5, number=1):
+    """Time func() and return min/median seconds per call"""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        times.append((time.perf_counter() - start) / number)
+    return {"seconds": min(times), "median_seconds": statistics.median(times)}
+
+
+def bench_generator_construct(quick):
+    sizes = (500, 10_000) if quick else (500, 10_000, 100_000)
+    results = []
+    for size in sizes:
+        for mode in ("stream", "counter", "compact", "lazy"):
+            kwargs = {
+                "stream": {},
+                "counter": {"counter": True},
+                "compact": {"counter": True, "compact": True},
+                "lazy": {"lazy": True},
+            }[mode]
+            timing = measure(
+                lambda: SharewareGeneratorV2(seed=1998, size=size, **kwargs), repeat=3
+            )
+            results.append({"size": size, "mode": mode, **timing})
+    return results
+
+
+def bench_generator_lookups(quick):
+    size = 10_000 if quick else 100_000
+    results = []
+    for mode, kwargs in (("dicts", {}), ("compact", {"compact": True})):
+        gen = SharewareGeneratorV2(seed=1998, size=size, counter=True, **kwargs)
+        numbers = range(1, size + 1, max(1, size // 1000))
+        results.append(
+            {
+                "size": size,
+                "mode": mode,
+                "op": "get_program x1000",
+                **measure(lambda: [gen.get_program(n) for n in numbers]),
+            }
+        )
+        results.append(
+            {
+                "size": size,
+                "mode": mode,
+                "op": "get_programs_by_genre",
+                **measure(lambda: len(gen.get_programs_by_genre("game")), number=100),
+            }
+        )
+        results.append(
+            {
+                "size": size,
+                "mode": mode,
+                "op": "get_real_programs",
+                **measure(lambda: list(gen.get_real_programs()), number=100),
+            }
+        )
+    return results
+
+
+def bench_export_catalog(quick):
+    size = 10_000 if quick else 100_000
+    gen = SharewareGeneratorV2(seed=1998, size=size)
+    return [
+        {
+            "size": size,
+            "op": "export_catalog",
+            **measure(gen.export_catalog, repeat=3),
+        },
+        {
+            "size": size,
+            "op": "export_catalog_to",
+            **measure(lambda: gen.export_catalog_to(io.StringIO()), repeat=3),
+        },
+    ]
+
+
+def _write_manifest(path, versions):
+    with open(path, "w") as f:
+        f.write("versions:\n")
+        for i in range(versions):
+            f.write(
+                f"  v{i}-build:\n"
+                f"    path: archive/v{i}-build\n"
+                "    entry: bin/launch.sh\n"
+                "    role: benchmark\n"
+                f"    protected: {'true' if i % 4 else 'false'}\n"
+            )
+
+
+def bench_manifest(quick):
+    counts = (100, 1_000) if quick else (100, 1_000, 10_000)
+    results = []
+    racy_ns = shareware_manifest.RACY_NS
+    loader_manifest = ai_bot_03.LOADER_MANIFEST
+    yaml_loader = getattr(yaml, "CSafeLoader", None)
+    # The manifests are written just before they are read; treat them as
+    # settled so cached reads take the stat()-only path
+    shareware_manifest.RACY_NS = 0
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            for count in counts:
+                path = os.path.join(tmp, f"shareware-{count}.yml")
+                _write_manifest(path, count)
+                ai_bot_03.LOADER_MANIFEST = path
+                with contextlib.redirect_stdout(io.StringIO()):
+                    manifest = ai_bot_03.read_manifest()
+                    results.append(
+                        {
+                            "versions": count,
+                            "op": "read_manifest",
+                            **measure(ai_bot_03.read_manifest, repeat=3),
+                        }
+                    )
+                    results.append(
+                        {
+                            "versions": count,
+                            "op": "load_manifest (uncached)",
+                            **measure(
+                                lambda: load_manifest(path, use_cache=False),
+                                repeat=3,
+                            ),
+                        }
+                    )
+                    results.append(
+                        {
+                            "versions": count,
+                            "op": "check_canon",
+                            **measure(lambda: ai_bot_03.check_canon(manifest)),
+                        }
+                    )
+                if yaml_loader is not None:
+                    del yaml.CSafeLoader
+                    try:
+                        results.append(
+                            {
+                                "versions": count,
+                                "op": "load_manifest (pure Python YAML)",
+                                **measure(
+                                    lambda: load_manifest(path, use_cache=False),
+                                    repeat=3,
+                                ),
+                            }
+                        )
+                    finally:
+                        yaml.CSafeLoader = yaml_loader
+    finally:
+        shareware_manifest.RACY_NS = racy_ns
+        ai_bot_03.LOADER_MANIFEST = loader_manifest
+        shareware_manifest.clear_cache()
+    return results
+
+
+def bench_init_structure(quick):
+    def run():
+        with tempfile.TemporaryDirectory() as tmp:
+            init_shareware_structure(os.path.join(tmp, "project"))
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        return [{"op": "init_shareware_structure", **measure(run, repeat=10)}]
+
+
+BENCHMARKS = {
+    "generator_construct": bench_generator_construct,
+    "generator_lookups": bench_generator_lookups,
+    "export_catalog": bench_export_catalog,
+    "manifest": bench_manifest,
+    "init_structure": bench_init_structure,
+    "catalog_memory": lambda quick: bench_catalog_memory.run(
+        (10_000,) if quick else (10_000, 100_000)
+    ),
+    "export_formats": lambda quick: bench_export.run(20_000 if quick else 200_000),
+    "parallel_generation": lambda quick: bench_parallel_generation.run(
+        20_000 if quick else 200_000
+    ),
+    "launcher_output": lambda quick: bench_launcher_output.run(20 if quick else 40),
+    "launcher_render": lambda quick: bench_launcher_render.run(
+        100 if quick else 200, (500,) if quick else (500, 100_000)
+    ),
+    "warm_start": lambda quick: bench_warm_start.run(3 if quick else 5),
+    "integrity_hashing": lambda quick: bench_integrity.run(64 if quick else 1024),
+}
+
+
+def _git_revision():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=REPO_ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_suite(names, quick):
+    results = {}
+    for name in names:
+        print(f"Running {name}...", flush=True)
+        results[name] = BENCHMARKS[name](quick)
+    return {
+        "meta": {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "revision": _git_revision(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpus": os.cpu_count(),
+            "quick": quick,
+        },
+        "results": results,
+    }
+
+
+def _case_key(case):
+    """Identify a case by its non-metric parameters"""
+    return tuple(
+        sorted((k, v) for k, v in case.items() if not k.endswith(METRIC_SUFFIXES))
+    )
+
+
+def compare(old, new, threshold=DEFAULT_THRESHOLD):
+    """Print per-case changes and return the number of regressions"""
+    regressions = 0
+    for name, cases in new["results"].items():
+        old_cases = {_case_key(c): c for c in old["results"].get(name, [])}
+        for case in cases:
+            before = old_cases.get(_case_key(case))
+            if before is None:
+                continue
+            for metric in COMPARED_METRICS:
+                if metric not in case or not before.get(metric):
+                    continue
+                change = case[metric] / before[metric] - 1
+                flag = ""
+                if change > threshold:
+                    flag = "  REGRESSION"
+                    regressions += 1
+                params = ", ".join(f"{k}={v}" for k, v in _case_key(case))
+                print(f"{name} [{params}] {metric}: {change:+.1%}{flag}")
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run the benchmark suite.")
+    parser.add_argument(
+        "--quick", action="store_true", help="Use small sizes (for CI smoke runs)"
+    )
+    parser.add_argument(
+        "--only", nargs="+", choices=sorted(BENCHMARKS), help="Benchmarks to run"
+    )
+    parser.add_argument("--output", help="Results file (default: results/<time>.json)")
+    parser.add_argument("--compare", help="Earlier results file to compare against")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help="Relative slowdown reported as a regression (default: 0.20)",
+    )
+    args = parser.parse_args(argv)
+
+    suite = run_suite(args.only or list(BENCHMARKS), args.quick)
+
+    output = args.output
+    if output is None:
+        os.makedirs(RESULTS_DIR, exist_ok=True)
+        stamp = time.strftime("%Y%m%d-%H%M%S")
+        output = os.path.join(RESULTS_DIR, f"{stamp}.json")
+    with open(output, "w") as f:
+        json.dump(suite, f, indent=2)
+    print(f"\nResults written to {output}")
+
+    if args.compare:
+        with open(args.compare) as f:
+            old = json.load(f)
+        print()
+        regressions = compare(old, suite, args.threshold)
+        print(f"\n{regressions} regression(s) above {args.threshold:.0%}")
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,157 @@
+"""
+GAMEZILLA MEGA COLLECTION - Catalog Exporters
+Streaming JSON Lines, CSV and columnar binary writers for tooling
+All exporters consume FIELDS-ordered row tuples from iter_rows()
+"""
+
+import csv
+import json
+import struct
+from array import array
+
+from shareware_catalog import FIELDS
+
+# Rows buffered per write() by the text-based exporters
+BATCH_SIZE = 4096
+
+# Rows per row group in the columnar format
+ROW_GROUP_SIZE = 65536
+
+COLUMNAR_MAGIC = b"GZCOLS1\0"
+COLUMNAR_FOOTER = struct.Struct("<Q8s")
+
+# Column encodings: "int32" raw array, "bool" bit-packed, "dict" dictionary
+# encoded strings (per row group string table plus uint32 indices)
+COLUMN_TYPES = {
+    "number": "int32",
+    "name": "dict",
+    "genre": "dict",
+    "version": "dict",
+    "executable": "dict",
+    "is_real": "bool",
+    "description": "dict",
+}
+
+
+def _batched(rows, size):
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def write_jsonl(rows, fileobj):
+    """Write rows as JSON Lines (one object per program) to a text file"""
+    dumps = json.JSONEncoder(ensure_ascii=False, separators=(",", ":")).encode
+    for batch in _batched(rows, BATCH_SIZE):
+        fileobj.write("".join(dumps(dict(zip(FIELDS, row))) + "\n" for row in batch))
+
+
+def write_csv(rows, fileobj):
+    """Write rows as CSV with a header line to a text file (newline="")"""
+    writer = csv.writer(fileobj, lineterminator="\n")
+    writer.writerow(FIELDS)
+    for batch in _batched(rows, BATCH_SIZE):
+        writer.writerows(batch)
+
+
+def _encode_column(kind, values):
+    if kind == "int32":
+        return array("i", values).tobytes()
+    if kind == "bool":
+        bits = bytearray((len(values) + 7) // 8)
+        for i, value in enumerate(values):
+            if value:
+                bits[i >> 3] |= 1 << (i & 7)
+        return bytes(bits)
+
+    ids = {}
+    indices = array("I", [ids.setdefault(v, len(ids)) for v in values])
+    blobs = [s.encode("utf-8") for s in ids]
+    offsets = array("I", [0])
+    for blob in blobs:
+        offsets.append(offsets[-1] + len(blob))
+    return b"".join(
+        (
+            struct.pack("<I", len(blobs)),
+            offsets.tobytes(),
+            b"".join(blobs),
+            indices.tobytes(),
+        )
+    )
+
+
+def write_columnar(rows, fileobj, row_group_size=ROW_GROUP_SIZE):
+    """Write rows in the compact columnar binary format to a binary file
+
+    The file is a sequence of row groups, each holding one encoded chunk
+    per column, followed by a JSON footer with the schema and the offset
+    and length of every chunk, so readers can load single columns.
+    """
+    fileobj.write(COLUMNAR_MAGIC)
+    offset = len(COLUMNAR_MAGIC)
+    groups = []
+    for batch in _batched(rows, row_group_size):
+        chunks = []
+        for name, values in zip(FIELDS, zip(*batch)):
+            data = _encode_column(COLUMN_TYPES[name], values)
+            fileobj.write(data)
+            chunks.append([offset, len(data)])
+            offset += len(data)
+        groups.append({"rows": len(batch), "chunks": chunks})
+
+    footer = json.dumps(
+        {"columns": [[name, COLUMN_TYPES[name]] for name in FIELDS], "groups": groups}
+    ).encode("utf-8")
+    fileobj.write(footer)
+    fileobj.write(COLUMNAR_FOOTER.pack(len(footer), COLUMNAR_MAGIC))
+
+
+def _decode_column(kind, data, rows):
+    if kind == "int32":
+        values = array("i")
+        values.frombytes(data)
+        return values.tolist()
+    if kind == "bool":
+        return [bool(data[i >> 3] & (1 << (i & 7))) for i in range(rows)]
+
+    (count,) = struct.unpack_from("<I", data, 0)
+    offsets = array("I")
+    offsets.frombytes(data[4 : 4 + 4 * (count + 1)])
+    blob_start = 4 + 4 * (count + 1)
+    strings = [
+        data[blob_start + offsets[i] : blob_start + offsets[i + 1]].decode("utf-8")
+        for i in range(count)
+    ]
+    indices = array("I")
+    indices.frombytes(data[blob_start + offsets[-1] :])
+    return [strings[i] for i in indices]
+
+
+def read_columnar(fileobj):
+    """Yield FIELDS-ordered row tuples from a columnar file (binary, seekable)"""
+    fileobj.seek(-COLUMNAR_FOOTER.size, 2)
+    footer_size, magic = COLUMNAR_FOOTER.unpack(fileobj.read(COLUMNAR_FOOTER.size))
+    if magic != COLUMNAR_MAGIC:
+        raise ValueError("not a columnar catalog file")
+    fileobj.seek(-COLUMNAR_FOOTER.size - footer_size, 2)
+    footer = json.loads(fileobj.read(footer_size).decode("utf-8"))
+
+    kinds = [kind for _, kind in footer["columns"]]
+    for group in footer["groups"]:
+        columns = []
+        for kind, (offset, length) in zip(kinds, group["chunks"]):
+            fileobj.seek(offset)
+            columns.append(_decode_column(kind, fileobj.read(length), group["rows"]))
+        yield from zip(*columns)
+
+
+EXPORTERS = {
+    "jsonl": write_jsonl,
+    "csv": write_csv,
+    "columnar": write_columnar,
+}
@@ -0,0 +1,147 @@
+"""
+GAMEZILLA MEGA COLLECTION - Catalog Search
+Token inverted index plus sorted prefix index over program names
+and descriptions, for instant "type to filter" in the launcher
+"""
+
+import bisect
+import re
+
+TOKEN_RE = re.compile(r"\w+(?:\.\w+)*")
+
+# Postings are bitmaps split into blocks of this many catalog positions
+BLOCK_BITS = 4096
+
+
+def tokenize(text):
+    """Split text into lowercase search tokens ("WINZIP 1.1" -> winzip, 1.1)"""
+    return TOKEN_RE.findall(text.lower())
+
+
+class CatalogSearchIndex:
+    """Search index over a generator's catalog
+
+    Every token of a program's name and description maps to a blocked
+    bitmap of catalog positions ({block: int bitmask}). Queries are split
+    into terms that must all match (AND); a term matches tokens it is a
+    prefix of, or, in substring mode, tokens containing it. Terms are
+    combined block by block with integer OR/AND in catalog order, so a
+    limited query stops as soon as it has enough matches.
+    """
+
+    def __init__(self, generator):
+        self.generator = generator
+        self.programs = generator.get_all_programs()
+        self._postings = {}
+        self._size = 0
+        for pos, prog in enumerate(generator.iter_programs()):
+            self._add(pos, prog)
+        self._refresh_vocabulary()
+
+    def _add(self, pos, prog):
+        block, bit = divmod(pos, BLOCK_BITS)
+        mask = 1 << bit
+        seen = set(tokenize(prog["name"]))
+        seen.update(tokenize(prog["description"]))
+        for token in seen:
+            blocks = self._postings.get(token)
+            if blocks is None:
+                blocks = self._postings[token] = {}
+            blocks[block] = blocks.get(block, 0) | mask
+        self._size = max(self._size, pos + 1)
+
+    def _refresh_vocabulary(self):
+        # Sorted vocabulary doubles as the prefix index
+        self._tokens = sorted(self._postings)
+        self._term_cache = {}
+
+    def __len__(self):
+        return self._size
+
+    def _matching_tokens(self, term, substring):
+        key = (term, substring)
+        tokens = self._term_cache.get(key)
+        if tokens is None:
+            if substring:
+                tokens = [t for t in self._tokens if term in t]
+            else:
+                start = bisect.bisect_left(self._tokens, term)
+                tokens = []
+                for token in self._tokens[start:]:
+                    if not token.startswith(term):
+                        break
+                    tokens.append(token)
+            self._term_cache[key] = tokens
+        return tokens
+
+    def iter_positions(self, query, substring=False):
+        """Yield catalog positions of programs matching every query term"""
+        terms = list(dict.fromkeys(tokenize(query)))
+        if not terms:
+            yield from range(self._size)
+            return
+
+        term_bitmaps = []
+        for term in terms:
+            bitmaps = [
+                self._postings[t] for t in self._matching_tokens(term, substring)
+            ]
+            if not bitmaps:
+                return
+            term_bitmaps.append(bitmaps)
+
+        # Only blocks where the rarest term has matches can produce results
+        term_bitmaps.sort(key=lambda bitmaps: sum(len(b) for b in bitmaps))
+        driver = term_bitmaps[0]
+        if len(driver) == 1:
+            blocks = list(driver[0])
+        else:
+            blocks = sorted(set().union(*driver))
+
+        for block in blocks:
+            bits = 0
+            for bitmaps in term_bitmaps:
+                term_bits = 0
+                for bitmap in bitmaps:
+                    term_bits |= bitmap.get(block, 0)
+                bits = term_bits if bitmaps is driver else bits & term_bits
+                if not bits:
+                    break
+
+            base = block * BLOCK_BITS
+            while bits:
+                low = bits & -bits
+                yield base + low.bit_length() - 1
+                bits ^= low
+
+    def search(self, query, limit=None, substring=False):
+        """Return up to limit catalog positions matching query, in catalog order"""
+        positions = self.iter_positions(query, substring)
+        if limit is not None:
+            positions = (pos for _, pos in zip(range(limit), positions))
+        return list(positions)
+
+    def search_programs(self, query, limit=None, substring=False):
+        """Return up to limit programs matching query, in catalog order"""
+        return [self.programs[pos] for pos in self.search(query, limit, substring)]
+
+
+def scan_catalog(generator, query, limit=None, substring=False):
+    """CatalogSearchIndex.search() without an index: one pass over the catalog
+
+    Matches exactly what the index would; used until an index is built.
+    """
+    terms = list(dict.fromkeys(tokenize(query)))
+    positions = []
+    if limit is not None and limit <= 0:
+        return positions
+    for pos, prog in enumerate(generator.iter_programs()):
+        tokens = tokenize(prog["name"]) + tokenize(prog["description"])
+        if all(
+            any((term in t) if substring else t.startswith(term) for t in tokens)
+            for term in terms
+        ):
+            positions.append(pos)
+            if len(positions) == limit:
+                break
+    return positions
@@ -0,0 +1,98 @@
+"""
+GAMEZILLA MEGA COLLECTION - First Page Snapshot
+The programs around the launcher's initial selection, saved whenever the
+catalog loads so the next start can draw its first frame before the
+generator has even been imported
+"""
+
+import json
+import os
+from collections.abc import Sequence
+
+# Programs kept in a snapshot, centred on the initial selection
+SNAPSHOT_ROWS = 200
+
+# Program fields stored per row (the same keys as generated programs)
+SNAPSHOT_FIELDS = (
+    "number",
+    "name",
+    "genre",
+    "version",
+    "executable",
+    "is_real",
+    "description",
+)
+
+
+def placeholder(number):
+    """Stand-in row for a program that has not been loaded yet"""
+    return {
+        "number": number,
+        "name": "Loading...",
+        "genre": "",
+        "version": "",
+        "executable": "",
+        "is_real": False,
+        "description": "Loading",
+        "loading": True,
+    }
+
+
+class FirstPage(Sequence):
+    """Catalog of size programs of which only rows start.. are known"""
+
+    __slots__ = ("size", "start", "rows")
+
+    def __init__(self, size=0, start=0, rows=()):
+        self.size = size
+        self.start = start
+        self.rows = list(rows)
+
+    def __len__(self):
+        return self.size
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self.size))]
+        if index < 0:
+            index += self.size
+        if not 0 <= index < self.size:
+            raise IndexError("program index out of range")
+        offset = index - self.start
+        if 0 <= offset < len(self.rows):
+            return self.rows[offset]
+        return placeholder(index + 1)
+
+
+def snapshot_path(cache_dir, seed, size, mode):
+    """Snapshot file for a catalog's seed, size (None: default) and mode"""
+    return os.path.join(cache_dir, f"first-page-{seed}-{mode}-{size or 'default'}.json")
+
+
+def load_first_page(path):
+    """Read a snapshot; return a FirstPage, or None if there is no usable one"""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        return FirstPage(data["size"], data["start"], data["rows"])
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+def save_first_page(path, programs, selected, rows=SNAPSHOT_ROWS):
+    """Snapshot the programs around index selected of a loaded catalog"""
+    start = max(0, selected - rows // 2)
+    data = {
+        "size": len(programs),
+        "start": start,
+        "rows": [
+            {field: prog[field] for field in SNAPSHOT_FIELDS}
+            for prog in programs[start : start + rows]
+        ],
+    }
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    # Write then rename, so a concurrent start never reads half a snapshot
+    partial = f"{path}.{os.getpid()}.tmp"
+    with open(partial, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False)
+    os.replace(partial, path)
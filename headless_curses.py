@@ -0,0 +1,310 @@
+"""
+GAMEZILLA MEGA COLLECTION - Headless Curses
+In-memory stand-in for the part of the curses module the launcher uses,
+so GUI_Launcher can be driven, inspected and timed without a terminal
+
+Windows keep a grid of (character, attribute) cells. Like curses,
+noutrefresh() copies a window's touched lines to a virtual screen and
+doupdate() sends the virtual screen's changed cells to the "terminal",
+counting them in chars_written. Input comes from a script of keys and
+mouse clicks.
+"""
+
+import curses
+import time
+from collections import deque
+
+BLANK = (" ", 0)
+
+
+class HeadlessWindow:
+    """A window or pad: a grid of (character, attribute) cells"""
+
+    def __init__(self, screen, lines, cols, begin_y=0, begin_x=0, pad=False):
+        if lines <= 0 or cols <= 0:
+            raise curses.error("window size must be positive")
+        self.screen = screen
+        self.lines = lines
+        self.cols = cols
+        self.begin_y = begin_y
+        self.begin_x = begin_x
+        self.pad = pad
+        self.attrs = 0
+        self.background = BLANK
+        self.cells = [[BLANK] * cols for _ in range(lines)]
+        # Lines changed since the last noutrefresh(); new windows are all touched
+        self.touched = set(range(lines))
+        self.cleared = False
+        self.cursor = (0, 0)
+        self.delay = -1
+
+    def getmaxyx(self):
+        return self.lines, self.cols
+
+    def getbegyx(self):
+        return self.begin_y, self.begin_x
+
+    def addstr(self, *args):
+        """addstr([y, x,] text[, attr]); wraps at the right edge like curses"""
+        if len(args) >= 3:
+            y, x, text = args[:3]
+            attr = args[3] if len(args) > 3 else 0
+        else:
+            (y, x), text = self.cursor, args[0]
+            attr = args[1] if len(args) > 1 else 0
+        if not (0 <= y < self.lines and 0 <= x < self.cols):
+            raise curses.error("addstr() returned ERR")
+        attr |= self.attrs
+        for ch in text:
+            if ch == "\n":
+                # Clear to the end of the line and move to the next one
+                self.cells[y][x:] = [self.background] * (self.cols - x)
+                self.touched.add(y)
+                y, x = y + 1, 0
+            else:
+                self.cells[y][x] = (ch, attr)
+                self.touched.add(y)
+                x += 1
+                if x == self.cols:
+                    y, x = y + 1, 0
+            if y == self.lines:
+                # The cursor cannot move past the bottom right corner
+                self.cursor = (self.lines - 1, self.cols - 1)
+                raise curses.error("addstr() returned ERR")
+        self.cursor = (y, x)
+
+    def attron(self, attr):
+        self.attrs |= attr
+
+    def attroff(self, attr):
+        self.attrs &= ~attr
+
+    def bkgd(self, ch, attr=0):
+        """Set the background, repainting cells that showed the old one"""
+        old, self.background = self.background, (ch, attr)
+        for row in self.cells:
+            for x, cell in enumerate(row):
+                if cell == old:
+                    row[x] = self.background
+        self.touchwin()
+
+    def erase(self):
+        for row in self.cells:
+            row[:] = [self.background] * self.cols
+        self.cursor = (0, 0)
+        self.touchwin()
+
+    def clear(self):
+        """Erase, and repaint the whole terminal on the next refresh"""
+        self.erase()
+        self.cleared = True
+
+    def touchwin(self):
+        self.touched.update(range(self.lines))
+
+    def overwrite(self, dest, *rect):
+        """Copy onto dest: where the windows overlap, or a given rectangle
+
+        rect is (sminrow, smincol, dminrow, dmincol, dmaxrow, dmaxcol), the
+        maxima inclusive, as for curses.window.overwrite().
+        """
+        if rect:
+            sminrow, smincol, dminrow, dmincol, dmaxrow, dmaxcol = rect
+        else:
+            # Overlap in screen coordinates (pads sit at the origin)
+            top = max(self.begin_y, dest.begin_y)
+            left = max(self.begin_x, dest.begin_x)
+            bottom = min(self.begin_y + self.lines, dest.begin_y + dest.lines) - 1
+            right = min(self.begin_x + self.cols, dest.begin_x + dest.cols) - 1
+            if bottom < top or right < left:
+                raise curses.error("overwrite() returned ERR")
+            sminrow, smincol = top - self.begin_y, left - self.begin_x
+            dminrow, dmincol = top - dest.begin_y, left - dest.begin_x
+            dmaxrow, dmaxcol = bottom - dest.begin_y, right - dest.begin_x
+        rows = dmaxrow - dminrow + 1
+        cols = dmaxcol - dmincol + 1
+        if (
+            min(sminrow, smincol, dminrow, dmincol) < 0
+            or rows <= 0
+            or cols <= 0
+            or sminrow + rows > self.lines
+            or smincol + cols > self.cols
+            or dmaxrow >= dest.lines
+            or dmaxcol >= dest.cols
+        ):
+            raise curses.error("overwrite() returned ERR")
+        for i in range(rows):
+            source = self.cells[sminrow + i][smincol : smincol + cols]
+            dest.cells[dminrow + i][dmincol : dmincol + cols] = source
+            dest.touched.add(dminrow + i)
+
+    def noutrefresh(self):
+        """Copy the touched lines to the virtual screen"""
+        if self.pad:
+            raise curses.error("pads are copied with overwrite(), not refreshed")
+        screen = self.screen
+        if self.cleared:
+            screen.repaint_all = True
+            self.cleared = False
+        left = max(0, self.begin_x)
+        right = min(screen.cols, self.begin_x + self.cols)
+        for y in self.touched:
+            row = self.begin_y + y
+            if 0 <= row < screen.lines and left < right:
+                cells = self.cells[y][left - self.begin_x : right - self.begin_x]
+                screen.virtual[row][left:right] = cells
+        self.touched.clear()
+
+    def refresh(self):
+        self.noutrefresh()
+        self.screen.doupdate()
+
+    def timeout(self, delay):
+        self.delay = delay
+
+    def getch(self):
+        """Next scripted key; like curses, a changed window is refreshed first"""
+        if self.touched and not self.pad:
+            self.refresh()
+        return self.screen.next_key(self.delay)
+
+
+class HeadlessCurses:
+    """Stand-in for the curses module, drawing into an in-memory screen
+
+    Key codes, colours and attributes are the real module's constants.
+    Script input with press() (one key per read), burst() (keys that
+    arrive together) and click(). Once the script runs out, a blocking
+    getch() raises KeyboardInterrupt, which ends GUI_Launcher.run() the
+    way Ctrl-C does.
+    """
+
+    error = curses.error
+
+    def __init__(self, lines=25, cols=80):
+        self.lines = lines
+        self.cols = cols
+        # What doupdate() will send, and what the terminal currently shows
+        self.virtual = [[BLANK] * cols for _ in range(lines)]
+        self.physical = [[BLANK] * cols for _ in range(lines)]
+        self.repaint_all = True
+        self.chars_written = 0
+        self.updates = 0
+        self.pairs = {}
+        self.cursor_visibility = 1
+        # Keys to read; None is a gap where no input arrives
+        self.keys = deque()
+        self.mouse_events = deque()
+        self.stdscr = HeadlessWindow(self, lines, cols)
+
+    def __getattr__(self, name):
+        if name.isupper():
+            return getattr(curses, name)
+        raise AttributeError(name)
+
+    # Input script
+
+    def press(self, *keys):
+        """Queue keys (codes or characters), each read on its own"""
+        for key in keys:
+            self.keys.append(ord(key) if isinstance(key, str) else key)
+            self.keys.append(None)
+
+    def burst(self, *keys):
+        """Queue keys that arrive together (read in one batch)"""
+        self.keys.extend(ord(key) if isinstance(key, str) else key for key in keys)
+        self.keys.append(None)
+
+    def click(self, y, x, state=curses.BUTTON1_CLICKED):
+        """Queue a mouse event at screen position (y, x)"""
+        self.mouse_events.append((0, x, y, 0, state))
+        self.press(curses.KEY_MOUSE)
+
+    def next_key(self, delay):
+        """The next scripted key, or -1 if none arrives within delay ms"""
+        while self.keys:
+            if self.keys[0] is not None:
+                return self.keys.popleft()
+            if delay == 0:
+                # A gap ends the batch but lasts until somebody waits out
+                return -1
+            self.keys.popleft()
+            if delay > 0:
+                # Nothing arrives while the caller waits
+                time.sleep(delay / 1000)
+                return -1
+        if delay < 0:
+            raise KeyboardInterrupt
+        time.sleep(delay / 1000)
+        return -1
+
+    # The curses API used by the launcher
+
+    def initscr(self):
+        return self.stdscr
+
+    def endwin(self):
+        pass
+
+    def newwin(self, lines, cols, begin_y=0, begin_x=0):
+        return HeadlessWindow(self, lines, cols, begin_y, begin_x)
+
+    def newpad(self, lines, cols):
+        return HeadlessWindow(self, lines, cols, pad=True)
+
+    def doupdate(self):
+        """Send the virtual screen's changed cells to the terminal"""
+        for y in range(self.lines):
+            virtual, physical = self.virtual[y], self.physical[y]
+            if self.repaint_all:
+                self.chars_written += self.cols
+            elif virtual == physical:
+                continue
+            else:
+                self.chars_written += sum(
+                    1 for a, b in zip(virtual, physical) if a != b
+                )
+            physical[:] = virtual
+        self.repaint_all = False
+        self.updates += 1
+
+    def start_color(self):
+        pass
+
+    def use_default_colors(self):
+        pass
+
+    def init_pair(self, pair, fg, bg):
+        self.pairs[pair] = (fg, bg)
+
+    def color_pair(self, pair):
+        return pair << 8
+
+    def curs_set(self, visibility):
+        previous, self.cursor_visibility = self.cursor_visibility, visibility
+        return previous
+
+    def mousemask(self, mask):
+        return mask, 0
+
+    def getmouse(self):
+        if not self.mouse_events:
+            raise curses.error("getmouse() returned ERR")
+        return self.mouse_events.popleft()
+
+    # Inspection
+
+    def screen_text(self):
+        """The terminal's contents, one string per line"""
+        return ["".join(ch for ch, _ in row) for row in self.physical]
+
+    def find(self, text):
+        """(y, x) of the first occurrence of text on the terminal, or None"""
+        for y, line in enumerate(self.screen_text()):
+            x = line.find(text)
+            if x >= 0:
+                return y, x
+        return None
+
+    def attr_at(self, y, x):
+        return self.physical[y][x][1]
@@ -0,0 +1,88 @@
+"""
+GAMEZILLA MEGA COLLECTION - Launch Table
+Resolves the versions in shareware.yml into launch targets keyed by the
+catalog's executable id ("v1" for v1-doofenstein), so launchers look
+builds up in O(1) instead of probing candidate paths
+"""
+
+import os
+import sys
+from collections import namedtuple
+
+from shareware_manifest import Manifest, ManifestError, parse_manifest
+
+# How to start an entry file, by extension; anything else is run directly
+INTERPRETERS = {
+    ".py": [sys.executable],
+    ".sh": ["/bin/sh"],
+}
+
+# Builds with this role are read, not run
+DOCUMENTATION_ROLE = "documentation"
+
+
+class LaunchTableError(ValueError):
+    """shareware.yml cannot be turned into a launch table"""
+
+
+class LaunchTarget(
+    namedtuple("LaunchTarget", "version_id path entry role protected placeholder")
+):
+    """A manifest version resolved for launching (path is absolute)"""
+
+    __slots__ = ()
+
+    @property
+    def entry_path(self):
+        return os.path.join(self.path, self.entry)
+
+    @property
+    def is_docs(self):
+        return self.role == DOCUMENTATION_ROLE
+
+    @property
+    def cwd(self):
+        """Builds run from the directory holding their entry file"""
+        return os.path.dirname(self.entry_path)
+
+    def argv(self):
+        """Command line for the entry file (run from cwd, never via a shell)"""
+        script = os.path.basename(self.entry)
+        interpreter = INTERPRETERS.get(os.path.splitext(script)[1])
+        if interpreter is None:
+            return [os.path.join(".", script)]
+        return interpreter + [script]
+
+
+def executable_id(version):
+    """Catalog executable id of a Version: its executable field or id prefix"""
+    return str(version.executable or version.version_id.split("-", 1)[0])
+
+
+def build_launch_table(manifest, base_dir):
+    """Map executable ids to LaunchTargets for a Manifest (or parsed YAML)"""
+    if not isinstance(manifest, Manifest):
+        try:
+            manifest = parse_manifest(manifest)
+        except ManifestError as e:
+            raise LaunchTableError(str(e))
+
+    table = {}
+    for version_id, version in manifest.versions.items():
+        if not version.entry:
+            raise LaunchTableError(f"version '{version_id}' has no entry")
+        key = executable_id(version)
+        if key in table:
+            raise LaunchTableError(
+                f"versions '{table[key].version_id}' and '{version_id}' "
+                f"both launch as '{key}'"
+            )
+        table[key] = LaunchTarget(
+            version_id=version_id,
+            path=os.path.normpath(os.path.join(base_dir, version.path)),
+            entry=version.entry,
+            role=version.role,
+            protected=version.protected,
+            placeholder=version.placeholder,
+        )
+    return table
@@ -5,231 +5,667 @@ Mid-90s style mouse-clickable 16-color interface
 Windows 95-inspired shareware CD experience
 """
 
+import argparse
+import contextlib
 import curses
 import os
 import sys
+import threading
 import time
 
-from shareware_gen_v2 import SharewareGeneratorV2
+# Reference point for --profile-startup. The generator, search index and
+# warm pool modules are imported on first use, off the path to the first frame
+IMPORTS_STARTED = time.perf_counter()
+
+from first_page import (  # noqa: E402
+    FirstPage,
+    load_first_page,
+    save_first_page,
+    snapshot_path,
+)
+from launch_table import LaunchTableError, build_launch_table  # noqa: E402
+from process_table import ProcessTable  # noqa: E402
+from shareware_manifest import ManifestError, load_manifest  # noqa: E402
+
+IMPORTS_FINISHED = time.perf_counter()
+
+# Fixed seed so the catalog can be cached between launches (like a real CD)
+CATALOG_SEED = 1998
+CATALOG_CACHE_DIR = os.path.join(
+    os.environ.get("XDG_CACHE_HOME", os.path.expanduser("~/.cache")), "gamezilla"
+)
+# Output of builds launched in the background
+LAUNCH_LOG_DIR = os.path.join(CATALOG_CACHE_DIR, "logs")
+
+MANIFEST_NAME = "shareware.yml"
+MANIFEST_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), MANIFEST_NAME)
+
+# The tools/ scripts import each other as top-level modules (import
+# integrity); the launcher imports them the same way, so there is only ever
+# one copy of each module
+TOOLS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "tools")
+if TOOLS_DIR not in sys.path:
+    sys.path.append(TOOLS_DIR)
+
+# Program 387 (GLITCHDEX MALL V1) is selected at start if the catalog has it
+INITIAL_SELECTION = 386
+
+# Input timeout while the catalog loads, so it is shown as soon as it is ready
+LOAD_POLL_MS = 20
+
+# Pause after each loading step in --theatrical mode
+THEATRICAL_STEP_DELAY = 0.7
+
+# Most matches kept for the "type to filter" list
+MAX_FILTER_RESULTS = 1000
+
+KEY_ESCAPE = 27
+
+# Lines moved per mouse wheel step (button 5 is missing from older curses)
+WHEEL_LINES = 3
+BUTTON5_PRESSED = getattr(curses, "BUTTON5_PRESSED", 0)
+
+# Navigation keys as (unit, amount); runs of them are merged into one move
+NAV_KEYS = {
+    curses.KEY_UP: ("line", -1),
+    curses.KEY_DOWN: ("line", 1),
+    curses.KEY_PPAGE: ("page", -1),
+    curses.KEY_NPAGE: ("page", 1),
+    ord("p"): ("page", -1),
+    ord("P"): ("page", -1),
+    ord("n"): ("page", 1),
+    ord("N"): ("page", 1),
+}
+
+# Upper bound on screen updates; input arriving faster is batched
+MAX_FPS = 60
+
+# Job panel size and refresh interval while launched builds are running
+MAX_JOB_ROWS = 4
+JOB_POLL_MS = 500
+BACKSPACE_KEYS = (curses.KEY_BACKSPACE, 127, 8)
+
+# Screen regions that are repainted independently; "chrome" is the cached
+# frame, header and buttons composited onto stdscr
+REGIONS = ("chrome", "list", "info", "status", "jobs")
+
+BUTTONS = (
+    ("launch", "LAUNCH"),
+    ("prev", "< PREV"),
+    ("next", "NEXT >"),
+    ("quit", "QUIT"),
+)
+
+STATUS_HELP = (
+    " Mouse: Click to select • Keyboard: ↑↓ Navigate, / Filter, ENTER Launch, Q Quit "
+)
+
+
+class LaunchError(Exception):
+    """A launch step failed; the message is shown on the loading screen"""
+
+
+class StartupProfile:
+    """Start offset and duration of each startup step (--profile-startup)"""
+
+    def __init__(self, started=IMPORTS_STARTED):
+        self.started = started
+        self.steps = []
+
+    def record(self, name, begin, end=None):
+        """Add a step that ran from begin to end (default: now)"""
+        end = time.perf_counter() if end is None else end
+        # list.append is atomic, so the loader thread can record steps too
+        self.steps.append((name, begin - self.started, end - begin))
+
+    @contextlib.contextmanager
+    def step(self, name):
+        """Time the body of a with block as one step"""
+        begin = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, begin)
+
+    def report(self):
+        """The steps in start order, as a table in milliseconds"""
+        lines = [f"{'start ms':>9} {'took ms':>9}  step"]
+        for name, offset, took in sorted(self.steps, key=lambda step: step[1]):
+            lines.append(f"{offset * 1000:>9.1f} {took * 1000:>9.1f}  {name}")
+        return "\n".join(lines)
+
+
+class FrameStats:
+    """Render time per frame and per region, output size and frame rate"""
+
+    def __init__(self):
+        self.frames = 0
+        self.seconds = 0.0
+        self.max_seconds = 0.0
+        # Region name -> [draws, seconds]
+        self.regions = {}
+        # Characters sent to the terminal (None if the backend cannot count)
+        self.chars = None
+        self.first = self.last = None
+        self.last_frame = None  # (seconds, {region: seconds}, chars)
+
+    def record(self, started, regions, chars=None):
+        """Add a frame that began at started and drew regions"""
+        ended = time.perf_counter()
+        seconds = ended - started
+        self.frames += 1
+        self.seconds += seconds
+        self.max_seconds = max(self.max_seconds, seconds)
+        for name, took in regions.items():
+            stats = self.regions.setdefault(name, [0, 0.0])
+            stats[0] += 1
+            stats[1] += took
+        if chars is not None:
+            self.chars = (self.chars or 0) + chars
+        if self.first is None:
+            self.first = started
+        self.last = ended
+        self.last_frame = (seconds, regions, chars)
+
+    def fps(self):
+        """Frames per second over the recorded period"""
+        if self.frames < 2 or self.last == self.first:
+            return 0.0
+        return self.frames / (self.last - self.first)
+
+    def report(self):
+        """Totals and per-region averages, as text"""
+        if not self.frames:
+            return "No frames rendered."
+        lines = [
+            f"{self.frames} frames, {self.fps():.1f} fps, "
+            f"{self.seconds / self.frames * 1000:.2f} ms mean, "
+            f"{self.max_seconds * 1000:.2f} ms max"
+        ]
+        if self.chars is not None:
+            lines.append(f"{self.chars / self.frames:.0f} characters written per frame")
+        for name, (draws, took) in sorted(self.regions.items()):
+            lines.append(
+                f"{name:>8}: {draws:>6} draws, {took / draws * 1000:.3f} ms each"
+            )
+        return "\n".join(lines)
 
 
 class GUI_Launcher:
     """Mid-90s style GUI launcher with mouse support"""
 
-    def __init__(self, stdscr):
+    def __init__(
+        self,
+        stdscr,
+        full_redraw=False,
+        size=None,
+        lazy=False,
+        background=False,
+        theatrical=False,
+        warm=False,
+        profile_startup=False,
+        backend=curses,
+    ):
         self.stdscr = stdscr
-        self.generator = SharewareGeneratorV2()
-        self.programs = self.generator.get_all_programs()
-        self.selected_idx = 386  # Program 387 (GLITCHDEX MALL V1)
-        self.page = 0
-        self.items_per_page = 10
+        # The curses module, or a stand-in such as HeadlessCurses (key codes
+        # and attributes are the real module's constants either way)
+        self.curses = backend
+        self.frame_stats = FrameStats()
+        self.profile = StartupProfile()
+        self.profile.record(
+            "import launcher modules", IMPORTS_STARTED, IMPORTS_FINISHED
+        )
+        self.profile.record("parse arguments, start curses", IMPORTS_FINISHED)
+        # Quit once the full catalog is on screen and report the timings
+        self.profile_startup = profile_startup
+        # Pause between loading steps like a real 1996 CD-ROM drive
+        self.theatrical = theatrical
+        # Built from shareware.yml on first launch, and again if it changes
+        self.launch_table = None
+        self.launch_manifest = None
+        # The loader thread reads the table and verifies builds too, to
+        # start the warm pool (reentrant: verifying reads the record)
+        self.launch_lock = threading.RLock()
+        # Read on the first protected launch, and again whenever it changes
+        self.integrity_record = None
+        self.integrity_stat = None
+        # Idle interpreters with each build's imports loaded (--warm); the
+        # pool is started by the catalog loader
+        self.warm_pool = None
+        # Launch builds in the background by default (B always does)
+        self.background = background
+        self.jobs = ProcessTable(log_dir=LAUNCH_LOG_DIR)
+        # Repaint everything each frame (the pre dirty-region behaviour)
+        self.full_redraw = full_redraw
+        self.dirty = set()
+        # The first frame shows the previous run's snapshot of the first
+        # page; the generator is imported and the catalog loaded in a thread
+        # (None for size means the generator's default)
+        self.generator = None
+        self.snapshot_path = snapshot_path(
+            CATALOG_CACHE_DIR, CATALOG_SEED, size, "counter" if lazy else "stream"
+        )
+        with self.profile.step("read first page snapshot"):
+            self.programs = load_first_page(self.snapshot_path) or FirstPage()
+        self.loaded = None  # (generator, error) handed over by the loader
+        # Set once the loader is past the warm pool (--profile-startup waits
+        # for it; the search index is built after it)
+        self.warm_done = threading.Event()
+        self.loader = threading.Thread(
+            target=self._load_catalog, args=(size, lazy, warm), daemon=True
+        )
+        # Programs currently listed: the whole catalog or the filter matches
+        self.view = self.programs
+        # Built by the loader after the catalog (except for lazy catalogs)
+        self.search_index = None
+        self.filter_text = ""
+        self.filter_mode = False
+        self.selected_idx = self.initial_selection()
+        self.top = 0  # Index of the first listed program
+        self.items_per_page = 10  # Visible list rows, set by layout()
+        self.number_width = max(3, len(str(len(self.programs))))
         self.running = True
 
         # Initialize colors
         self.init_colors()
 
         # Enable mouse
-        curses.mousemask(curses.ALL_MOUSE_EVENTS | curses.REPORT_MOUSE_POSITION)
+        self.curses.mousemask(curses.ALL_MOUSE_EVENTS | curses.REPORT_MOUSE_POSITION)
 
         # Hide cursor
-        curses.curs_set(0)
+        self.curses.curs_set(0)
+
+        with self.profile.step("layout"):
+            self.layout()
+
+    def initial_selection(self):
+        """Index selected at start: INITIAL_SELECTION if the catalog has it"""
+        return INITIAL_SELECTION if len(self.programs) > INITIAL_SELECTION else 0
+
+    def _load_catalog(self, size, lazy, warm):
+        """Loader thread: import the generator, then build or map the catalog"""
+        try:
+            with self.profile.step("import shareware_gen_v2"):
+                from shareware_gen_v2 import SharewareGeneratorV2
+
+            options = {} if size is None else {"size": size}
+            with self.profile.step("load catalog"):
+                generator = SharewareGeneratorV2(
+                    seed=CATALOG_SEED,
+                    lazy=lazy,
+                    cache_dir=CATALOG_CACHE_DIR,
+                    **options,
+                )
+        except Exception as e:
+            # Raised again by the main thread in update_catalog()
+            self.loaded = (None, e)
+            self.warm_done.set()
+            return
+        self.loaded = (generator, None)
+
+        try:
+            with self.profile.step("save first page snapshot"):
+                try:
+                    save_first_page(
+                        self.snapshot_path,
+                        generator.get_all_programs(),
+                        INITIAL_SELECTION,
+                    )
+                except OSError:
+                    # Only an optimisation; the next start shows placeholders
+                    pass
+
+            if warm:
+                with self.profile.step("start warm pool"):
+                    from warm_pool import WarmPool
+
+                    try:
+                        self.warm_pool = WarmPool(
+                            self.get_launch_table().values(), check=self.verify_target
+                        )
+                    except LaunchError:
+                        pass
+        finally:
+            self.warm_done.set()
+
+        if not lazy:
+            # Lazy catalogs are never indexed: that would generate every
+            # program and hold the GIL for minutes at --size 10**7. Their
+            # filter scans the catalog and stops at the result limit
+            with self.profile.step("build search index"):
+                from catalog_search import CatalogSearchIndex
+
+                # The filter scans the catalog until this is set
+                self.search_index = CatalogSearchIndex(generator)
+
+    def wait_for_catalog(self):
+        """Load the catalog now and switch to it (for scripted use)"""
+        if self.loader.ident is None:
+            self.loader.start()
+        self.loader.join()
+        self.update_catalog()
+
+    def update_catalog(self):
+        """Switch from the first page snapshot to the loaded catalog"""
+        if self.generator is not None or self.loaded is None:
+            return
+        generator, error = self.loaded
+        if error is not None:
+            raise error
+        with self.profile.step("switch to loaded catalog"):
+            snapshot_size = len(self.programs)
+            self.generator = generator
+            self.programs = generator.get_all_programs()
+            self.number_width = max(3, len(str(len(self.programs))))
+            if self.filter_text:
+                self.apply_filter()
+            else:
+                self.view = self.programs
+                if snapshot_size:
+                    # Keep whatever the user selected in the snapshot
+                    self.selected_idx = max(
+                        0, min(self.selected_idx, len(self.view) - 1)
+                    )
+                else:
+                    self.selected_idx = self.initial_selection()
+            # The header shows the catalog size
+            self.layout()
 
     def init_colors(self):
         """Initialize 16-color VGA palette"""
-        curses.start_color()
-        curses.use_default_colors()
+        self.curses.start_color()
+        self.curses.use_default_colors()
 
         # Classic VGA 16-color pairs (matching Windows 95 era)
-        curses.init_pair(1, curses.COLOR_BLACK, curses.COLOR_CYAN)  # Title bar
-        curses.init_pair(2, curses.COLOR_WHITE, curses.COLOR_BLUE)  # Window bg
-        curses.init_pair(3, curses.COLOR_YELLOW, curses.COLOR_BLUE)  # Highlighted text
-        curses.init_pair(4, curses.COLOR_WHITE, curses.COLOR_RED)  # Selected item
-        curses.init_pair(5, curses.COLOR_BLACK, curses.COLOR_WHITE)  # Button
-        curses.init_pair(6, curses.COLOR_WHITE, curses.COLOR_BLACK)  # Button pressed
-        curses.init_pair(7, curses.COLOR_GREEN, curses.COLOR_BLUE)  # Real programs
-        curses.init_pair(8, curses.COLOR_CYAN, curses.COLOR_BLUE)  # Info text
-        curses.init_pair(9, curses.COLOR_BLACK, curses.COLOR_GREEN)  # Status bar
-        curses.init_pair(10, curses.COLOR_YELLOW, curses.COLOR_BLACK)  # Warning
-        curses.init_pair(11, curses.COLOR_RED, curses.COLOR_WHITE)  # Error
-        curses.init_pair(12, curses.COLOR_MAGENTA, curses.COLOR_BLUE)  # Special marker
-
-    def draw_window(self, y, x, height, width, title=""):
+        self.curses.init_pair(1, curses.COLOR_BLACK, curses.COLOR_CYAN)  # Title bar
+        self.curses.init_pair(2, curses.COLOR_WHITE, curses.COLOR_BLUE)  # Window bg
+        self.curses.init_pair(
+            3, curses.COLOR_YELLOW, curses.COLOR_BLUE
+        )  # Highlighted text
+        self.curses.init_pair(4, curses.COLOR_WHITE, curses.COLOR_RED)  # Selected item
+        self.curses.init_pair(5, curses.COLOR_BLACK, curses.COLOR_WHITE)  # Button
+        self.curses.init_pair(
+            6, curses.COLOR_WHITE, curses.COLOR_BLACK
+        )  # Button pressed
+        self.curses.init_pair(7, curses.COLOR_GREEN, curses.COLOR_BLUE)  # Real programs
+        self.curses.init_pair(8, curses.COLOR_CYAN, curses.COLOR_BLUE)  # Info text
+        self.curses.init_pair(9, curses.COLOR_BLACK, curses.COLOR_GREEN)  # Status bar
+        self.curses.init_pair(10, curses.COLOR_YELLOW, curses.COLOR_BLACK)  # Warning
+        self.curses.init_pair(11, curses.COLOR_RED, curses.COLOR_WHITE)  # Error
+        self.curses.init_pair(
+            12, curses.COLOR_MAGENTA, curses.COLOR_BLUE
+        )  # Special marker
+
+    def draw_window(self, y, x, height, width, title="", win=None):
         """Draw a 3D-style window with shadow"""
-        # Shadow
-        for dy in range(1, height + 1):
-            self.stdscr.addstr(y + dy, x + 2, "  " * (width // 2), curses.color_pair(6))
+        win = win or self.stdscr
 
-        # Main window
-        self.stdscr.attron(curses.color_pair(2))
-        for dy in range(height):
-            self.stdscr.addstr(y + dy, x, " " * width)
-        self.stdscr.attroff(curses.color_pair(2))
-
-        # Border
-        self.stdscr.attron(curses.color_pair(2))
-        # Top border
-        self.stdscr.addstr(y, x, "┌" + "─" * (width - 2) + "┐")
-        # Side borders
+        # Shadow (clipped to the screen; the window may fill it entirely)
+        max_y, max_x = win.getmaxyx()
+        shadow = ("  " * (width // 2))[: max_x - (x + 2) - 1]
+        for dy in range(1, height + 1):
+            if y + dy >= max_y or not shadow:
+                break
+            win.addstr(y + dy, x + 2, shadow, self.curses.color_pair(6))
+
+        # Background and border, one write per row
+        pair = self.curses.color_pair(2)
+        win.addstr(y, x, "┌" + "─" * (width - 2) + "┐", pair)
+        middle = "│" + " " * (width - 2) + "│"
         for dy in range(1, height - 1):
-            self.stdscr.addstr(y + dy, x, "│")
-            self.stdscr.addstr(y + dy, x + width - 1, "│")
-        # Bottom border
-        self.stdscr.addstr(y + height - 1, x, "└" + "─" * (width - 2) + "┘")
-        self.stdscr.attroff(curses.color_pair(2))
+            win.addstr(y + dy, x, middle, pair)
+        win.addstr(y + height - 1, x, "└" + "─" * (width - 2) + "┘", pair)
 
         # Title bar
         if title:
-            self.stdscr.attron(curses.color_pair(1))
-            title_text = f" {title} "
-            self.stdscr.addstr(y, x + 2, title_text)
-            self.stdscr.attroff(curses.color_pair(1))
+            win.addstr(y, x + 2, f" {title} ", self.curses.color_pair(1))
 
-    def draw_button(self, y, x, width, label, is_pressed=False):
+    def draw_button(self, y, x, width, label, is_pressed=False, win=None):
         """Draw a 3D button"""
-        pair = curses.color_pair(6 if is_pressed else 5)
+        win = win or self.stdscr
+        pair = self.curses.color_pair(6 if is_pressed else 5)
 
-        self.stdscr.attron(pair)
         # Button with padding
         btn_text = label.center(width - 2)
-        self.stdscr.addstr(y, x, f"[{btn_text}]")
-        self.stdscr.attroff(pair)
+        win.addstr(y, x, f"[{btn_text}]", pair)
 
         return (y, x, y, x + width)  # Return clickable area
 
-    def draw_header(self):
-        """Draw main window header"""
+    def layout(self):
+        """Create the region windows and chrome for the current terminal size"""
         height, width = self.stdscr.getmaxyx()
+        # Launched builds get a panel (with a header row) above the info panel
+        self.job_rows = min(len(self.jobs), MAX_JOB_ROWS)
+        jobs_height = self.job_rows + 1 if self.job_rows else 0
+        # The list fills the remaining rows below the header
+        self.items_per_page = max(1, height - 16 - jobs_height)
+        self.scroll_to(self.selected_idx)
+        # Regions are one column wider than their text so writes never wrap
+        self.list_win = self.curses.newwin(2 + self.items_per_page, width - 5, 5, 3)
+        self.info_win = self.curses.newwin(5, width - 5, height - 9, 3)
+        self.status_win = self.curses.newwin(1, width, height - 2, 0)
+        self.list_win.bkgd(" ", self.curses.color_pair(2))
+        self.info_win.bkgd(" ", self.curses.color_pair(2))
+        self.status_win.bkgd(" ", self.curses.color_pair(9))
+        self.regions = {
+            "list": (self.list_win, self.draw_program_list),
+            "info": (self.info_win, self.draw_program_info),
+            "status": (self.status_win, self.draw_status_bar),
+        }
+        if self.job_rows:
+            self.jobs_win = self.curses.newwin(
+                jobs_height, width - 5, height - 9 - jobs_height, 3
+            )
+            self.jobs_win.bkgd(" ", self.curses.color_pair(2))
+            self.regions["jobs"] = (self.jobs_win, self.draw_jobs)
+
+        # Static chrome is rendered once per size into off-screen pads
+        self.chrome = self.curses.newpad(height, width)
+        self.draw_header(self.chrome)
+        self.draw_buttons(self.chrome)
+        self.status_help = self.curses.newpad(1, width)
+        self.status_help.bkgd(" ", self.curses.color_pair(9))
+        self.status_help.addstr(0, 0, STATUS_HELP[: width - 1])
+
+        self.mark_dirty(*REGIONS)
+
+    def mark_dirty(self, *regions):
+        """Schedule regions for repainting on the next frame"""
+        self.dirty.update(regions)
+
+    def render(self):
+        """Repaint the dirty regions and send them to the terminal at once"""
+        started = time.perf_counter()
+        written = getattr(self.curses, "chars_written", None)
+        drawn = {}
+        if self.full_redraw:
+            self.stdscr.clear()
+            self.mark_dirty(*REGIONS)
+        recomposite = "chrome" in self.dirty
+        if recomposite:
+            self.chrome.overwrite(self.stdscr)
+            self.stdscr.noutrefresh()
+            drawn["chrome"] = time.perf_counter() - started
+        for name, (win, draw) in self.regions.items():
+            if name in self.dirty:
+                begin = time.perf_counter()
+                win.erase()
+                draw()
+                drawn[name] = time.perf_counter() - begin
+            elif recomposite:
+                # Unchanged, but the chrome was just copied over it
+                win.touchwin()
+            else:
+                continue
+            win.noutrefresh()
+        self.curses.doupdate()
+        self.dirty.clear()
+        if written is not None:
+            written = self.curses.chars_written - written
+        self.frame_stats.record(started, drawn, written)
+
+    def draw_header(self, win):
+        """Draw main window header"""
+        height, width = win.getmaxyx()
 
         # Main window
         self.draw_window(
-            0, 0, height - 1, width - 1, "GAMEZILLA MEGA COLLECTION VOL. 4"
+            0, 0, height - 1, width - 1, "GAMEZILLA MEGA COLLECTION VOL. 4", win
         )
 
         # Subtitle
-        self.stdscr.attron(curses.color_pair(3) | curses.A_BOLD)
-        subtitle = "500 Programs - Your Entertainment Solution!"
-        self.stdscr.addstr(2, (width - len(subtitle)) // 2, subtitle)
-        self.stdscr.attroff(curses.color_pair(3) | curses.A_BOLD)
+        if self.programs:
+            count = f"{len(self.programs):,}"
+        else:
+            count = "Loading"
+        subtitle = f"{count} Programs - Your Entertainment Solution!"
+        win.addstr(
+            2,
+            (width - len(subtitle)) // 2,
+            subtitle,
+            self.curses.color_pair(3) | curses.A_BOLD,
+        )
 
         # Info line
-        self.stdscr.attron(curses.color_pair(8))
         info = "Games • Utilities • Demos • Shareware - All In One Package!"
-        self.stdscr.addstr(3, (width - len(info)) // 2, info)
-        self.stdscr.attroff(curses.color_pair(8))
+        win.addstr(3, (width - len(info)) // 2, info, self.curses.color_pair(8))
 
     def draw_program_list(self):
         """Draw the program list with mouse-clickable items"""
-        height, width = self.stdscr.getmaxyx()
-        start_y = 5
-        start_x = 3
-
-        start = self.page * self.items_per_page
-        end = min(start + self.items_per_page, len(self.programs))
-
-        # Page indicator
-        self.stdscr.attron(curses.color_pair(3))
-        page_info = f"Programs {start+1}-{end} of 500 (Page {self.page+1})"
-        self.stdscr.addstr(start_y, start_x, page_info)
-        self.stdscr.attroff(curses.color_pair(3))
+        win = self.list_win
+        width = win.getmaxyx()[1] - 1
+
+        # Only the visible slice of the catalog is ever fetched
+        start = self.top
+        end = min(start + self.items_per_page, len(self.view))
+
+        # Position indicator
+        win.attron(self.curses.color_pair(3))
+        if self.generator is None and (self.filter_text or not self.view):
+            page_info = "Loading catalog..."
+        elif self.filter_text:
+            page_info = (
+                f"Matches {start+1:,}-{end:,} of {len(self.view):,} "
+                f"for '{self.filter_text}'"
+            )
+        else:
+            page_info = f"Programs {start+1:,}-{end:,} of {len(self.view):,}"
+        win.addstr(0, 0, page_info[:width])
+        win.attroff(self.curses.color_pair(3))
 
         # Draw list
         for i, prog_idx in enumerate(range(start, end)):
-            prog = self.programs[prog_idx]
-            y = start_y + 2 + i
+            prog = self.view[prog_idx]
             is_selected = prog_idx == self.selected_idx
 
             # Selection highlight
             if is_selected:
-                self.stdscr.attron(curses.color_pair(4) | curses.A_BOLD)
+                attr = self.curses.color_pair(4) | curses.A_BOLD
                 marker = "►"
+            elif prog["is_real"]:
+                attr = self.curses.color_pair(7)
+                marker = "●"
             else:
-                if prog["is_real"]:
-                    self.stdscr.attron(curses.color_pair(7))
-                    marker = "●"
-                else:
-                    self.stdscr.attron(curses.color_pair(2))
-                    marker = " "
+                attr = self.curses.color_pair(2)
+                marker = " "
 
             # Draw item
-            item_text = f"{marker} {prog['number']:3d}. {prog['name']:<45}"
-            self.stdscr.addstr(y, start_x, item_text[: width - 6])
-
-            if is_selected:
-                self.stdscr.attroff(curses.color_pair(4) | curses.A_BOLD)
-            else:
-                if prog["is_real"]:
-                    self.stdscr.attroff(curses.color_pair(7))
-                else:
-                    self.stdscr.attroff(curses.color_pair(2))
+            item_text = (
+                f"{marker} {prog['number']:{self.number_width}d}. {prog['name']:<45}"
+            )
+            win.addstr(2 + i, 0, item_text[:width], attr)
 
-    def draw_buttons(self):
+    def draw_buttons(self, win):
         """Draw control buttons"""
-        height, width = self.stdscr.getmaxyx()
+        height, width = win.getmaxyx()
         button_y = height - 4
 
         # Button positions
         self.button_areas = {}
-
-        # Launch button
         x = 5
-        area = self.draw_button(button_y, x, 12, "LAUNCH")
-        self.button_areas["launch"] = area
-
-        # Prev Page button
-        x += 14
-        area = self.draw_button(button_y, x, 12, "< PREV")
-        self.button_areas["prev"] = area
-
-        # Next Page button
-        x += 14
-        area = self.draw_button(button_y, x, 12, "NEXT >")
-        self.button_areas["next"] = area
-
-        # Quit button
-        x += 14
-        area = self.draw_button(button_y, x, 12, "QUIT")
-        self.button_areas["quit"] = area
+        for name, label in BUTTONS:
+            self.button_areas[name] = self.draw_button(button_y, x, 12, label, win=win)
+            x += 14
 
     def draw_status_bar(self):
         """Draw status bar"""
-        height, width = self.stdscr.getmaxyx()
+        width = self.status_win.getmaxyx()[1] - 1
 
-        self.stdscr.attron(curses.color_pair(9))
-        status = (
-            " Mouse: Click to select • Keyboard: ↑↓ Navigate, ENTER Launch, Q Quit "
-        )
-        self.stdscr.addstr(height - 2, 0, status.ljust(width - 1))
-        self.stdscr.attroff(curses.color_pair(9))
+        if self.filter_mode:
+            status = f" Filter: {self.filter_text}_  (ENTER Keep, ESC Clear) "
+            self.status_win.addstr(0, 0, status[:width])
+        else:
+            self.status_help.overwrite(self.status_win, 0, 0, 0, 0, 0, width)
+
+    def draw_jobs(self):
+        """Draw the table of launched builds, most recent last"""
+        win = self.jobs_win
+        width = win.getmaxyx()[1] - 1
+
+        header = f"{'PID':>7}  {'STATUS':<9} {'TIME':>8}  BUILD"
+        win.addstr(0, 0, header[:width], self.curses.color_pair(3))
+        for i, entry in enumerate(list(self.jobs)[-self.job_rows :]):
+            if entry.running:
+                attr = self.curses.color_pair(7)
+            elif entry.returncode == 0:
+                attr = self.curses.color_pair(8)
+            else:
+                attr = self.curses.color_pair(10)
+            row = (
+                f"{entry.pid:>7}  {entry.status():<9} {entry.wall_time():>7.1f}s  "
+                f"{entry.label}"
+            )
+            win.addstr(1 + i, 0, row[:width], attr)
+
+    def update_jobs(self):
+        """Poll background builds and refresh the job panel while any run"""
+        if not self.jobs.running():
+            return
+        if self.jobs.poll() and self.warm_pool is not None:
+            # Replace workers used by background builds once one finishes
+            self.warm_pool.refill()
+        if min(len(self.jobs), MAX_JOB_ROWS) != self.job_rows:
+            self.layout()
+        else:
+            self.mark_dirty("jobs")
 
     def draw_program_info(self):
         """Draw info about selected program"""
-        height, width = self.stdscr.getmaxyx()
-        info_y = height - 9
-        info_x = 3
+        win = self.info_win
+        width = win.getmaxyx()[1] - 1
 
-        prog = self.programs[self.selected_idx]
+        win.attron(self.curses.color_pair(8))
+        win.addstr(0, 0, "─" * width)
+        win.addstr(4, 0, "─" * width)
 
-        self.stdscr.attron(curses.color_pair(8))
-        self.stdscr.addstr(info_y, info_x, "─" * (width - 6))
+        if not self.view:
+            if self.generator is None:
+                win.addstr(1, 0, "Loading catalog...")
+            else:
+                win.addstr(1, 0, "No programs match the filter.")
+            win.attroff(self.curses.color_pair(8))
+            return
+
+        prog = self.view[self.selected_idx]
 
-        self.stdscr.addstr(info_y + 1, info_x, f"Selected: {prog['name']}")
-        self.stdscr.addstr(info_y + 2, info_x, f"Type: {prog['genre'].upper()}")
+        win.addstr(1, 0, f"Selected: {prog['name']}"[:width])
+        win.addstr(2, 0, f"Type: {prog['genre'].upper()}"[:width])
+        win.attroff(self.curses.color_pair(8))
 
         if prog["is_real"]:
-            self.stdscr.attron(curses.color_pair(7) | curses.A_BOLD)
-            self.stdscr.addstr(
-                info_y + 3, info_x, "Status: ● INSTALLED - Ready to launch!"
+            win.addstr(
+                3,
+                0,
+                "Status: ● INSTALLED - Ready to launch!"[:width],
+                self.curses.color_pair(7) | curses.A_BOLD,
             )
-            self.stdscr.attroff(curses.color_pair(7) | curses.A_BOLD)
         else:
-            self.stdscr.attron(curses.color_pair(10))
-            self.stdscr.addstr(
-                info_y + 3, info_x, "Status: Not installed (requires Disk 1 of 3)"
+            win.addstr(
+                3,
+                0,
+                "Status: Not installed (requires Disk 1 of 3)"[:width],
+                self.curses.color_pair(10),
             )
-            self.stdscr.attroff(curses.color_pair(10))
-
-        self.stdscr.addstr(info_y + 4, info_x, "─" * (width - 6))
-        self.stdscr.attroff(curses.color_pair(8))
 
     def is_in_area(self, y, x, area):
         """Check if coordinates are in clickable area"""
@@ -238,14 +674,13 @@ class GUI_Launcher:
 
     def handle_mouse(self, mouse_y, mouse_x):
         """Handle mouse clicks"""
-        # Check if clicked on program list
-        start_y = 7
-        start = self.page * self.items_per_page
-        end = min(start + self.items_per_page, len(self.programs))
+        # Check if clicked on program list (items start two rows into it)
+        start_y = self.list_win.getbegyx()[0] + 2
+        end = min(self.top + self.items_per_page, len(self.view))
 
-        for i in range(end - start):
+        for i in range(end - self.top):
             if mouse_y == start_y + i:
-                self.selected_idx = start + i
+                self.select(self.top + i)
                 return
 
         # Check button clicks
@@ -260,45 +695,141 @@ class GUI_Launcher:
                 elif btn_name == "quit":
                     self.running = False
 
+    def scroll_to(self, idx):
+        """Scroll the list just enough to show idx"""
+        if idx < self.top:
+            self.top = idx
+        elif idx >= self.top + self.items_per_page:
+            self.top = idx - self.items_per_page + 1
+
+    def select(self, idx):
+        """Move the selection to idx (clamped), scrolling to keep it visible"""
+        idx = max(0, min(idx, len(self.view) - 1))
+        if idx == self.selected_idx or not self.view:
+            return
+        self.selected_idx = idx
+        self.scroll_to(idx)
+        self.mark_dirty("list", "info")
+
+    def scroll_pages(self, pages):
+        """Scroll by pages (negative: up), moving the selection with the list"""
+        rows = pages * self.items_per_page
+        max_top = max(0, len(self.view) - self.items_per_page)
+        self.top = max(0, min(max_top, self.top + rows))
+        self.select(self.selected_idx + rows)
+        self.mark_dirty("list", "info")
+
     def prev_page(self):
-        """Go to previous page"""
-        if self.page > 0:
-            self.page -= 1
-            self.selected_idx = self.page * self.items_per_page
+        """Scroll up one page"""
+        self.scroll_pages(-1)
 
     def next_page(self):
-        """Go to next page"""
-        next_page = (self.page + 1) * self.items_per_page
-        if next_page < len(self.programs):
-            self.page += 1
-            self.selected_idx = next_page
-
-    def show_loading(self, prog_name):
-        """Show loading screen"""
+        """Scroll down one page"""
+        self.scroll_pages(1)
+
+    def apply_filter(self):
+        """Refresh the listed programs from the current filter text"""
+        if self.filter_text and self.generator is None:
+            # Searched by update_catalog() once the catalog has loaded
+            self.mark_dirty("list", "status")
+            return
+        if self.filter_text:
+            from shareware_gen_v2 import ProgramView
+
+            index = self.search_index
+            if index is not None:
+                positions = index.search(self.filter_text, limit=MAX_FILTER_RESULTS)
+            else:
+                # Not built yet, or a lazy catalog that is never indexed
+                from catalog_search import scan_catalog
+
+                positions = scan_catalog(
+                    self.generator, self.filter_text, limit=MAX_FILTER_RESULTS
+                )
+            self.view = ProgramView(self.programs, positions)
+        else:
+            self.view = self.programs
+        self.selected_idx = 0
+        self.top = 0
+        self.mark_dirty("list", "info", "status")
+
+    def handle_filter_key(self, key):
+        """Handle a keypress while typing a filter"""
+        if key == KEY_ESCAPE:
+            self.filter_mode = False
+            self.filter_text = ""
+        elif key in (ord("\n"), curses.KEY_ENTER, 13):
+            self.filter_mode = False
+            self.mark_dirty("status")
+            return
+        elif key in BACKSPACE_KEYS:
+            self.filter_text = self.filter_text[:-1]
+        elif 32 <= key < 127:
+            self.filter_text += chr(key)
+        else:
+            return
+        self.apply_filter()
+
+    def show_loading(self, prog_name, steps):
+        """Show the loading screen while running a launch's steps
+
+        steps is a generator that yields each step's label before doing
+        its work and returns the launch target. Steps are ticked off as
+        they finish; a LaunchError is shown until a key is pressed.
+        Returns the target, or None if a step failed.
+        """
         self.stdscr.clear()
         height, width = self.stdscr.getmaxyx()
+        text_width = width - 26
 
         self.draw_window(5, 10, 10, width - 20, "LOADING")
 
-        self.stdscr.attron(curses.color_pair(3))
-        self.stdscr.addstr(7, 15, f"Program: {prog_name}")
-        self.stdscr.attroff(curses.color_pair(3))
-
-        self.stdscr.attron(curses.color_pair(7))
-        loading_steps = [
-            "Loading executable...",
-            "Decompressing data files...",
-            "Checking system resources...",
-            "Initializing graphics engine...",
-            "Loading assets...",
-        ]
-        for i, step in enumerate(loading_steps):
-            self.stdscr.addstr(9 + i, 15, f"✓ {step}")
-
-        self.stdscr.attroff(curses.color_pair(7))
+        self.stdscr.attron(self.curses.color_pair(3))
+        self.stdscr.addstr(7, 15, f"Program: {prog_name}"[:text_width])
+        self.stdscr.attroff(self.curses.color_pair(3))
 
-        self.stdscr.refresh()
-        time.sleep(2)
+        y = 8
+        label = None
+        while True:
+            started = time.perf_counter()
+            try:
+                next_label = next(steps)
+            except StopIteration as done:
+                next_label, result = None, done.value
+            except LaunchError as e:
+                self.stdscr.addstr(
+                    y, 15, f"✗ {label}: {e}"[:text_width], self.curses.color_pair(10)
+                )
+                self.stdscr.addstr(
+                    13, 15, "Press any key to return...", self.curses.color_pair(9)
+                )
+                self.stdscr.refresh()
+                self.stdscr.timeout(-1)
+                self.stdscr.getch()
+                self.mark_dirty(*REGIONS)
+                return None
+
+            if label is not None:
+                elapsed = (time.perf_counter() - started) * 1000
+                self.stdscr.addstr(
+                    y,
+                    15,
+                    f"✓ {label} ({elapsed:.1f} ms)"[:text_width],
+                    self.curses.color_pair(7),
+                )
+                if self.theatrical:
+                    self.stdscr.refresh()
+                    time.sleep(THEATRICAL_STEP_DELAY)
+            if next_label is None:
+                self.stdscr.refresh()
+                return result
+
+            label = next_label
+            y += 1
+            self.stdscr.addstr(
+                y, 15, f"  {label}..."[:text_width], self.curses.color_pair(2)
+            )
+            self.stdscr.refresh()
 
     def show_error(self, prog):
         """Show error for uninstalled program"""
@@ -307,55 +838,60 @@ class GUI_Launcher:
 
         self.draw_window(5, 10, 12, width - 20, "ERROR - Program Not Found")
 
-        self.stdscr.attron(curses.color_pair(11) | curses.A_BOLD)
+        self.stdscr.attron(self.curses.color_pair(11) | curses.A_BOLD)
         self.stdscr.addstr(7, 15, "FILE NOT FOUND")
-        self.stdscr.attroff(curses.color_pair(11) | curses.A_BOLD)
+        self.stdscr.attroff(self.curses.color_pair(11) | curses.A_BOLD)
 
-        self.stdscr.attron(curses.color_pair(2))
+        self.stdscr.attron(self.curses.color_pair(2))
         self.stdscr.addstr(9, 15, f"File: {prog['executable']}")
         self.stdscr.addstr(11, 15, "This program is listed in the catalog but")
         self.stdscr.addstr(12, 15, "is not installed.")
         self.stdscr.addstr(14, 15, "Installation Disk 1 of 3 required.")
-        self.stdscr.attroff(curses.color_pair(2))
+        self.stdscr.attroff(self.curses.color_pair(2))
 
-        self.stdscr.attron(curses.color_pair(9))
+        self.stdscr.attron(self.curses.color_pair(9))
         self.stdscr.addstr(16, 15, "Press any key to return...")
-        self.stdscr.attroff(curses.color_pair(9))
+        self.stdscr.attroff(self.curses.color_pair(9))
 
         self.stdscr.refresh()
+        self.stdscr.timeout(-1)
         self.stdscr.getch()
+        self.mark_dirty(*REGIONS)
 
-    def launch_program(self):
-        """Launch selected program"""
-        prog = self.programs[self.selected_idx]
+    def launch_program(self, background=None):
+        """Launch selected program, in the background if requested"""
+        if not self.view:
+            return
+        prog = self.view[self.selected_idx]
+        if prog.get("loading"):
+            # Not in the first page snapshot and the catalog is still loading
+            return
 
         if not prog["is_real"]:
             self.show_error(prog)
             return
 
-        self.show_loading(prog["name"])
+        if background is None:
+            background = self.background
+        steps = self._prepare_launch(prog.get("executable", ""))
+        target = self.show_loading(prog["name"], steps)
+        if target is None:
+            return
+
+        # Documentation builds print to the terminal
+        if background and not target.is_docs:
+            try:
+                self._start_build(target, background=True)
+            except OSError as e:
+                self.show_loading(prog["name"], self._failed_launch(e))
+            self.layout()
+            return
 
         # Reset terminal
-        curses.endwin()
+        self.curses.endwin()
 
         try:
-            executable = prog.get("executable", "")
-
-            if executable == "v1":
-                self._launch_version("v1-doofenstein", "src/main.py")
-            elif executable == "v2":
-                self._launch_version("v2-immersive-sim", "src/main.py")
-            elif executable == "v3":
-                self._launch_version("v3-eastland", "src/main_pygame.py")
-            elif executable == "v4":
-                self._launch_version("v4-renderist", "src/main.py")
-            elif executable == "v5":
-                self._launch_version("v5-eastland", "src/main.py", is_docs=True)
-            elif executable == "v6":
-                self._launch_version("v6-nextgen", "src/main.py")
-            else:
-                print(f"\n[ERROR] Unknown version: {executable}")
-                input("Press ENTER...")
+            self._launch_version(target)
 
         except Exception as e:
             print(f"\n[ERROR] {e}")
@@ -365,110 +901,339 @@ class GUI_Launcher:
             input("Press ENTER...")
 
         # Restart curses
-        self.stdscr = curses.initscr()
+        self.stdscr = self.curses.initscr()
         self.init_colors()
-        curses.mousemask(curses.ALL_MOUSE_EVENTS | curses.REPORT_MOUSE_POSITION)
-        curses.curs_set(0)
-
-    def _launch_version(self, version_dir, main_file, is_docs=False):
-        """Helper to launch a specific version"""
-        paths_to_try = [
-            os.path.join("archive", version_dir, main_file),
-            os.path.join("..", "archive", version_dir, main_file),
-            os.path.join(version_dir, main_file),  # Fallback
-        ]
+        self.curses.mousemask(curses.ALL_MOUSE_EVENTS | curses.REPORT_MOUSE_POSITION)
+        self.curses.curs_set(0)
+        self.stdscr.clear()
+        self.layout()
+
+    def _prepare_launch(self, executable):
+        """Launch steps for show_loading(); returns the LaunchTarget"""
+        yield "Resolving version path"
+        target = self.get_launch_table().get(executable)
+        if target is None:
+            raise LaunchError(f"{executable} is not listed in {MANIFEST_NAME}")
+
+        yield "Checking build files"
+        if not os.path.isfile(target.entry_path):
+            raise LaunchError(f"{target.version_id}/{target.entry} not found")
+
+        if self.recorded_root(target) is not None:
+            yield "Verifying build integrity"
+            self.verify_target(target)
+        return target
+
+    def recorded_root(self, target):
+        """Root hash recorded for a protected build, or None if it has none"""
+        record = self.get_integrity_record() if target.protected else None
+        if record is None or target.version_id not in record["versions"]:
+            return None
+        return record["versions"][target.version_id]["root"]
+
+    def verify_target(self, target):
+        """Check a build against its integrity record; returns recorded_root()
+
+        Raises LaunchError if the files on disk do not match the record.
+        """
+        from integrity import HashCache, cache_path, verify_record
+
+        with self.launch_lock:
+            if self.recorded_root(target) is None:
+                return None
+            # Only files whose stat metadata changed since the last check are
+            # read again
+            cache = HashCache.load(cache_path(MANIFEST_PATH))
+            (report,) = verify_record(
+                self.get_integrity_record(),
+                os.path.dirname(MANIFEST_PATH),
+                [target.version_id],
+                cache=cache,
+            )
+            with contextlib.suppress(OSError):
+                cache.save(cache_path(MANIFEST_PATH))
+        if not report.ok:
+            raise LaunchError(f"protected build modified: {report.summary()}")
+        return report.expected_root
+
+    def _failed_launch(self, error):
+        """Loading-screen steps reporting a build that failed to start"""
+        yield "Starting build"
+        raise LaunchError(error)
+
+    def get_launch_table(self):
+        """Return the launch table, rebuilt only when shareware.yml changes"""
+        with self.launch_lock:
+            try:
+                # Cached by the loader: a stat() unless the file was edited
+                manifest = load_manifest(MANIFEST_PATH)
+                if manifest is not self.launch_manifest:
+                    self.launch_table = build_launch_table(manifest, manifest.base_dir)
+                    self.launch_manifest = manifest
+            except (ManifestError, LaunchTableError) as e:
+                raise LaunchError(str(e))
+            return self.launch_table
+
+    def get_integrity_record(self):
+        """Hash trees of the protected builds, or None if none were recorded"""
+        from integrity import IntegrityError, load_record, record_path
+
+        with self.launch_lock:
+            path = record_path(MANIFEST_PATH)
+            try:
+                st = os.stat(path)
+            except FileNotFoundError:
+                self.integrity_record = self.integrity_stat = None
+                return None
+            except OSError as e:
+                raise LaunchError(f"cannot read {path}: {e.strerror}")
+            stat_key = (st.st_size, st.st_mtime_ns, st.st_ino)
+            if self.integrity_record is None or stat_key != self.integrity_stat:
+                try:
+                    self.integrity_record = load_record(path)
+                except IntegrityError as e:
+                    # A damaged record must not switch the check off
+                    self.integrity_record = self.integrity_stat = None
+                    raise LaunchError(str(e))
+                self.integrity_stat = stat_key
+            return self.integrity_record
+
+    def _launch_version(self, target):
+        """Run a resolved version in the foreground"""
+        if target.is_docs:
+            # Documentation builds are shown, not run
+            print("\n" + "=" * 70)
+            print(f"{target.version_id.upper()} - {target.role.upper()} (ARCHIVED)")
+            print("=" * 70)
+            with open(target.entry_path, "r", encoding="utf-8", errors="replace") as f:
+                print(f.read())
+            print("\nPress ENTER to continue...")
+            input()
+        else:
+            self._start_build(target)
 
-        for path in paths_to_try:
-            if os.path.exists(path):
-                if is_docs:
-                    # V5 is documentation, just show info
-                    print("\n" + "=" * 70)
-                    print("EASTLAND MALL V5 - CRD RECONSTRUCTION (ARCHIVED)")
-                    print("=" * 70)
-                    print("\nV5 is a documentation/reconstruction project.")
-                    print("V5 has been archived. Check archive/v5-eastland/ for:")
-                    print("  - PHOTO_CLASSIFICATION_TABLE_V1_COMPLETE.md")
-                    print("  - MALL_MAP_V5_PROPOSAL.json")
-                    print("  - README_ARCHITECTURAL_CONTEXT.md")
-                    print("\nV5 measurements are now canonical foundation for V6.")
-                    print("\nPress ENTER to continue...")
-                    input()
-                else:
-                    dir_path = os.path.dirname(path)
-                    script = os.path.basename(path)
-                    os.system(f"cd {dir_path} && python3 {script}")
+    def _start_build(self, target, background=False):
+        """Run a build, handing it to a warm interpreter when one is waiting
+
+        Only after _prepare_launch() has verified target: a worker is used
+        only if it was warmed (and verified) against the same recorded root.
+        """
+        worker = None
+        if self.warm_pool is not None:
+            try:
+                key = self.recorded_root(target)
+            except LaunchError:
+                key = False  # Record unreadable: matches no worker
+            worker = self.warm_pool.take(target, key)
+        if worker is None:
+            # argv list, no shell: the entry runs from its own directory
+            if background:
+                self.jobs.start(target.version_id, target.argv(), cwd=target.cwd)
+            else:
+                self.jobs.run(target.version_id, target.argv(), cwd=target.cwd)
+        elif background:
+            log_path = self.jobs.log_path(target.version_id) or os.devnull
+            self.jobs.adopt(
+                target.version_id,
+                target.argv(),
+                worker.start(log_path),
+                target.cwd,
+                log_path,
+            )
+        else:
+            entry = self.jobs.adopt(
+                target.version_id, target.argv(), worker.start(), target.cwd
+            )
+            self.jobs.wait(entry)
+
+        # Replace the used worker once a foreground build has finished
+        if self.warm_pool is not None and not background:
+            self.warm_pool.refill()
+
+    def read_keys(self, timeout):
+        """Wait up to timeout ms (-1: forever) for input; return every pending key"""
+        self.stdscr.timeout(timeout)
+        keys = []
+        key = self.stdscr.getch()
+        self.stdscr.timeout(0)
+        while key != -1:
+            keys.append(key)
+            key = self.stdscr.getch()
+        return keys
+
+    def handle_keys(self, keys):
+        """Handle a batch of keys, merging runs of navigation keys into one move"""
+        move, amount = None, 0
+        for key in keys:
+            nav = None if self.filter_mode else NAV_KEYS.get(key)
+            if nav is not None and nav[0] == move:
+                amount += nav[1]
+                continue
+            if move is not None:
+                self.move(move, amount)
+            if nav is not None:
+                move, amount = nav
+                continue
+            move, amount = None, 0
+            self.handle_key(key)
+            if not self.running:
                 return
+        if move is not None:
+            self.move(move, amount)
 
-        print(f"\n[ERROR] {version_dir} not found!")
-        print(f"Make sure {version_dir}/{main_file} exists.")
-        input("Press ENTER...")
+    def move(self, unit, amount):
+        """Move the selection by amount lines or pages"""
+        if unit == "line":
+            self.select(self.selected_idx + amount)
+        else:
+            self.scroll_pages(amount)
+
+    def handle_key(self, key):
+        """Handle a single non-navigation key"""
+        if key == curses.KEY_RESIZE:
+            self.layout()
+        elif self.filter_mode:
+            self.handle_filter_key(key)
+        elif key == ord("/"):
+            self.filter_mode = True
+            self.mark_dirty("status")
+        elif key == ord("q") or key == ord("Q"):
+            self.running = False
+        elif key == curses.KEY_HOME:
+            self.select(0)
+        elif key == curses.KEY_END:
+            self.select(len(self.view) - 1)
+        elif key == ord("\n") or key == curses.KEY_ENTER or key == 10 or key == 13:
+            self.launch_program()
+        elif key == ord("b") or key == ord("B"):
+            self.launch_program(background=True)
+        elif key == curses.KEY_MOUSE:
+            try:
+                _, mouse_x, mouse_y, _, mouse_state = self.curses.getmouse()
+                if mouse_state & curses.BUTTON1_CLICKED:
+                    self.handle_mouse(mouse_y, mouse_x)
+                elif mouse_state & curses.BUTTON4_PRESSED:
+                    self.select(self.selected_idx - WHEEL_LINES)
+                elif mouse_state & BUTTON5_PRESSED:
+                    self.select(self.selected_idx + WHEEL_LINES)
+            except curses.error:
+                pass
 
     def run(self):
-        """Main loop"""
+        """Main loop: drain all pending input, draw at most MAX_FPS frames/s"""
+        # Draw the first frame before loading anything else
+        self.render()
+        last_frame = time.monotonic()
+        self.profile.record("first frame", self.profile.started)
+        if self.loader.ident is None:
+            self.loader.start()
+
         while self.running:
-            self.stdscr.clear()
-            self.draw_header()
-            self.draw_program_list()
-            self.draw_program_info()
-            self.draw_buttons()
-            self.draw_status_bar()
-            self.stdscr.refresh()
+            if self.generator is None:
+                # Show the catalog as soon as the loader has it
+                timeout = LOAD_POLL_MS
+            else:
+                # Wake up periodically to tick the job panel's wall times
+                timeout = JOB_POLL_MS if self.jobs.running() else -1
+            if self.dirty:
+                wait = last_frame + 1 / MAX_FPS - time.monotonic()
+                if wait > 0:
+                    # Too soon for another frame; keep collecting input
+                    wait_ms = int(wait * 1000) + 1
+                    timeout = wait_ms if timeout < 0 else min(timeout, wait_ms)
+                else:
+                    self.render()
+                    last_frame = time.monotonic()
+                    if self.profile_startup and self.generator is not None:
+                        self.profile.record("full catalog frame", self.profile.started)
+                        break
 
             try:
-                key = self.stdscr.getch()
-
-                if key == ord("q") or key == ord("Q"):
-                    self.running = False
-                elif key == curses.KEY_UP:
-                    if self.selected_idx > 0:
-                        self.selected_idx -= 1
-                        # Update page if needed
-                        if self.selected_idx < self.page * self.items_per_page:
-                            self.page = self.selected_idx // self.items_per_page
-                elif key == curses.KEY_DOWN:
-                    if self.selected_idx < len(self.programs) - 1:
-                        self.selected_idx += 1
-                        # Update page if needed
-                        if self.selected_idx >= (self.page + 1) * self.items_per_page:
-                            self.page = self.selected_idx // self.items_per_page
-                elif (
-                    key == ord("\n")
-                    or key == curses.KEY_ENTER
-                    or key == 10
-                    or key == 13
-                ):
-                    self.launch_program()
-                elif key == ord("n") or key == ord("N"):
-                    self.next_page()
-                elif key == ord("p") or key == ord("P"):
-                    self.prev_page()
-                elif key == curses.KEY_MOUSE:
-                    try:
-                        _, mouse_x, mouse_y, _, mouse_state = curses.getmouse()
-                        if mouse_state & curses.BUTTON1_CLICKED:
-                            self.handle_mouse(mouse_y, mouse_x)
-                    except curses.error:
-                        pass
-
+                keys = self.read_keys(timeout)
+                if keys and self.full_redraw:
+                    self.mark_dirty(*REGIONS)
+                self.handle_keys(keys)
+                self.update_jobs()
+                self.update_catalog()
             except KeyboardInterrupt:
                 self.running = False
 
+        self.stdscr.timeout(-1)
+        if self.profile_startup:
+            # Let the loader start the warm pool (but not finish the index)
+            self.warm_done.wait()
+        if self.warm_pool is not None:
+            self.warm_pool.close()
 
-def main(stdscr):
-    """Entry point for curses"""
-    launcher = GUI_Launcher(stdscr)
-    launcher.run()
 
-    stdscr.clear()
-    stdscr.addstr(0, 0, "Thank you for using GAMEZILLA MEGA COLLECTION!\n")
-    stdscr.addstr(1, 0, "Press any key to exit...")
-    stdscr.refresh()
-    stdscr.getch()
+def main(stdscr, frame_stats=False, **options):
+    """Entry point for curses; options are GUI_Launcher keyword arguments
+
+    Returns the reports requested with --profile-startup and --frame-stats.
+    """
+    launcher = GUI_Launcher(stdscr, **options)
+    launcher.run()
+    reports = []
+    if launcher.profile_startup:
+        reports.append(launcher.profile.report())
+    else:
+        stdscr.clear()
+        stdscr.addstr(0, 0, "Thank you for using GAMEZILLA MEGA COLLECTION!\n")
+        stdscr.addstr(1, 0, "Press any key to exit...")
+        stdscr.refresh()
+        stdscr.getch()
+    if frame_stats:
+        reports.append(launcher.frame_stats.report())
+    return "\n\n".join(reports)
 
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="GAMEZILLA MEGA COLLECTION launcher")
+    parser.add_argument(
+        "--full-redraw",
+        action="store_true",
+        help="clear and repaint the whole screen on every key (for comparison)",
+    )
+    parser.add_argument(
+        "--size",
+        type=int,
+        help="number of programs in the catalog (default: 500)",
+    )
+    parser.add_argument(
+        "--lazy",
+        action="store_true",
+        help="generate programs on demand (for catalogs of millions)",
+    )
+    parser.add_argument(
+        "--background",
+        action="store_true",
+        help="launch builds in the background so the launcher stays usable",
+    )
+    parser.add_argument(
+        "--theatrical",
+        action="store_true",
+        help="keep the retro pauses between loading steps",
+    )
+    parser.add_argument(
+        "--warm",
+        action="store_true",
+        help="keep a pre-imported interpreter ready for each Python build",
+    )
+    parser.add_argument(
+        "--profile-startup",
+        action="store_true",
+        help="quit once the catalog is shown and print a startup timing breakdown",
+    )
+    parser.add_argument(
+        "--frame-stats",
+        action="store_true",
+        help="print render times per frame and per screen region on exit",
+    )
+    args = parser.parse_args()
     try:
-        curses.wrapper(main)
+        report = curses.wrapper(main, **vars(args))
+        if report:
+            print(report)
     except KeyboardInterrupt:
         print("\n")
         sys.exit(0)
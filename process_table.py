@@ -0,0 +1,142 @@
+"""
+GAMEZILLA MEGA COLLECTION - Process Table
+Runs archived builds through subprocess (argv lists, never a shell) and
+keeps their PIDs, exit codes and wall times for the launcher's job panel
+"""
+
+import os
+import subprocess
+import time
+
+# Finished processes kept in the table next to the running ones
+MAX_FINISHED = 5
+
+
+class LaunchedProcess:
+    """One launched build: its Popen handle plus wall-clock timing"""
+
+    __slots__ = ("label", "argv", "cwd", "log_path", "process", "started", "ended")
+
+    def __init__(self, label, argv, cwd, process, log_path=None):
+        self.label = label
+        self.argv = argv
+        self.cwd = cwd
+        self.log_path = log_path
+        self.process = process
+        self.started = time.monotonic()
+        self.ended = None
+
+    @property
+    def pid(self):
+        return self.process.pid
+
+    @property
+    def returncode(self):
+        return self.process.returncode
+
+    @property
+    def running(self):
+        return self.ended is None
+
+    def wall_time(self):
+        """Seconds since launch, or the total run time once finished"""
+        return (self.ended or time.monotonic()) - self.started
+
+    def poll(self):
+        """Check the process; return True if it has exited since the last check"""
+        if self.ended is None and self.process.poll() is not None:
+            self.ended = time.monotonic()
+            return True
+        return False
+
+    def status(self):
+        """Short status text: "running" or "exit <code>" """
+        if self.running:
+            return "running"
+        return f"exit {self.returncode}"
+
+
+class ProcessTable:
+    """Launched builds, oldest first, with finished entries pruned"""
+
+    def __init__(self, log_dir=None, max_finished=MAX_FINISHED):
+        self.log_dir = log_dir
+        self.max_finished = max_finished
+        self.entries = []
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __iter__(self):
+        return iter(self.entries)
+
+    def _add(self, entry):
+        self.entries.append(entry)
+        self._prune()
+        return entry
+
+    def _prune(self):
+        finished = [e for e in self.entries if not e.running]
+        for entry in finished[: max(0, len(finished) - self.max_finished)]:
+            self.entries.remove(entry)
+
+    def adopt(self, label, argv, process, cwd=None, log_path=None):
+        """Track a process started elsewhere (e.g. by a warm worker)"""
+        return self._add(LaunchedProcess(label, argv, cwd, process, log_path))
+
+    def wait(self, entry):
+        """Wait for a foreground entry's process to exit"""
+        while True:
+            try:
+                entry.process.wait()
+                break
+            except KeyboardInterrupt:
+                # Ctrl-C reached the build too; wait for it to wind down
+                continue
+        entry.poll()
+        self._prune()
+        return entry
+
+    def run(self, label, argv, cwd=None):
+        """Run argv in the foreground on the current terminal and wait for it"""
+        process = subprocess.Popen(argv, cwd=cwd)
+        return self.wait(self.adopt(label, argv, process, cwd))
+
+    def log_path(self, label):
+        """New log file path for a background launch (None without log_dir)"""
+        if self.log_dir is None:
+            return None
+        os.makedirs(self.log_dir, exist_ok=True)
+        stamp = time.strftime("%Y%m%d-%H%M%S")
+        return os.path.join(self.log_dir, f"{label}-{stamp}.log")
+
+    def start(self, label, argv, cwd=None):
+        """Start argv in the background, detached from the terminal
+
+        Output goes to a log file under log_dir (or is discarded), so the
+        build cannot draw over the launcher.
+        """
+        log_path = self.log_path(label)
+        with open(log_path or os.devnull, "ab") as output:
+            process = subprocess.Popen(
+                argv,
+                cwd=cwd,
+                stdin=subprocess.DEVNULL,
+                stdout=output,
+                stderr=subprocess.STDOUT,
+                start_new_session=True,
+            )
+        return self.adopt(label, argv, process, cwd, log_path)
+
+    def poll(self):
+        """Check every running process; return True if any has exited"""
+        changed = False
+        for entry in self.entries:
+            changed |= entry.poll()
+        if changed:
+            self._prune()
+        return changed
+
+    def running(self):
+        """Entries whose process is still running"""
+        return [e for e in self.entries if e.running]
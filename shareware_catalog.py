@@ -0,0 +1,446 @@
+"""
+GAMEZILLA MEGA COLLECTION - Compact Program Catalog
+Columnar, array-backed storage for very large program lists
+Rows are exposed through lightweight read-only mapping proxies
+"""
+
+import contextlib
+import functools
+import mmap
+import os
+import struct
+from array import array
+from collections.abc import Mapping, Sequence
+
+FIELDS = ("number", "name", "genre", "version", "executable", "is_real", "description")
+
+# Executable id marking the generated "prog_<number>.exe" name
+DERIVED_EXECUTABLE = -1
+
+# Binary catalog file: header, fixed-width records, then the string tables
+# (genres, versions, names/descriptions/executables)
+CATALOG_MAGIC = b"GZCATLG\0"
+CATALOG_FORMAT_VERSION = 1
+HEADER = struct.Struct("<8sHH32sQQQ")
+RECORD = struct.Struct("<iIHHiIB3x")
+HEADER_FLAG_DENSE = 1
+RECORD_FLAG_REAL = 1
+
+# Decoded strings kept per string table of a mapped catalog
+STRING_CACHE_SIZE = 4096
+
+
+class StaleCatalogError(ValueError):
+    """A catalog file is missing, corrupt or was built for other parameters"""
+
+
+class StringTable:
+    """Interns strings to dense integer ids"""
+
+    __slots__ = ("strings", "_ids")
+
+    def __init__(self, strings=()):
+        self.strings = []
+        self._ids = {}
+        for s in strings:
+            self.intern(s)
+
+    def intern(self, s):
+        """Return the id for s, adding it to the table if needed"""
+        sid = self._ids.get(s)
+        if sid is None:
+            sid = self._ids[s] = len(self.strings)
+            self.strings.append(s)
+        return sid
+
+    def __getitem__(self, sid):
+        return self.strings[sid]
+
+    def __len__(self):
+        return len(self.strings)
+
+
+class ProgramRow(Mapping):
+    """Read-only dict-like proxy for one catalog row"""
+
+    __slots__ = ("_catalog", "_row")
+
+    def __init__(self, catalog, row):
+        self._catalog = catalog
+        self._row = row
+
+    def __getitem__(self, key):
+        return self._catalog.field(self._row, key)
+
+    def __iter__(self):
+        return iter(FIELDS)
+
+    def __len__(self):
+        return len(FIELDS)
+
+    def __repr__(self):
+        return f"ProgramRow({dict(self)!r})"
+
+
+class ProgramCatalog(Sequence):
+    """Columnar program catalog behind the list-of-dicts program API
+
+    Genres and versions are interned into small tables, names and
+    descriptions share one string table, installed flags are bit-packed
+    and generated executable names are derived from the program number.
+    """
+
+    def __init__(self, programs=()):
+        self.numbers = array("i")
+        self.name_ids = array("I")
+        self.genre_ids = array("H")
+        self.version_ids = array("H")
+        self.executable_ids = array("i")
+        self.description_ids = array("I")
+        self.real_bits = bytearray()
+        self.genres = StringTable()
+        self.versions = StringTable()
+        self.strings = StringTable()
+        self.extend(programs)
+
+    def _encode(self, prog):
+        number = prog["number"]
+        executable = prog["executable"]
+        if executable == f"prog_{number}.exe":
+            executable_id = DERIVED_EXECUTABLE
+        else:
+            executable_id = self.strings.intern(executable)
+        return (
+            number,
+            self.strings.intern(prog["name"]),
+            self.genres.intern(prog["genre"]),
+            self.versions.intern(prog["version"]),
+            executable_id,
+            self.strings.intern(prog["description"]),
+        )
+
+    def _set_real(self, row, is_real):
+        byte, bit = divmod(row, 8)
+        if is_real:
+            self.real_bits[byte] |= 1 << bit
+        else:
+            self.real_bits[byte] &= ~(1 << bit)
+
+    def append(self, prog):
+        """Append a program dict (or row) to the catalog"""
+        number, name_id, genre_id, version_id, exe_id, desc_id = self._encode(prog)
+        row = len(self.numbers)
+        self.numbers.append(number)
+        self.name_ids.append(name_id)
+        self.genre_ids.append(genre_id)
+        self.version_ids.append(version_id)
+        self.executable_ids.append(exe_id)
+        self.description_ids.append(desc_id)
+        if row % 8 == 0:
+            self.real_bits.append(0)
+        self._set_real(row, prog["is_real"])
+
+    def extend(self, programs):
+        """Append programs; other catalogs are merged column by column"""
+        if not isinstance(programs, ProgramCatalog):
+            for prog in programs:
+                self.append(prog)
+            return
+
+        start = len(self.numbers)
+        # Translate the other catalog's string ids into this catalog's tables
+        strings = [self.strings.intern(s) for s in programs.strings.strings]
+        genres = [self.genres.intern(s) for s in programs.genres.strings]
+        versions = [self.versions.intern(s) for s in programs.versions.strings]
+
+        self.numbers.extend(programs.numbers)
+        self.name_ids.extend(map(strings.__getitem__, programs.name_ids))
+        self.genre_ids.extend(map(genres.__getitem__, programs.genre_ids))
+        self.version_ids.extend(map(versions.__getitem__, programs.version_ids))
+        self.executable_ids.extend(
+            exe_id if exe_id == DERIVED_EXECUTABLE else strings[exe_id]
+            for exe_id in programs.executable_ids
+        )
+        self.description_ids.extend(map(strings.__getitem__, programs.description_ids))
+        self.real_bits.extend(bytes(-(-len(self.numbers) // 8) - len(self.real_bits)))
+        for row in range(len(programs)):
+            if programs.is_real(row):
+                self._set_real(start + row, True)
+
+    def __setitem__(self, row, prog):
+        if not 0 <= row < len(self.numbers):
+            raise IndexError("catalog row out of range")
+        number, name_id, genre_id, version_id, exe_id, desc_id = self._encode(prog)
+        self.numbers[row] = number
+        self.name_ids[row] = name_id
+        self.genre_ids[row] = genre_id
+        self.version_ids[row] = version_id
+        self.executable_ids[row] = exe_id
+        self.description_ids[row] = desc_id
+        self._set_real(row, prog["is_real"])
+
+    def __len__(self):
+        return len(self.numbers)
+
+    def __getitem__(self, row):
+        if isinstance(row, slice):
+            return [ProgramRow(self, i) for i in range(*row.indices(len(self)))]
+        if row < 0:
+            row += len(self.numbers)
+        if not 0 <= row < len(self.numbers):
+            raise IndexError("catalog row out of range")
+        return ProgramRow(self, row)
+
+    def is_real(self, row):
+        return bool(self.real_bits[row >> 3] & (1 << (row & 7)))
+
+    def field(self, row, key):
+        """Decode a single field of a row"""
+        if key == "number":
+            return self.numbers[row]
+        if key == "name":
+            return self.strings[self.name_ids[row]]
+        if key == "genre":
+            return self.genres[self.genre_ids[row]]
+        if key == "version":
+            return self.versions[self.version_ids[row]]
+        if key == "executable":
+            exe_id = self.executable_ids[row]
+            if exe_id == DERIVED_EXECUTABLE:
+                return f"prog_{self.numbers[row]}.exe"
+            return self.strings[exe_id]
+        if key == "is_real":
+            return self.is_real(row)
+        if key == "description":
+            return self.strings[self.description_ids[row]]
+        raise KeyError(key)
+
+    def nbytes(self):
+        """Approximate bytes held by the column buffers"""
+        columns = (
+            self.numbers,
+            self.name_ids,
+            self.genre_ids,
+            self.version_ids,
+            self.executable_ids,
+            self.description_ids,
+        )
+        total = sum(col.itemsize * len(col) for col in columns)
+        return total + len(self.real_bits)
+
+
+def _write_string_table(f, table):
+    blobs = [s.encode("utf-8") for s in table.strings]
+    offsets = [0]
+    for blob in blobs:
+        offsets.append(offsets[-1] + len(blob))
+    f.write(struct.pack(f"<I{len(offsets)}I", len(blobs), *offsets))
+    f.write(b"".join(blobs))
+
+
+def save_catalog(path, programs, fingerprint):
+    """Write programs to a binary catalog file, replacing path atomically
+
+    Args:
+        path: Destination file
+        programs: Iterable of program mappings, in catalog order
+        fingerprint: 32-byte digest of the parameters the catalog was built
+            from; load_catalog rejects files whose fingerprint differs
+    """
+    genres = StringTable()
+    versions = StringTable()
+    strings = StringTable()
+    rows = 0
+    dense = True
+
+    tmp_path = f"{path}.tmp{os.getpid()}"
+    try:
+        with open(tmp_path, "wb") as f:
+            f.write(bytes(HEADER.size))
+            batch = []
+            for prog in programs:
+                number = prog["number"]
+                executable = prog["executable"]
+                if executable == f"prog_{number}.exe":
+                    exe_id = DERIVED_EXECUTABLE
+                else:
+                    exe_id = strings.intern(executable)
+                batch.append(
+                    RECORD.pack(
+                        number,
+                        strings.intern(prog["name"]),
+                        genres.intern(prog["genre"]),
+                        versions.intern(prog["version"]),
+                        exe_id,
+                        strings.intern(prog["description"]),
+                        RECORD_FLAG_REAL if prog["is_real"] else 0,
+                    )
+                )
+                rows += 1
+                dense = dense and number == rows
+                if len(batch) >= 4096:
+                    f.write(b"".join(batch))
+                    batch.clear()
+            f.write(b"".join(batch))
+
+            strings_offset = f.tell()
+            for table in (genres, versions, strings):
+                _write_string_table(f, table)
+
+            f.seek(0)
+            f.write(
+                HEADER.pack(
+                    CATALOG_MAGIC,
+                    CATALOG_FORMAT_VERSION,
+                    HEADER_FLAG_DENSE if dense else 0,
+                    fingerprint,
+                    rows,
+                    HEADER.size,
+                    strings_offset,
+                )
+            )
+        os.replace(tmp_path, path)
+    except BaseException:
+        # Interrupted or failed: leave no partial file behind
+        with contextlib.suppress(OSError):
+            os.remove(tmp_path)
+        raise
+
+
+class _MappedStringTable:
+    """String table read out of a mapped catalog file, decoded on access"""
+
+    __slots__ = ("_buf", "_offsets", "_blob_start", "_cached")
+
+    def __init__(self, buf, pos):
+        (count,) = struct.unpack_from("<I", buf, pos)
+        self._buf = buf
+        self._offsets = struct.unpack_from(f"<{count + 1}I", buf, pos + 4)
+        self._blob_start = pos + 4 + 4 * (count + 1)
+        # Recently decoded strings; bounded, as a scan of a big catalog would
+        # otherwise end up holding every string in the file
+        self._cached = functools.lru_cache(maxsize=STRING_CACHE_SIZE)(self._decode)
+
+    def end(self):
+        return self._blob_start + self._offsets[-1]
+
+    def _decode(self, sid):
+        start = self._blob_start + self._offsets[sid]
+        end = self._blob_start + self._offsets[sid + 1]
+        return str(self._buf[start:end], "utf-8")
+
+    def __getitem__(self, sid):
+        return self._cached(sid)
+
+    def __len__(self):
+        return len(self._offsets) - 1
+
+
+class MappedProgramCatalog(Sequence):
+    """Read-only program catalog backed by a memory-mapped catalog file
+
+    Opening only parses the header and string table offsets; records are
+    unpacked when a row is read, so load time does not depend on size.
+    """
+
+    def __init__(self, path, fingerprint=None):
+        self._file = open(path, "rb")
+        try:
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # Empty files cannot be mapped
+            self._file.close()
+            raise StaleCatalogError(f"{path}: empty catalog file")
+        try:
+            self._open(path, fingerprint)
+        except (StaleCatalogError, struct.error, IndexError) as e:
+            self.close()
+            if isinstance(e, StaleCatalogError):
+                raise
+            raise StaleCatalogError(f"{path}: corrupt catalog file ({e})")
+
+    def _open(self, path, fingerprint):
+        buf = self._mmap
+        if len(buf) < HEADER.size:
+            raise StaleCatalogError(f"{path}: truncated catalog header")
+        magic, version, flags, file_fingerprint, rows, records, strings = (
+            HEADER.unpack_from(buf, 0)
+        )
+        if magic != CATALOG_MAGIC or version != CATALOG_FORMAT_VERSION:
+            raise StaleCatalogError(f"{path}: unsupported catalog format")
+        if fingerprint is not None and file_fingerprint != fingerprint:
+            raise StaleCatalogError(f"{path}: catalog fingerprint mismatch")
+        if records + rows * RECORD.size != strings:
+            raise StaleCatalogError(f"{path}: record section size mismatch")
+
+        self.fingerprint = file_fingerprint
+        self.dense = bool(flags & HEADER_FLAG_DENSE)
+        self._rows = rows
+        self._records = records
+        self.genres = _MappedStringTable(buf, strings)
+        self.versions = _MappedStringTable(buf, self.genres.end())
+        self.strings = _MappedStringTable(buf, self.versions.end())
+        if self.strings.end() != len(buf):
+            raise StaleCatalogError(f"{path}: string table size mismatch")
+
+    def close(self):
+        self._mmap.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __len__(self):
+        return self._rows
+
+    def __getitem__(self, row):
+        if isinstance(row, slice):
+            return [ProgramRow(self, i) for i in range(*row.indices(len(self)))]
+        if row < 0:
+            row += self._rows
+        if not 0 <= row < self._rows:
+            raise IndexError("catalog row out of range")
+        return ProgramRow(self, row)
+
+    def _record(self, row):
+        return RECORD.unpack_from(self._mmap, self._records + row * RECORD.size)
+
+    def is_real(self, row):
+        return bool(self._record(row)[6] & RECORD_FLAG_REAL)
+
+    def field(self, row, key):
+        """Decode a single field of a row"""
+        number, name_id, genre_id, version_id, exe_id, desc_id, flags = self._record(
+            row
+        )
+        if key == "number":
+            return number
+        if key == "name":
+            return self.strings[name_id]
+        if key == "genre":
+            return self.genres[genre_id]
+        if key == "version":
+            return self.versions[version_id]
+        if key == "executable":
+            if exe_id == DERIVED_EXECUTABLE:
+                return f"prog_{number}.exe"
+            return self.strings[exe_id]
+        if key == "is_real":
+            return bool(flags & RECORD_FLAG_REAL)
+        if key == "description":
+            return self.strings[desc_id]
+        raise KeyError(key)
+
+
+def load_catalog(path, fingerprint=None):
+    """Memory-map a catalog file written by save_catalog
+
+    Raises:
+        StaleCatalogError: if the file is corrupt, from another format
+            version, or its fingerprint does not match
+        OSError: if the file cannot be opened
+    """
+    return MappedProgramCatalog(path, fingerprint)
@@ -1,238 +1,638 @@
 """
 GAMEZILLA MEGA COLLECTION - Shareware Program List Generator V2
-Generates 500 "programs" with hidden message support
+Generates 500 "programs" (or any catalog size) with hidden message support
 Updated to include V5 and V6
 """
 
+import argparse
+import bisect
+import hashlib
+import io
+import os
 import random
+import struct
+import sys
+from array import array
+from itertools import repeat
+from operator import itemgetter
+from collections.abc import Sequence
+
+from catalog_export import EXPORTERS
+from shareware_catalog import (
+    CATALOG_FORMAT_VERSION,
+    FIELDS,
+    ProgramCatalog,
+    StaleCatalogError,
+    load_catalog,
+    save_catalog,
+)
+
+DEFAULT_SIZE = 500
+
+# Rows formatted per write() when streaming the catalog listing
+EXPORT_BATCH_SIZE = 4096
+
+# Templates for realistic shareware names
+GENRES = {
+    "solitaire": [
+        "SOLITAIRE",
+        "FREECELL",
+        "SPIDER SOLITAIRE",
+        "PYRAMID",
+        "KLONDIKE",
+    ],
+    "screensaver": [
+        "SCREENSAVER",
+        "STARFIELD",
+        "FLYING TOASTER",
+        "MATRIX",
+        "FLYING LOGO",
+    ],
+    "compression": ["PKZIP", "ARJSFX", "WINZIP", "LHARC", "STUFFIT"],
+    "utility": [
+        "UNINSTALL",
+        "DISK DOCTOR",
+        "DEFRAG",
+        "CACHE CLEANER",
+        "OPTIMIZER",
+    ],
+    "editor": ["NOTEPAD PRO", "TEXTVIEW", "EDITOR PLUS", "WORDPAD", "RICHTEXT"],
+    "graphics": ["PAINT", "IMAGEVUE", "VIEWER PRO", "THUMBNAILER", "CONVERTER"],
+    "sound": ["WINAMP", "MEDIA PLAYER", "WAVEFORM", "CONVERTER", "MIXER"],
+    "demo": ["DEMO", "TECH DEMO", "3D DEMO", "SCENE DEMO", "INTRO"],
+    "game": ["TETRIS", "CHESS", "CHECKERS", "POKER", "BINGO"],
+    "productivity": ["CALCULATOR", "ORGANIZER", "TODO", "TIMER", "CLOCK"],
+    "network": ["PING", "DIALER", "MODEM", "TERMINAL", "TRANSFER"],
+    "system": ["MONITOR", "BENCHMARK", "INFO", "ANALYZER", "CHECKER"],
+}
+GENRE_NAMES = list(GENRES.keys())
+
+VERSIONS = [
+    "1.0",
+    "1.1",
+    "2.0",
+    "3.2",
+    "4.5",
+    "5.0",
+    "LITE",
+    "PRO",
+    "DELUXE",
+    "",
+]
+
+ADJECTIVES = [
+    "ULTRA",
+    "MEGA",
+    "SUPER",
+    "EXTREME",
+    "POWER",
+    "TURBO",
+    "CHAOS",
+    "ULTIMATE",
+]
+
+# Programs #387-392 are the GLITCHDEX MALL versions
+REAL_PROGRAMS = {
+    # V1: Original retro game
+    387: {
+        "number": 387,
+        "name": "GLITCHDEX MALL - Original",
+        "genre": "game",
+        "version": "1.0",
+        "executable": "v1",
+        "is_real": True,
+        "description": "Original Wolf3D-style retro mall crawler",
+    },
+    # V2: Immersive sim
+    388: {
+        "number": 388,
+        "name": "GLITCHDEX MALL - Immersive Sim",
+        "genre": "game",
+        "version": "2.0",
+        "executable": "v2",
+        "is_real": True,
+        "description": "Advanced AI with factions & stealth",
+    },
+    # V3: Eastland Mall - Full graphical with AI
+    389: {
+        "number": 389,
+        "name": "EASTLAND MALL - Graphical Engine",
+        "genre": "game",
+        "version": "3.0",
+        "executable": "v3",
+        "is_real": True,
+        "description": "Pygame raycaster with all V2 systems",
+    },
+    # V4: Renderist Mall OS - Cloud-driven world
+    390: {
+        "number": 390,
+        "name": "RENDERIST MALL OS - Cloud World",
+        "genre": "game",
+        "version": "4.0",
+        "executable": "v4",
+        "is_real": True,
+        "description": "Cloud-driven semantic space architecture",
+    },
+    # V5: Eastland CRD Reconstruction
+    391: {
+        "number": 391,
+        "name": "EASTLAND MALL - CRD Reconstruction",
+        "genre": "documentation",
+        "version": "5.0",
+        "executable": "v5",
+        "is_real": True,
+        "description": "Classification Reference Document methodology",
+    },
+    # V6: Next Generation (placeholder)
+    392: {
+        "number": 392,
+        "name": "GLITCHDEX MALL - Next Generation",
+        "genre": "game",
+        "version": "6.0",
+        "executable": "v6",
+        "is_real": True,
+        "description": "Future development placeholder",
+    },
+}
+
+
+class CounterRNG:
+    """Counter-based random stream for a single program
+
+    All draws for program N come from one keyed BLAKE2b hash of N, so any
+    program can be generated out of order, or in another process, and still
+    be bit-identical for the same key.
+    """
+
+    __slots__ = ("_words", "_next")
+
+    def __init__(self, key, number):
+        digest = hashlib.blake2b(
+            number.to_bytes(8, "little", signed=True), key=key, digest_size=64
+        ).digest()
+        self._words = struct.unpack("<8Q", digest)
+        self._next = 0
+
+    def _draw(self):
+        # A fake program needs at most 7 draws; 8 words are available
+        word = self._words[self._next]
+        self._next += 1
+        return word
+
+    def random(self):
+        return (self._draw() >> 11) * (1.0 / (1 << 53))
+
+    def choice(self, seq):
+        return seq[(self._draw() * len(seq)) >> 64]
+
+
+def _fake_program(number, rng):
+    """Generate one fake program, drawing from rng (Random or CounterRNG)"""
+    genre = rng.choice(GENRE_NAMES)
+    base_name = rng.choice(GENRES[genre])
+
+    # Sometimes add adjective
+    if rng.random() < 0.3:
+        base_name = rng.choice(ADJECTIVES) + " " + base_name
+
+    # Sometimes add version or variant
+    version_suffix = ""
+    if rng.random() < 0.6:
+        version_suffix = " " + rng.choice(VERSIONS)
+
+    return {
+        "number": number,
+        "name": base_name + version_suffix,
+        "genre": genre,
+        "version": rng.choice(VERSIONS),
+        "executable": f"prog_{number}.exe",
+        "is_real": False,
+        "description": "Not installed",
+    }
+
+
+def _counter_program(key, number):
+    """Generate program #number from the catalog key alone"""
+    if number in REAL_PROGRAMS:
+        return dict(REAL_PROGRAMS[number])
+    return _fake_program(number, CounterRNG(key, number))
+
+
+def _generate_shard(key, start, stop, compact):
+    """Generate programs start..stop-1 in counter mode (process pool worker)"""
+    shard = ProgramCatalog() if compact else []
+    for number in range(start, stop):
+        shard.append(_counter_program(key, number))
+    return shard
+
+
+class ProgramView(Sequence):
+    """Read-only view of catalog positions, resolved against the catalog on access"""
+
+    __slots__ = ("_programs", "_positions")
+
+    def __init__(self, programs, positions):
+        self._programs = programs
+        self._positions = positions
+
+    def __len__(self):
+        return len(self._positions)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return ProgramView(self._programs, self._positions[index])
+        return self._programs[self._positions[index]]
+
+    def __eq__(self, other):
+        # Compares like the list these methods used to return
+        if not isinstance(other, Sequence) or isinstance(other, (str, bytes)):
+            return NotImplemented
+        return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+
+    __hash__ = None
+
+    def __repr__(self):
+        return f"<ProgramView of {len(self)} programs>"
+
+
+class LazyProgramList(Sequence):
+    """Sequence of a lazy catalog; each program is generated on access"""
+
+    __slots__ = ("_generator",)
+
+    def __init__(self, generator):
+        self._generator = generator
+
+    def __len__(self):
+        return self._generator.size
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("program index out of range")
+        return self._generator._program_at(index + 1)
+
+    def __iter__(self):
+        return self._generator.iter_programs()
 
 
 class SharewareGeneratorV2:
     """Generates authentic-sounding 1995-1998 shareware program names"""
 
-    def __init__(self, seed=None):
-        if seed:
-            random.seed(seed)
-        self.programs = self._generate_programs()
+    def __init__(
+        self,
+        seed=None,
+        compact=False,
+        size=DEFAULT_SIZE,
+        lazy=False,
+        counter=False,
+        workers=1,
+        cache_dir=None,
+    ):
+        """
+        Args:
+            seed: Seed for the fake program names
+            compact: Store the catalog in a columnar ProgramCatalog instead
+                of a list of dicts (rows are then read-only mappings)
+            size: Number of programs in the catalog
+            lazy: Generate programs on demand instead of up front. Program N
+                is derived from (seed, N) alone, so memory stays constant
+                and lazy catalogs are read-only. Implies counter=True.
+            counter: Derive every program from a keyed hash of its number
+                instead of one sequential random stream, so programs can be
+                generated out of order or in parallel
+            workers: Number of processes used to generate the catalog
+                (see generate)
+            cache_dir: Directory for binary catalog caches. With a seed, the
+                catalog is memory-mapped from a cache written on the first
+                run instead of being regenerated; the first run maps the
+                file it wrote too, so every run gets the same read-only
+                MappedProgramCatalog (compact is then irrelevant). Caches
+                are rebuilt when their fingerprint is stale.
+        """
+        self.seed = seed
+        self.compact = compact
+        self.size = size
+        self.lazy = lazy
+        self.counter = counter or lazy
+        # Each generator owns its random state; nothing touches the global RNG
+        self._rng = random.Random(seed)
+        self._key = random.Random(seed).getrandbits(128).to_bytes(16, "little")
+        # Lazy and cached catalogs refuse add_program, whatever is on disk
+        self.read_only = lazy or (cache_dir is not None and seed is not None)
+        if lazy:
+            self.programs = LazyProgramList(self)
+            return
+        if cache_dir is not None and seed is not None:
+            self._load_cached(cache_dir, workers)
+        else:
+            self.generate(workers)
+
+    def cache_path(self, cache_dir):
+        """Path of the cache file for this seed, size and generation mode"""
+        seed_key = hashlib.sha1(repr(self.seed).encode("utf-8")).hexdigest()[:12]
+        mode = "counter" if self.counter else "stream"
+        return os.path.join(cache_dir, f"catalog-{seed_key}-{mode}-{self.size}.gzc")
+
+    def _cache_fingerprint(self):
+        # Anything that changes the generated programs must change this
+        params = (
+            CATALOG_FORMAT_VERSION,
+            GENRES,
+            VERSIONS,
+            ADJECTIVES,
+            sorted(REAL_PROGRAMS.items()),
+            repr(self.seed),
+            self.size,
+            self.counter,
+        )
+        return hashlib.sha256(repr(params).encode("utf-8")).digest()
+
+    def _load_cached(self, cache_dir, workers):
+        """Map the cached catalog, regenerating and saving it if stale"""
+        path = self.cache_path(cache_dir)
+        fingerprint = self._cache_fingerprint()
+        try:
+            self.programs = load_catalog(path, fingerprint)
+        except (OSError, StaleCatalogError):
+            pass
+        else:
+            # Indexes are built on first use so startup stays O(1)
+            self._indexed = False
+            return
+
+        self.generate(workers)
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            save_catalog(path, self.iter_programs(), fingerprint)
+            # Map what was just written, so this run sees what later runs will
+            self.programs = load_catalog(path, fingerprint)
+        except (OSError, StaleCatalogError):
+            # The cache is only an optimisation; run from memory this time
+            return
+        self._indexed = False
+
+    def generate(self, workers=1):
+        """(Re)build the catalog, optionally across a pool of worker processes
+
+        Parallel generation needs counter mode: the number range is split
+        into shards, each worker produces exactly the programs the serial
+        path would, and the shards are merged back in order.
+        """
+        if self.lazy:
+            raise ValueError("lazy catalogs are generated on demand")
+        if workers > 1:
+            if not self.counter:
+                raise ValueError("parallel generation requires counter=True")
+            self.programs = self._generate_parallel(workers)
+        else:
+            self.programs = self._generate_programs()
+        self._build_indexes()
+        return self.programs
+
+    def _generate_parallel(self, workers):
+        # Imported here: it pulls in multiprocessing, which nothing else needs
+        from concurrent.futures import ProcessPoolExecutor
+
+        chunk = max(1, -(-self.size // (workers * 4)))
+        starts = range(1, self.size + 1, chunk)
+        stops = [min(start + chunk, self.size + 1) for start in starts]
+
+        programs_list = ProgramCatalog() if self.compact else []
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            shards = pool.map(
+                _generate_shard, repeat(self._key), starts, stops, repeat(self.compact)
+            )
+            for shard in shards:
+                programs_list.extend(shard)
+
+        return programs_list
 
     def _generate_programs(self):
-        """Generate 500 programs with programs #387-391 being GLITCHDEX MALL versions"""
-        # Templates for realistic shareware names
-        genres = {
-            "solitaire": [
-                "SOLITAIRE",
-                "FREECELL",
-                "SPIDER SOLITAIRE",
-                "PYRAMID",
-                "KLONDIKE",
-            ],
-            "screensaver": [
-                "SCREENSAVER",
-                "STARFIELD",
-                "FLYING TOASTER",
-                "MATRIX",
-                "FLYING LOGO",
-            ],
-            "compression": ["PKZIP", "ARJSFX", "WINZIP", "LHARC", "STUFFIT"],
-            "utility": [
-                "UNINSTALL",
-                "DISK DOCTOR",
-                "DEFRAG",
-                "CACHE CLEANER",
-                "OPTIMIZER",
-            ],
-            "editor": ["NOTEPAD PRO", "TEXTVIEW", "EDITOR PLUS", "WORDPAD", "RICHTEXT"],
-            "graphics": ["PAINT", "IMAGEVUE", "VIEWER PRO", "THUMBNAILER", "CONVERTER"],
-            "sound": ["WINAMP", "MEDIA PLAYER", "WAVEFORM", "CONVERTER", "MIXER"],
-            "demo": ["DEMO", "TECH DEMO", "3D DEMO", "SCENE DEMO", "INTRO"],
-            "game": ["TETRIS", "CHESS", "CHECKERS", "POKER", "BINGO"],
-            "productivity": ["CALCULATOR", "ORGANIZER", "TODO", "TIMER", "CLOCK"],
-            "network": ["PING", "DIALER", "MODEM", "TERMINAL", "TRANSFER"],
-            "system": ["MONITOR", "BENCHMARK", "INFO", "ANALYZER", "CHECKER"],
-        }
-
-        versions = [
-            "1.0",
-            "1.1",
-            "2.0",
-            "3.2",
-            "4.5",
-            "5.0",
-            "LITE",
-            "PRO",
-            "DELUXE",
-            "",
-        ]
-
-        adjectives = [
-            "ULTRA",
-            "MEGA",
-            "SUPER",
-            "EXTREME",
-            "POWER",
-            "TURBO",
-            "CHAOS",
-            "ULTIMATE",
-        ]
-
-        programs_list = []
-
-        # Generate 500 programs
-        for i in range(1, 501):
-            if i == 387:
-                # V1: Original retro game
-                programs_list.append(
-                    {
-                        "number": i,
-                        "name": "GLITCHDEX MALL - Original",
-                        "genre": "game",
-                        "version": "1.0",
-                        "executable": "v1",
-                        "is_real": True,
-                        "description": "Original Wolf3D-style retro mall crawler",
-                    }
-                )
-            elif i == 388:
-                # V2: Immersive sim
-                programs_list.append(
-                    {
-                        "number": i,
-                        "name": "GLITCHDEX MALL - Immersive Sim",
-                        "genre": "game",
-                        "version": "2.0",
-                        "executable": "v2",
-                        "is_real": True,
-                        "description": "Advanced AI with factions & stealth",
-                    }
-                )
-            elif i == 389:
-                # V3: Eastland Mall - Full graphical with AI
-                programs_list.append(
-                    {
-                        "number": i,
-                        "name": "EASTLAND MALL - Graphical Engine",
-                        "genre": "game",
-                        "version": "3.0",
-                        "executable": "v3",
-                        "is_real": True,
-                        "description": "Pygame raycaster with all V2 systems",
-                    }
-                )
-            elif i == 390:
-                # V4: Renderist Mall OS - Cloud-driven world
-                programs_list.append(
-                    {
-                        "number": i,
-                        "name": "RENDERIST MALL OS - Cloud World",
-                        "genre": "game",
-                        "version": "4.0",
-                        "executable": "v4",
-                        "is_real": True,
-                        "description": "Cloud-driven semantic space architecture",
-                    }
-                )
-            elif i == 391:
-                # V5: Eastland CRD Reconstruction
-                programs_list.append(
-                    {
-                        "number": i,
-                        "name": "EASTLAND MALL - CRD Reconstruction",
-                        "genre": "documentation",
-                        "version": "5.0",
-                        "executable": "v5",
-                        "is_real": True,
-                        "description": "Classification Reference Document methodology",
-                    }
-                )
-            elif i == 392:
-                # V6: Next Generation (placeholder)
-                programs_list.append(
-                    {
-                        "number": i,
-                        "name": "GLITCHDEX MALL - Next Generation",
-                        "genre": "game",
-                        "version": "6.0",
-                        "executable": "v6",
-                        "is_real": True,
-                        "description": "Future development placeholder",
-                    }
-                )
+        """Generate the catalog, with programs #387-392 being GLITCHDEX MALL versions"""
+        if self.counter:
+            return _generate_shard(self._key, 1, self.size + 1, self.compact)
+
+        # Restart the sequential stream so regenerating gives the same catalog
+        self._rng.seed(self.seed)
+        programs_list = ProgramCatalog() if self.compact else []
+
+        for i in range(1, self.size + 1):
+            if i in REAL_PROGRAMS:
+                programs_list.append(dict(REAL_PROGRAMS[i]))
             else:
-                # Generate fake program
-                genre = random.choice(list(genres.keys()))
-                base_name = random.choice(genres[genre])
-
-                # Sometimes add adjective
-                if random.random() < 0.3:
-                    base_name = random.choice(adjectives) + " " + base_name
-
-                # Sometimes add version or variant
-                version_suffix = ""
-                if random.random() < 0.6:
-                    version_suffix = " " + random.choice(versions)
-
-                full_name = base_name + version_suffix
-
-                programs_list.append(
-                    {
-                        "number": i,
-                        "name": full_name,
-                        "genre": genre,
-                        "version": random.choice(versions),
-                        "executable": f"prog_{i}.exe",
-                        "is_real": False,
-                        "description": "Not installed",
-                    }
-                )
+                programs_list.append(_fake_program(i, self._rng))
 
         return programs_list
 
+    def _program_at(self, number):
+        """Generate program #number independently of all other programs"""
+        return _counter_program(self._key, number)
+
+    def iter_programs(self):
+        """Iterate over programs in catalog order without materialising them"""
+        if not self.lazy:
+            yield from self.programs
+            return
+        for number in range(1, self.size + 1):
+            yield self._program_at(number)
+
+    def iter_rows(self):
+        """Iterate over programs as tuples in FIELDS order (used by exporters)"""
+        return map(itemgetter(*FIELDS), self.iter_programs())
+
+    def _ensure_indexes(self):
+        if not self._indexed:
+            self._build_indexes()
+
+    def _build_indexes(self):
+        """Index catalog positions by number, genre and installed status"""
+        self._indexed = True
+        # Programs numbered 1..N in catalog order need no per-number entries;
+        # only numbers outside that dense prefix are stored in _by_number
+        self._dense = 0
+        self._by_number = {}
+        self._by_genre = {}
+        self._real = array("i")
+
+        programs = self.programs
+        if isinstance(programs, ProgramCatalog):
+            # Read the columns directly rather than through row proxies
+            entries = zip(
+                programs.numbers,
+                map(programs.genres.__getitem__, programs.genre_ids),
+                map(programs.is_real, range(len(programs))),
+            )
+        else:
+            entries = ((p["number"], p["genre"], p["is_real"]) for p in programs)
+        for pos, (number, genre, is_real) in enumerate(entries):
+            self._index_entry(pos, number, genre, is_real)
+
+    def _position_of(self, number):
+        if 1 <= number <= self._dense:
+            return number - 1
+        return self._by_number.get(number)
+
+    def _index_program(self, pos, prog):
+        self._index_entry(pos, prog["number"], prog["genre"], prog["is_real"])
+
+    def _index_entry(self, pos, number, genre, is_real):
+        if pos == self._dense and number == pos + 1:
+            self._dense += 1
+        elif pos >= self._dense:
+            self._by_number[number] = pos
+        # Position lists stay sorted so views follow catalog order
+        positions = self._by_genre.get(genre)
+        if positions is None:
+            positions = self._by_genre[genre] = array("i")
+        bisect.insort(positions, pos)
+        if is_real:
+            bisect.insort(self._real, pos)
+
+    def _unindex_program(self, pos, prog):
+        self._by_number.pop(prog["number"], None)
+        self._by_genre[prog["genre"]].remove(pos)
+        if prog["is_real"]:
+            self._real.remove(pos)
+
+    def add_program(self, prog):
+        """Add a program, replacing any existing program with the same number"""
+        if self.read_only:
+            raise TypeError("lazy and cached catalogs are read-only")
+        self._ensure_indexes()
+        pos = self._position_of(prog["number"])
+        if pos is None:
+            pos = len(self.programs)
+            self.programs.append(prog)
+        else:
+            self._unindex_program(pos, self.programs[pos])
+            self.programs[pos] = prog
+        self._index_program(pos, prog)
+        return prog
+
     def get_program(self, number):
         """Get program by number"""
-        for prog in self.programs:
-            if prog["number"] == number:
-                return prog
-        return None
+        if self.lazy:
+            if 1 <= number <= self.size:
+                return self._program_at(number)
+            return None
+        if not self._indexed:
+            if self.programs.dense and 1 <= number <= len(self.programs):
+                return self.programs[number - 1]
+            self._build_indexes()
+        pos = self._position_of(number)
+        if pos is None:
+            return None
+        return self.programs[pos]
 
     def get_all_programs(self):
         """Get all programs"""
         return self.programs
 
     def get_programs_by_genre(self, genre):
-        """Get programs by genre"""
-        return [p for p in self.programs if p["genre"] == genre]
+        """Get programs by genre (live view, updated by add_program)
+
+        Lazy catalogs are scanned on each call; only the matching positions
+        are kept and the programs are generated again on access.
+        """
+        if self.lazy:
+            positions = array(
+                "i",
+                (i for i, p in enumerate(self.iter_programs()) if p["genre"] == genre),
+            )
+            return ProgramView(self.programs, positions)
+        self._ensure_indexes()
+        # An unknown genre gets the (empty) array add_program will fill, so
+        # the view stays live for it too
+        positions = self._by_genre.setdefault(genre, array("i"))
+        return ProgramView(self.programs, positions)
 
     def get_real_programs(self):
-        """Get only real/installed programs"""
-        return [p for p in self.programs if p["is_real"]]
+        """Get only real/installed programs (live view, updated by add_program)"""
+        if self.lazy:
+            return [self._program_at(n) for n in REAL_PROGRAMS if n <= self.size]
+        self._ensure_indexes()
+        return ProgramView(self.programs, self._real)
 
     def get_random_programs(self, count=20):
         """Get random selection of programs"""
-        return random.sample(self.programs, min(count, len(self.programs)))
+        return self._rng.sample(self.programs, min(count, len(self.programs)))
 
-    def export_catalog(self):
-        """Export catalog text"""
-        text = """
+    def _catalog_header(self):
+        count = len(self.programs)
+        count_line = f"  {count} Programs • Your Entertainment Solution for 1998!"
+        return f"""
 ╔════════════════════════════════════════════════════════════════════════════╗
 ║                  GAMEZILLA MEGA COLLECTION VOL. 4                          ║
 ║               The Ultimate Shareware & Freeware Compilation                ║
 ║                                                                            ║
-║  500 Programs • Your Entertainment Solution for 1998!                     ║
+║{count_line:<75}║
 ║  Complete with Games, Utilities, Demos, and MORE!                         ║
 ╚════════════════════════════════════════════════════════════════════════════╝
 
-PROGRAM LISTING (Programs 1-500)
+PROGRAM LISTING (Programs 1-{count})
 
 """
-        for prog in self.programs:
-            marker = " [INSTALLED]" if prog["is_real"] else ""
-            text += f"{prog['number']:3d}. {prog['name']:<50}{marker}\n"
 
-        return text
+    def export_catalog_to(self, fileobj, batch_size=EXPORT_BATCH_SIZE):
+        """Stream the catalog text to a file object
 
+        Rows are formatted in batches of batch_size and written with one
+        write() per batch, so memory use is bounded by the batch, not the
+        catalog.
+        """
+        write = fileobj.write
+        write(self._catalog_header())
 
-if __name__ == "__main__":
-    gen = SharewareGeneratorV2()
+        batch = []
+        for number, name, _, _, _, is_real, _ in self.iter_rows():
+            marker = " [INSTALLED]" if is_real else ""
+            batch.append(f"{number:3d}. {name:<50}{marker}\n")
+            if len(batch) >= batch_size:
+                write("".join(batch))
+                batch.clear()
+        if batch:
+            write("".join(batch))
+
+    def export_catalog(self):
+        """Export catalog text"""
+        buffer = io.StringIO()
+        self.export_catalog_to(buffer)
+        return buffer.getvalue()
+
+    def export_to(self, fileobj, format="text"):
+        """Stream the catalog to fileobj in one of EXPORT_FORMATS
+
+        "columnar" writes bytes and needs a binary file; the other formats
+        write text (open CSV files with newline="").
+        """
+        if format == "text":
+            self.export_catalog_to(fileobj)
+        elif format in EXPORTERS:
+            EXPORTERS[format](self.iter_rows(), fileobj)
+        else:
+            raise ValueError(f"unknown export format: {format!r}")
+
+
+EXPORT_FORMATS = ("text",) + tuple(EXPORTERS)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Export the GAMEZILLA catalog.")
+    parser.add_argument("--format", choices=EXPORT_FORMATS, default="text")
+    parser.add_argument("--size", type=int, default=DEFAULT_SIZE)
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument(
+        "--output",
+        help="Output file (default: PROGRAM_CATALOG_V2.txt for text, "
+        "PROGRAM_CATALOG_V2.<format> otherwise)",
+    )
+    args = parser.parse_args(argv)
+
+    gen = SharewareGeneratorV2(seed=args.seed, size=args.size, lazy=True)
 
     # Show real programs
     print("Installed programs:\n")
@@ -242,6 +642,17 @@ if __name__ == "__main__":
         print()
 
     # Export full catalog
-    with open("PROGRAM_CATALOG_V2.txt", "w") as f:
-        f.write(gen.export_catalog())
-    print("\nCatalog exported to PROGRAM_CATALOG_V2.txt")
+    extension = "txt" if args.format == "text" else args.format
+    output = args.output or f"PROGRAM_CATALOG_V2.{extension}"
+    if args.format == "columnar":
+        f = open(output, "wb")
+    else:
+        f = open(output, "w", encoding="utf-8", newline="")
+    with f:
+        gen.export_to(f, args.format)
+    print(f"\nCatalog exported to {output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,159 @@
+"""
+GAMEZILLA MEGA COLLECTION - Manifest Loader
+Reads shareware.yml into typed Version records, validated against SCHEMA,
+and caches them per file so the launcher, the bot and the integrity tools
+only parse it again after it changes
+"""
+
+import hashlib
+import os
+import time
+from collections import namedtuple
+from types import MappingProxyType
+
+MANIFEST_NAME = "shareware.yml"
+
+# Marks a version field that must be present (and not empty)
+REQUIRED = object()
+
+# Version fields: name -> (accepted types, default or REQUIRED)
+SCHEMA = {
+    "path": (str, REQUIRED),
+    "entry": (str, ""),
+    "role": (str, ""),
+    "protected": (bool, False),
+    "placeholder": (bool, False),
+    "executable": ((str, int), ""),
+    "description": (str, ""),
+}
+
+# Cached results (a parse here, file digests in tools/integrity.py) are only
+# trusted on stat() alone once the file is this much older than the read: a
+# write in the same timestamp tick would leave its metadata unchanged (2 s
+# covers the coarsest filesystem timestamps)
+RACY_NS = 2 * 10**9
+
+# Absolute path -> (stat key, content digest, read time in ns, Manifest)
+_cache = {}
+
+
+class ManifestError(ValueError):
+    """shareware.yml cannot be read or does not match SCHEMA"""
+
+
+class Version(namedtuple("Version", ("version_id",) + tuple(SCHEMA))):
+    """One entry of the manifest's versions (path is relative to the manifest)"""
+
+    __slots__ = ()
+
+
+class Manifest(namedtuple("Manifest", "path versions")):
+    """A validated manifest: versions maps version ids to Version records"""
+
+    __slots__ = ()
+
+    @property
+    def base_dir(self):
+        """Directory the version paths are relative to"""
+        return os.path.dirname(os.path.abspath(self.path)) if self.path else None
+
+    def protected(self):
+        """Ids of the protected versions, in manifest order"""
+        return [v.version_id for v in self.versions.values() if v.protected]
+
+
+def _check_type(value, types, where):
+    allowed = types if isinstance(types, tuple) else (types,)
+    if isinstance(value, allowed) and (bool in allowed or not isinstance(value, bool)):
+        return
+    names = " or ".join(t.__name__ for t in allowed)
+    raise ManifestError(f"{where} must be {names}, not {type(value).__name__}")
+
+
+def parse_manifest(data, path=None):
+    """Validate parsed YAML against SCHEMA and return a Manifest"""
+    source = path or "manifest"
+    versions = data.get("versions") if isinstance(data, dict) else None
+    if not isinstance(versions, dict):
+        raise ManifestError(f"{source} has no 'versions' mapping")
+
+    records = {}
+    for version_id, info in versions.items():
+        if not isinstance(version_id, str):
+            raise ManifestError(f"version id {version_id!r} must be a string")
+        if not isinstance(info, dict):
+            raise ManifestError(f"version '{version_id}' must be a mapping")
+        unknown = sorted(set(info) - set(SCHEMA), key=str)
+        if unknown:
+            raise ManifestError(
+                f"version '{version_id}' has unknown field '{unknown[0]}' "
+                f"(known fields: {', '.join(SCHEMA)})"
+            )
+        fields = {}
+        for name, (types, default) in SCHEMA.items():
+            value = info.get(name)
+            if value is None or value == "":
+                if default is REQUIRED:
+                    raise ManifestError(f"version '{version_id}' has no {name}")
+                value = default
+            else:
+                _check_type(value, types, f"version '{version_id}' {name}")
+            fields[name] = value
+
+        parts = fields["path"].replace("\\", "/").split("/")
+        if os.path.isabs(fields["path"]) or os.pardir in parts:
+            raise ManifestError(
+                f"version '{version_id}' path must be inside the manifest's directory"
+            )
+        records[version_id] = Version(version_id, **fields)
+    return Manifest(path, MappingProxyType(records))
+
+
+def _parse_yaml(text, path):
+    # Imported on first use so importing this module stays free
+    import yaml
+
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)  # libyaml if built
+    try:
+        return yaml.load(text, Loader=loader)
+    except yaml.YAMLError as e:
+        raise ManifestError(f"{path} is not valid YAML: {e}")
+
+
+def load_manifest(path=MANIFEST_NAME, use_cache=True):
+    """Read and validate a manifest file, reusing the last parse if unchanged
+
+    The cached Manifest is returned (the same object) while the file's
+    size, mtime, ctime and inode are unchanged; when only the metadata
+    changed the file is read but not parsed again.
+    """
+    key_path = os.path.abspath(path)
+    try:
+        st = os.stat(key_path)
+    except OSError as e:
+        raise ManifestError(f"cannot read {path}: {e.strerror}")
+    stat_key = (st.st_size, st.st_mtime_ns, st.st_ctime_ns, st.st_ino)
+
+    cached = _cache.get(key_path) if use_cache else None
+    if cached is not None and cached[0] == stat_key:
+        if max(st.st_mtime_ns, st.st_ctime_ns) < cached[2] - RACY_NS:
+            return cached[3]
+
+    read_ns = time.time_ns()
+    try:
+        with open(key_path, "rb") as f:
+            text = f.read()
+    except OSError as e:
+        raise ManifestError(f"cannot read {path}: {e.strerror}")
+    digest = hashlib.sha256(text).digest()
+    if cached is not None and cached[1] == digest:
+        manifest = cached[3]
+    else:
+        manifest = parse_manifest(_parse_yaml(text, path), path)
+    _cache[key_path] = (stat_key, digest, read_ns, manifest)
+    return manifest
+
+
+def clear_cache():
+    """Forget every cached manifest"""
+    _cache.clear()
@@ -1,12 +1,18 @@
 """Unit tests for ai_bot_03.py - testing protection enforcement logic."""
 
 import os
+import shutil
+import subprocess
 import sys
 
+import pytest
 import yaml
 
 # Add the tools directory to the path so we can import from it
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "tools"))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from shareware_manifest import parse_manifest  # noqa: E402
 
 
 class TestCheckCanon:
@@ -168,3 +174,233 @@ class TestProtectionEnforcement:
             workspace = version_info["path"]
 
         assert workspace == "archive/v6-dev"
+
+
+def run_bot(monkeypatch, tmp_path, argv):
+    """Run ai_bot_03 in tmp_path with a one-version manifest; return its sleeps"""
+    import ai_bot_03
+
+    (tmp_path / "shareware.yml").write_text(
+        "versions:\n  v1-canon:\n    path: archive/v1-canon\n    protected: true\n"
+    )
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(ai_bot_03, "THEATRICAL", False)
+    sleeps = []
+    monkeypatch.setattr(ai_bot_03.time, "sleep", sleeps.append)
+    ai_bot_03.main(argv)
+    return sleeps
+
+
+class TestBootPacing:
+    """Tests for the boot sequence's (optional) theatrical pauses."""
+
+    def test_no_sleeps_by_default(self, monkeypatch, tmp_path, capsys):
+        """A normal run finishes as soon as the work is done."""
+        assert run_bot(monkeypatch, tmp_path, []) == []
+        assert "Manifest validated: 1 version(s)" in capsys.readouterr().out
+
+    def test_theatrical_mode_keeps_pauses(self, monkeypatch, tmp_path, capsys):
+        """--theatrical restores the retro pacing."""
+        sleeps = run_bot(monkeypatch, tmp_path, ["--theatrical"])
+        assert sleeps and sum(sleeps) > 1
+
+
+class TestIntegrity:
+    """Tests for checking protected builds against their integrity record."""
+
+    def test_tampered_build_fails(self, monkeypatch, tmp_path, capsys):
+        """A protected build that changed since its record fails the run."""
+        import ai_bot_03
+        import integrity
+
+        build = tmp_path / "archive" / "v1-canon"
+        build.mkdir(parents=True)
+        (build / "main.py").write_text("print('canon')\n")
+        manifest = parse_manifest(
+            {"versions": {"v1-canon": {"path": "archive/v1-canon", "protected": True}}}
+        )
+        record = integrity.build_record(manifest, str(tmp_path))
+        integrity.save_record(str(tmp_path / "shareware.integrity.json"), record)
+
+        run_bot(monkeypatch, tmp_path, [])
+        assert "Canon integrity: PRESERVED" in capsys.readouterr().out
+
+        (build / "main.py").write_text("print('improved')\n")
+        assert ai_bot_03.main([]) == 1
+        out = capsys.readouterr().out
+        assert "v1-canon: TAMPERED (1 modified)" in out
+        assert "Canon integrity: VIOLATED" in out
+
+
+class ScriptedWatcher:
+    """Stands in for a file watcher, returning prepared batches of paths."""
+
+    name = "scripted"
+
+    def __init__(self, batches):
+        self.batches = list(batches)
+
+    def collect(self):
+        if not self.batches:
+            raise KeyboardInterrupt
+        return set(self.batches.pop(0)), 0.0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        pass
+
+
+@pytest.mark.skipif(shutil.which("git") is None, reason="needs git")
+class TestWatch:
+    """Tests for --watch, fed by a scripted watcher."""
+
+    @pytest.fixture
+    def checkout(self, tmp_path, monkeypatch):
+        """A git checkout with one recorded protected build."""
+        import integrity
+
+        build = tmp_path / "archive" / "v1-canon"
+        build.mkdir(parents=True)
+        (build / "main.py").write_text("print('canon')\n")
+        (tmp_path / "shareware.yml").write_text(
+            "versions:\n  v1-canon:\n    path: archive/v1-canon\n    protected: true\n"
+        )
+        git = ["git", "-c", "user.name=t", "-c", "user.email=t@example.com"]
+        subprocess.run(["git", "init", "-q"], cwd=tmp_path, check=True)
+        subprocess.run(git + ["add", "-A"], cwd=tmp_path, check=True)
+        subprocess.run(git + ["commit", "-qm", "canon"], cwd=tmp_path, check=True)
+        manifest = integrity.load_manifest(str(tmp_path / "shareware.yml"))
+        record = integrity.build_record(manifest, str(tmp_path))
+        integrity.save_record(str(tmp_path / "shareware.integrity.json"), record)
+        monkeypatch.chdir(tmp_path)
+        return build
+
+    def watch(self, monkeypatch, batches, revert=False):
+        import ai_bot_03
+
+        monkeypatch.setattr(
+            ai_bot_03.watcher, "open_watcher", lambda *a, **k: ScriptedWatcher(batches)
+        )
+        return ai_bot_03.watch(["v1-canon"], revert=revert)
+
+    def test_changes_are_reported(self, checkout, monkeypatch, capsys):
+        """Each batch is checked; only tampering is logged."""
+        (checkout / "main.py").write_text("print('improved')\n")
+        batches = [[str(checkout / "main.py")], [str(checkout.parent / "x")]]
+        assert self.watch(monkeypatch, batches) == 0
+        out = capsys.readouterr().out
+        assert out.count("v1-canon: TAMPERED (1 modified)") == 2
+        assert "Watch ended." in out
+
+    def test_earlier_changes_stay_reported(self, checkout, monkeypatch, capsys):
+        """Each report covers every change still on disk, not just the batch."""
+        import ai_bot_03
+
+        main, sub = checkout / "main.py", checkout / "sub"
+
+        def add_new():
+            sub.mkdir()
+            (sub / "new.txt").write_text("new\n")
+
+        def delete_sub():
+            (sub / "new.txt").unlink()
+            sub.rmdir()
+
+        # (change made, path the watcher reports) per batch
+        steps = [
+            (lambda: main.write_text("print('improved')\n"), main),
+            (add_new, sub / "new.txt"),
+            (delete_sub, sub),
+            (lambda: main.write_text("print('canon')\n"), main),
+        ]
+
+        class Stepper(ScriptedWatcher):
+            def collect(self):
+                if not steps:
+                    raise KeyboardInterrupt
+                change, path = steps.pop(0)
+                change()
+                return {str(path)}, 0.0
+
+        monkeypatch.setattr(
+            ai_bot_03.watcher, "open_watcher", lambda *a, **k: Stepper([])
+        )
+        ai_bot_03.watch(["v1-canon"])
+        reported = [
+            line.split("v1-canon: ")[1].split(" after")[0]
+            for line in capsys.readouterr().out.splitlines()
+            if "v1-canon: " in line
+        ]
+        assert reported == [
+            "TAMPERED (1 modified)",
+            "TAMPERED (1 modified, 1 added)",
+            "TAMPERED (1 modified)",
+            "matches its record again",
+        ]
+
+    def test_revert(self, checkout, monkeypatch, capsys):
+        """--revert restores the build and keeps the changes in the lab."""
+        (checkout / "main.py").write_text("print('improved')\n")
+        (checkout / "cheat.py").write_text("print('god mode')\n")
+        self.watch(monkeypatch, [[str(checkout / "cheat.py")]], revert=True)
+        assert (checkout / "main.py").read_text() == "print('canon')\n"
+        assert not (checkout / "cheat.py").exists()
+        (kept,) = (checkout.parent.parent / "lab" / "reverted").iterdir()
+        assert sorted(p.name for p in (kept / "v1-canon").iterdir()) == [
+            "cheat.py",
+            "main.py",
+        ]
+        assert "reverted, changes kept in" in capsys.readouterr().out
+
+    def test_revert_refuses_uncommitted_content(self, checkout, monkeypatch, capsys):
+        """Files whose recorded content is not in git HEAD are left in place."""
+        import integrity
+
+        # A record made from a dirty tree
+        (checkout / "main.py").write_text("print('uncommitted')\n")
+        manifest = integrity.load_manifest("shareware.yml")
+        record = integrity.build_record(manifest, str(checkout.parent.parent))
+        integrity.save_record("shareware.integrity.json", record)
+
+        (checkout / "main.py").write_text("print('improved')\n")
+        self.watch(monkeypatch, [[str(checkout / "main.py")]], revert=True)
+        assert (checkout / "main.py").read_text() == "print('improved')\n"
+        assert not (checkout.parent.parent / "lab" / "reverted").exists()
+        out = capsys.readouterr().out
+        assert "NOT restored main.py (git HEAD does not match" in out
+
+    def test_cache_is_saved(self, checkout, monkeypatch):
+        """The digests hashed while watching are reused by the next run."""
+        import integrity
+
+        monkeypatch.setattr(integrity, "RACY_NS", 0)
+        self.watch(monkeypatch, [])
+        cache = integrity.HashCache.load("shareware.integrity-cache.json")
+        assert [os.path.basename(path) for path in cache.files] == ["main.py"]
+
+    def test_needs_a_record(self, tmp_path, monkeypatch, capsys):
+        """Without an integrity record there is nothing to guard against."""
+        monkeypatch.chdir(tmp_path)
+        assert self.watch(monkeypatch, []) == 1
+        assert "Cannot watch without an integrity record" in capsys.readouterr().out
+
+    def test_needs_protected_versions(self, tmp_path, monkeypatch, capsys):
+        """--watch with no protected (or no recorded) versions is an error."""
+        import ai_bot_03
+
+        (tmp_path / "shareware.yml").write_text(
+            "versions:\n  v1-lab:\n    path: archive/v1-lab\n    protected: false\n"
+        )
+        monkeypatch.chdir(tmp_path)
+        assert ai_bot_03.main(["--watch"]) == 1
+        assert "no protected versions" in capsys.readouterr().out
+
+        (tmp_path / "shareware.integrity.json").write_text(
+            '{"format": 1, "algorithm": "sha256", "versions": {}}'
+        )
+        assert ai_bot_03.watch(["v2-canon"]) == 1
+        assert "no protected version has an integrity record" in (
+            capsys.readouterr().out
+        )
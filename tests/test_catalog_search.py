@@ -0,0 +1,114 @@
+"""Unit tests for catalog_search.py - prefix and substring program search."""
+
+import os
+import sys
+
+# Add the repository root to the path so we can import the search index
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from catalog_search import (  # noqa: E402
+    BLOCK_BITS,
+    CatalogSearchIndex,
+    scan_catalog,
+    tokenize,
+)
+from shareware_gen_v2 import SharewareGeneratorV2  # noqa: E402
+
+
+def scan(gen, predicate):
+    """Reference implementation: positions whose tokens satisfy predicate."""
+    return [
+        pos
+        for pos, prog in enumerate(gen.iter_programs())
+        if predicate(tokenize(prog["name"]) + tokenize(prog["description"]))
+    ]
+
+
+class TestTokenize:
+    """Tests for query and document tokenization."""
+
+    def test_keeps_version_numbers(self):
+        """Dotted versions stay one token and case is folded."""
+        assert tokenize("MEGA WINZIP 1.1") == ["mega", "winzip", "1.1"]
+
+    def test_splits_punctuation(self):
+        """Dashes and spaces separate tokens."""
+        assert tokenize("GLITCHDEX MALL - Original") == [
+            "glitchdex",
+            "mall",
+            "original",
+        ]
+
+
+class TestSearch:
+    """Tests for prefix and substring queries."""
+
+    def test_prefix_query(self):
+        """A term matches every token it is a prefix of."""
+        gen = SharewareGeneratorV2(seed=4, size=3000, counter=True)
+        index = CatalogSearchIndex(gen)
+
+        expected = scan(gen, lambda toks: any(t.startswith("win") for t in toks))
+        assert expected
+        assert index.search("WIN") == expected
+
+    def test_terms_are_anded(self):
+        """All query terms must match, across block boundaries."""
+        gen = SharewareGeneratorV2(seed=4, size=3 * BLOCK_BITS, counter=True)
+        index = CatalogSearchIndex(gen)
+
+        expected = scan(
+            gen,
+            lambda toks: any(t.startswith("mega") for t in toks)
+            and any(t.startswith("sol") for t in toks),
+        )
+        assert expected[-1] >= BLOCK_BITS
+        assert index.search("mega sol") == expected
+
+    def test_substring_query(self):
+        """Substring mode matches terms inside tokens."""
+        gen = SharewareGeneratorV2(seed=4, size=3000, counter=True)
+        index = CatalogSearchIndex(gen)
+
+        results = index.search_programs("oast", substring=True)
+        assert results
+        assert all("TOASTER" in p["name"] for p in results)
+        assert index.search("oast") == []
+
+    def test_limit_returns_first_matches(self):
+        """Limited queries return the first matches in catalog order."""
+        gen = SharewareGeneratorV2(seed=4, size=3000, counter=True)
+        index = CatalogSearchIndex(gen)
+        assert index.search("installed", limit=5) == index.search("installed")[:5]
+
+    def test_real_programs_found(self):
+        """The GLITCHDEX MALL builds are searchable by name."""
+        gen = SharewareGeneratorV2(seed=4)
+        index = CatalogSearchIndex(gen)
+        names = [p["name"] for p in index.search_programs("glitchdex mall")]
+        assert names == [
+            "GLITCHDEX MALL - Original",
+            "GLITCHDEX MALL - Immersive Sim",
+            "GLITCHDEX MALL - Next Generation",
+        ]
+
+    def test_empty_and_unknown_queries(self):
+        """Empty queries match everything; unknown terms match nothing."""
+        gen = SharewareGeneratorV2(seed=4, size=50, lazy=True)
+        index = CatalogSearchIndex(gen)
+        assert index.search("") == list(range(50))
+        assert index.search("zzzz") == []
+
+    def test_scan_matches_the_index(self):
+        """Searching without an index gives the same positions."""
+        gen = SharewareGeneratorV2(seed=4, size=3000, counter=True)
+        index = CatalogSearchIndex(gen)
+        for query in ("win", "mega sol", "glitchdex mall", "", "zzzz"):
+            assert scan_catalog(gen, query) == index.search(query)
+        assert scan_catalog(gen, "oast", substring=True) == index.search(
+            "oast", substring=True
+        )
+        assert scan_catalog(gen, "installed", limit=5) == index.search(
+            "installed", limit=5
+        )
+        assert scan_catalog(gen, "win", limit=0) == []
@@ -0,0 +1,46 @@
+"""Unit tests for first_page.py - the launcher's first page snapshot."""
+
+import os
+import sys
+
+# Add the repository root to the path so we can import the snapshot helpers
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from first_page import (  # noqa: E402
+    FirstPage,
+    load_first_page,
+    save_first_page,
+    snapshot_path,
+)
+from shareware_gen_v2 import SharewareGeneratorV2  # noqa: E402
+
+
+class TestFirstPage:
+    """Tests for saving and reading first page snapshots."""
+
+    def test_round_trip(self, tmp_path):
+        """Snapshotted rows match the catalog; the rest are placeholders."""
+        programs = SharewareGeneratorV2(seed=1998).get_all_programs()
+        path = snapshot_path(str(tmp_path), 1998, None, "stream")
+        save_first_page(path, programs, 386, rows=20)
+
+        page = load_first_page(path)
+        assert len(page) == len(programs)
+        assert page.start == 376
+        for i in range(376, 396):
+            assert page[i] == programs[i]
+        assert page[0]["loading"]
+        assert page[-1]["number"] == len(programs)
+
+    def test_missing_or_corrupt_snapshot(self, tmp_path):
+        """Unreadable snapshots are ignored."""
+        path = tmp_path / "first-page.json"
+        assert load_first_page(str(path)) is None
+        path.write_text('{"size": 10')
+        assert load_first_page(str(path)) is None
+
+    def test_empty_page(self):
+        """Without a snapshot the launcher starts from an empty page."""
+        page = FirstPage()
+        assert len(page) == 0
+        assert list(page) == []
@@ -0,0 +1,110 @@
+"""Unit tests for headless_curses.py - the in-memory curses stand-in."""
+
+import curses
+import os
+import sys
+
+import pytest
+
+# Add the repository root to the path so we can import the backend
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from headless_curses import HeadlessCurses  # noqa: E402
+
+
+@pytest.fixture
+def screen():
+    return HeadlessCurses(lines=5, cols=10)
+
+
+class TestWindows:
+    """Tests for drawing into windows."""
+
+    def test_addstr_wraps_and_fails_past_the_corner(self, screen):
+        """Text wraps at the right edge; the bottom right corner is an error."""
+        win = screen.newwin(2, 4, 1, 1)
+        win.addstr(0, 2, "abcd")
+        assert [c for c, _ in win.cells[1]] == ["c", "d", " ", " "]
+        with pytest.raises(curses.error):
+            win.addstr(1, 0, "wxyz")
+        with pytest.raises(curses.error):
+            win.addstr(2, 0, "x")
+
+    def test_attributes(self, screen):
+        """attron() attributes combine with the ones passed to addstr()."""
+        win = screen.stdscr
+        win.attron(curses.A_BOLD)
+        win.addstr(0, 0, "x", screen.color_pair(2))
+        win.refresh()
+        assert screen.attr_at(0, 0) == curses.A_BOLD | screen.color_pair(2)
+
+    def test_overwrite_needs_overlap(self, screen):
+        """overwrite() without coordinates copies where the windows overlap."""
+        pad = screen.newpad(5, 10)
+        pad.addstr(3, 3, "pad")
+        win = screen.newwin(2, 5, 3, 2)
+        pad.overwrite(win)
+        assert [c for c, _ in win.cells[0]] == [" ", "p", "a", "d", " "]
+        with pytest.raises(curses.error):
+            screen.newpad(1, 10).overwrite(win)
+
+
+class TestUpdates:
+    """Tests for what reaches the terminal."""
+
+    def test_only_changed_cells_are_written(self, screen):
+        """The first update paints the screen; later ones send changes only."""
+        win = screen.stdscr
+        win.addstr(0, 0, "hello")
+        win.refresh()
+        assert screen.chars_written == 50
+        win.addstr(0, 0, "help")
+        win.refresh()
+        assert screen.chars_written == 51
+        assert screen.screen_text()[0] == "helpo     "
+
+    def test_untouched_windows_are_not_copied(self, screen):
+        """noutrefresh() copies touched lines, so an overdrawn window needs
+        touchwin()."""
+        win = screen.newwin(1, 4, 0, 0)
+        win.addstr(0, 0, "win")
+        win.noutrefresh()
+        screen.stdscr.addstr(0, 0, "std")
+        screen.stdscr.noutrefresh()
+        win.noutrefresh()
+        screen.doupdate()
+        assert screen.find("std") == (0, 0)
+        win.touchwin()
+        win.refresh()
+        assert screen.find("win") == (0, 0)
+
+
+class TestInput:
+    """Tests for scripted input."""
+
+    def test_press_reads_one_key_at_a_time(self, screen):
+        """A non-blocking read stops at the gap after each pressed key."""
+        win = screen.stdscr
+        screen.press("a", "b")
+        screen.burst("c", "d")
+        win.timeout(0)
+        assert [win.getch(), win.getch()] == [ord("a"), -1]
+        win.timeout(-1)
+        assert win.getch() == ord("b")
+        win.timeout(1)
+        assert win.getch() == -1
+        assert [win.getch(), win.getch()] == [ord("c"), ord("d")]
+
+    def test_end_of_script_interrupts_blocking_reads(self, screen):
+        """A blocking read with no input left acts like Ctrl-C."""
+        screen.stdscr.timeout(-1)
+        with pytest.raises(KeyboardInterrupt):
+            screen.stdscr.getch()
+
+    def test_click(self, screen):
+        """Clicks queue KEY_MOUSE plus an event for getmouse()."""
+        screen.click(3, 7)
+        assert screen.stdscr.getch() == curses.KEY_MOUSE
+        assert screen.getmouse() == (0, 7, 3, 0, curses.BUTTON1_CLICKED)
+        with pytest.raises(curses.error):
+            screen.getmouse()
@@ -0,0 +1,295 @@
+"""Unit tests for integrity.py - hash trees of protected archive builds."""
+
+import hashlib
+import os
+import sys
+
+import pytest
+
+# Add the tools directory to the path so we can import from it
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "tools"))
+
+import integrity  # noqa: E402
+
+MANIFEST = """\
+versions:
+  v1-canon:
+    path: archive/v1-canon
+    protected: true
+  v2-placeholder:
+    path: archive/v2-placeholder
+    protected: true
+  v3-dev:
+    path: archive/v3-dev
+    protected: false
+"""
+
+
+@pytest.fixture
+def repo(tmp_path):
+    """A manifest with one protected build on disk."""
+    build = tmp_path / "archive" / "v1-canon"
+    (build / "bin").mkdir(parents=True)
+    (build / "bin" / "launch.sh").write_text("#!/bin/sh\necho canon\n")
+    (build / "README.md").write_text("Golden build\n")
+    (build / "data").mkdir()
+    (build / "data" / "level1.dat").write_bytes(os.urandom(3 * integrity.READ_SIZE))
+    (tmp_path / "archive" / "v3-dev").mkdir()
+    (tmp_path / "shareware.yml").write_text(MANIFEST)
+    return tmp_path
+
+
+def build(repo):
+    manifest = integrity.load_manifest(str(repo / "shareware.yml"))
+    return integrity.build_record(manifest, str(repo))
+
+
+class TestHashFile:
+    """Tests for hashing single files."""
+
+    @pytest.mark.parametrize("size", [0, 1, 4095, 4096, 4097, 3 * 4096])
+    def test_matches_hashlib(self, tmp_path, size):
+        """Chunk boundaries of the reused buffer do not change the digest."""
+        data = os.urandom(size)
+        path = tmp_path / "file.bin"
+        path.write_bytes(data)
+        expected = hashlib.sha256(data).hexdigest()
+        assert integrity.hash_file(str(path), read_size=4096) == expected
+        assert integrity.hash_file(str(path)) == expected
+
+
+class TestTreeHashes:
+    """Tests for the Merkle tree over file hashes."""
+
+    def test_any_change_moves_the_root(self):
+        """Content, names and placement all feed into the root hash."""
+        files = {"a.txt": "1", "sub/b.txt": "2", "sub/deeper/c.txt": "3"}
+        root = integrity.tree_hashes(files)[""]
+        assert integrity.tree_hashes(dict(files))[""] == root
+        for changed in (
+            {**files, "a.txt": "9"},
+            {"a2.txt": "1", "sub/b.txt": "2", "sub/deeper/c.txt": "3"},
+            {"a.txt": "1", "b.txt": "2", "sub/deeper/c.txt": "3"},
+        ):
+            assert integrity.tree_hashes(changed)[""] != root
+
+    def test_directories_have_their_own_hashes(self):
+        """Each directory's hash depends only on its own subtree."""
+        hashes = integrity.tree_hashes({"a.txt": "1", "sub/b.txt": "2"})
+        assert set(hashes) == {"", "sub"}
+        other = integrity.tree_hashes({"a.txt": "5", "sub/b.txt": "2"})
+        assert other["sub"] == hashes["sub"]
+
+
+class TestBuildAndVerify:
+    """Tests for recording and verifying protected builds."""
+
+    def test_record_covers_existing_protected_builds(self, repo):
+        """Placeholders and unprotected versions are not recorded."""
+        record = build(repo)
+        assert list(record["versions"]) == ["v1-canon"]
+        files = record["versions"]["v1-canon"]["files"]
+        assert sorted(files) == ["README.md", "bin/launch.sh", "data/level1.dat"]
+        assert files["data/level1.dat"]["size"] == 3 * integrity.READ_SIZE
+        assert files["README.md"]["hash"] == integrity.hash_file(
+            str(repo / "archive" / "v1-canon" / "README.md")
+        )
+
+    def test_intact_build_verifies(self, repo):
+        """An untouched build matches its record, with any worker count."""
+        record = build(repo)
+        for workers in (1, 4):
+            (report,) = integrity.verify_record(record, str(repo), workers=workers)
+            assert report.ok
+            assert report.files == 3
+
+    def test_changes_are_reported(self, repo):
+        """Modified, added and removed files are listed."""
+        record = build(repo)
+        build_dir = repo / "archive" / "v1-canon"
+        (build_dir / "README.md").write_text("Golden build, improved\n")
+        (build_dir / "bin" / "cheat.sh").write_text("echo god mode\n")
+        (build_dir / "data" / "level1.dat").unlink()
+
+        (report,) = integrity.verify_record(record, str(repo))
+        assert not report.ok
+        assert report.modified == ["README.md"]
+        assert report.added == ["bin/cheat.sh"]
+        assert report.removed == ["data/level1.dat"]
+        assert report.summary() == "1 modified, 1 added, 1 removed"
+
+    def test_file_deleted_during_the_scan(self, repo, monkeypatch):
+        """A file that disappears after the walk is reported as removed."""
+        record = build(repo)
+        readme = repo / "archive" / "v1-canon" / "README.md"
+        hash_file = integrity.hash_file
+
+        def delete_then_hash(path, *args):
+            if path == str(readme):
+                readme.unlink()
+            return hash_file(path, *args)
+
+        monkeypatch.setattr(integrity, "hash_file", delete_then_hash)
+        (report,) = integrity.verify_record(record, str(repo))
+        assert report.removed == ["README.md"]
+        assert report.files == 2
+
+    def test_missing_build_directory(self, repo):
+        """A recorded build that disappeared fails verification."""
+        record = build(repo)
+        os.rename(repo / "archive" / "v1-canon", repo / "archive" / "moved")
+        (report,) = integrity.verify_record(record, str(repo))
+        assert not report.ok
+        assert report.summary() == "directory missing"
+
+
+class TestVerifyPaths:
+    """Tests for checking only the paths a watcher reported."""
+
+    def test_only_given_paths_are_hashed(self, repo):
+        """Changes outside the given paths are not looked at."""
+        record = build(repo)
+        build_dir = repo / "archive" / "v1-canon"
+        (build_dir / "README.md").write_text("Edited\n")
+        (build_dir / "bin" / "launch.sh").write_text("echo edited\n")
+
+        (report,) = integrity.verify_paths(
+            record, str(repo), [str(build_dir / "README.md")]
+        )
+        assert report.modified == ["README.md"]
+        assert report.files == 1
+        assert not report.ok
+
+    def test_root_matches_a_full_verify(self, repo):
+        """The recomputed root is the one a full verify would find."""
+        record = build(repo)
+        build_dir = repo / "archive" / "v1-canon"
+        (build_dir / "README.md").write_text("Edited\n")
+        (report,) = integrity.verify_paths(
+            record, str(repo), [str(build_dir / "README.md")]
+        )
+        (full,) = integrity.verify_record(record, str(repo))
+        assert report.root == full.root
+
+        (build_dir / "README.md").write_text("Golden build\n")
+        (report,) = integrity.verify_paths(
+            record, str(repo), [str(build_dir / "README.md")]
+        )
+        assert report.ok
+
+    def test_directories(self, repo):
+        """A directory path covers the files under it, on disk and recorded."""
+        record = build(repo)
+        build_dir = repo / "archive" / "v1-canon"
+        (build_dir / "data" / "level1.dat").unlink()
+        (build_dir / "data").rmdir()
+        (build_dir / "mods").mkdir()
+        (build_dir / "mods" / "god.dat").write_text("x\n")
+
+        (report,) = integrity.verify_paths(
+            record, str(repo), [str(build_dir / "data"), str(build_dir / "mods")]
+        )
+        assert report.removed == ["data/level1.dat"]
+        assert report.added == ["mods/god.dat"]
+
+    def test_unrelated_paths(self, repo):
+        """Paths outside every recorded build produce no reports."""
+        record = build(repo)
+        (repo / "archive" / "v3-dev" / "x").write_text("x\n")
+        paths = [str(repo / "archive" / "v3-dev" / "x"), str(repo / "shareware.yml")]
+        assert integrity.verify_paths(record, str(repo), paths) == []
+
+
+class TestHashCache:
+    """Tests for reusing digests of files whose metadata is unchanged."""
+
+    @pytest.fixture
+    def settled(self, monkeypatch):
+        """Trust files however recently they were written."""
+        monkeypatch.setattr(integrity, "RACY_NS", 0)
+
+    def test_unchanged_files_are_skipped(self, repo, settled):
+        """Only files whose metadata changed are hashed again."""
+        record = build(repo)
+        cache = integrity.HashCache()
+        integrity.verify_record(record, str(repo), cache=cache)
+        assert (cache.hashed, cache.skipped) == (3, 0)
+
+        cache.hashed = 0
+        (report,) = integrity.verify_record(record, str(repo), cache=cache)
+        assert report.ok
+        assert (cache.hashed, cache.skipped) == (0, 3)
+
+        (repo / "archive" / "v1-canon" / "README.md").write_text("Edited\n")
+        (report,) = integrity.verify_record(record, str(repo), cache=cache)
+        assert report.modified == ["README.md"]
+        assert (cache.hashed, cache.skipped) == (1, 5)
+
+    def test_recent_changes_are_hashed_again(self, repo):
+        """Files changed just before they were hashed are not cached."""
+        record = build(repo)
+        cache = integrity.HashCache()
+        integrity.verify_record(record, str(repo), cache=cache)
+        integrity.verify_record(record, str(repo), cache=cache)
+        assert (cache.hashed, cache.skipped) == (6, 0)
+        assert cache.files == {}
+
+    def test_removed_files_are_forgotten(self, repo, settled):
+        """Entries for deleted files are dropped; other versions' are kept."""
+        record = build(repo)
+        cache = integrity.HashCache({"/elsewhere/file": {"digest": "x"}})
+        integrity.verify_record(record, str(repo), cache=cache)
+        (repo / "archive" / "v1-canon" / "README.md").unlink()
+        integrity.verify_record(record, str(repo), cache=cache)
+        assert sorted(os.path.basename(p) for p in cache.files) == [
+            "file",
+            "launch.sh",
+            "level1.dat",
+        ]
+
+    def test_save_and_load(self, repo, settled, tmp_path):
+        """The cache survives a round trip; a damaged file loads empty."""
+        cache = integrity.HashCache()
+        integrity.verify_record(build(repo), str(repo), cache=cache)
+        path = tmp_path / "cache.json"
+        cache.save(str(path))
+        assert integrity.HashCache.load(str(path)).files == cache.files
+
+        path.write_text("{not json")
+        assert integrity.HashCache.load(str(path)).files == {}
+        assert integrity.HashCache.load(str(tmp_path / "missing")).files == {}
+
+
+class TestCommandLine:
+    """Tests for the build and verify commands."""
+
+    def test_build_then_verify(self, repo, capsys):
+        """verify exits 0 while the builds match and 1 once they don't."""
+        manifest = str(repo / "shareware.yml")
+        assert integrity.main(["build", "--manifest", manifest]) == 0
+        assert (repo / "shareware.integrity.json").exists()
+        assert "v2-placeholder: no build directory" in capsys.readouterr().out
+
+        assert integrity.main(["verify", "--manifest", manifest]) == 0
+        (repo / "archive" / "v1-canon" / "README.md").write_text("changed\n")
+        assert integrity.main(["verify", "--manifest", manifest]) == 1
+        assert "modified: README.md" in capsys.readouterr().out
+
+    def test_verify_without_record(self, repo, capsys):
+        """Verifying before building is an error."""
+        assert (
+            integrity.main(["verify", "--manifest", str(repo / "shareware.yml")]) == 2
+        )
+        assert "cannot read" in capsys.readouterr().err
+
+    def test_verify_reuses_the_cache(self, repo, capsys, monkeypatch):
+        """verify skips unchanged files unless --full is given."""
+        monkeypatch.setattr(integrity, "RACY_NS", 0)
+        manifest = str(repo / "shareware.yml")
+        integrity.main(["build", "--manifest", manifest])
+        assert "3 file(s) hashed, 0 unchanged" in capsys.readouterr().out
+
+        integrity.main(["verify", "--manifest", manifest])
+        assert "0 file(s) hashed, 3 unchanged" in capsys.readouterr().out
+        integrity.main(["verify", "--manifest", manifest, "--full"])
+        assert "3 file(s) hashed, 0 unchanged" in capsys.readouterr().out
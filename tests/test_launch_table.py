@@ -0,0 +1,101 @@
+"""Unit tests for launch_table.py - resolving shareware.yml for launching."""
+
+import os
+import sys
+
+import pytest
+
+# Add the repository root to the path so we can import the launch table
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from launch_table import LaunchTableError, build_launch_table  # noqa: E402
+from shareware_manifest import load_manifest  # noqa: E402
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def version(**fields):
+    info = {"path": "archive/v1-test", "entry": "src/main.py", "protected": True}
+    info.update(fields)
+    return info
+
+
+class TestBuildLaunchTable:
+    """Tests for turning a parsed manifest into launch targets."""
+
+    def test_keys_by_version_prefix(self):
+        """Targets are keyed by the catalog executable id (v1, v2, ...)."""
+        table = build_launch_table(
+            {"versions": {"v1-test": version(), "v2-other": version(protected=False)}},
+            "/repo",
+        )
+        assert sorted(table) == ["v1", "v2"]
+        assert table["v1"].version_id == "v1-test"
+        assert table["v1"].protected is True
+        assert table["v2"].protected is False
+
+    def test_explicit_executable_field(self):
+        """An 'executable' field overrides the id prefix."""
+        table = build_launch_table(
+            {"versions": {"mall-beta": version(executable="v7")}}, "/repo"
+        )
+        assert table["v7"].version_id == "mall-beta"
+
+    def test_paths_are_resolved_once(self):
+        """Build paths are absolute, and the entry runs from its own directory."""
+        target = build_launch_table({"versions": {"v1-test": version()}}, "/repo")["v1"]
+        assert target.path == os.path.normpath("/repo/archive/v1-test")
+        assert target.entry_path == os.path.normpath(
+            "/repo/archive/v1-test/src/main.py"
+        )
+        assert target.cwd == os.path.normpath("/repo/archive/v1-test/src")
+
+    def test_argv_by_entry_type(self):
+        """Python and shell entries get an interpreter, others run directly."""
+        table = build_launch_table(
+            {
+                "versions": {
+                    "v1-py": version(entry="src/main.py"),
+                    "v2-sh": version(entry="bin/launch.sh"),
+                    "v3-bin": version(entry="bin/game"),
+                }
+            },
+            "/repo",
+        )
+        assert table["v1"].argv() == [sys.executable, "main.py"]
+        assert table["v2"].argv() == ["/bin/sh", "launch.sh"]
+        assert table["v3"].argv() == [os.path.join(".", "game")]
+
+    def test_documentation_role(self):
+        """Documentation builds are flagged so they are shown, not run."""
+        table = build_launch_table(
+            {"versions": {"v5-docs": version(role="documentation")}}, "/repo"
+        )
+        assert table["v5"].is_docs
+
+    @pytest.mark.parametrize(
+        "manifest",
+        [
+            {},
+            {"versions": []},
+            {"versions": {"v1-test": {"entry": "x"}}},
+            {"versions": {"v1-test": {"path": "archive/v1"}}},
+            {"versions": {"v1-a": version(), "v1-b": version()}},
+        ],
+    )
+    def test_rejects_bad_manifests(self, manifest):
+        """Missing fields and clashing executable ids are errors."""
+        with pytest.raises(LaunchTableError):
+            build_launch_table(manifest, "/repo")
+
+
+class TestRepositoryManifest:
+    """Tests for the table built from the shipped manifest, as the launcher does."""
+
+    def test_repository_manifest(self):
+        """The shipped shareware.yml yields a target for every real program."""
+        manifest = load_manifest(os.path.join(REPO_ROOT, "shareware.yml"))
+        table = build_launch_table(manifest, manifest.base_dir)
+        assert sorted(table) == ["v1", "v2", "v3", "v4", "v5", "v6"]
+        assert table["v5"].is_docs
+        assert table["v1"].path == os.path.join(REPO_ROOT, "archive", "v1-doofenstein")
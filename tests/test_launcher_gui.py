@@ -0,0 +1,281 @@
+"""Tests for launcher_gui.py, driven through the headless curses backend."""
+
+import curses
+import os
+import sys
+import threading
+
+import pytest
+
+# Add the repository root and tools directory to the path so we can import
+# the launcher and the integrity tool
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "tools"))
+
+import integrity  # noqa: E402
+import launcher_gui  # noqa: E402
+from headless_curses import HeadlessCurses  # noqa: E402
+
+LINES, COLS = 30, 100
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path, monkeypatch):
+    """Keep catalog caches and snapshots out of the user's cache."""
+    monkeypatch.setattr(launcher_gui, "CATALOG_CACHE_DIR", str(tmp_path))
+
+
+def make_launcher(**options):
+    screen = HeadlessCurses(LINES, COLS)
+    return screen, launcher_gui.GUI_Launcher(screen.stdscr, backend=screen, **options)
+
+
+def loaded_launcher(**options):
+    screen, launcher = make_launcher(**options)
+    launcher.wait_for_catalog()
+    launcher.render()
+    return screen, launcher
+
+
+class TestStartup:
+    """Tests for the first frames."""
+
+    def test_first_frame_before_the_catalog(self):
+        """Without a snapshot the first frame says the catalog is loading."""
+        screen, launcher = make_launcher()
+        launcher.render()
+        assert screen.find("Loading Programs")
+        assert screen.find("Loading catalog...")
+
+    def test_loaded_catalog(self):
+        """The loaded catalog selects program 387."""
+        screen, launcher = loaded_launcher()
+        assert screen.find("500 Programs")
+        assert screen.find("► 387. GLITCHDEX MALL - Original")
+        assert screen.find("Status: ● INSTALLED")
+
+    def test_snapshot_feeds_the_next_first_frame(self):
+        """The next start draws the first page before loading anything."""
+        loaded_launcher()
+        screen, launcher = make_launcher()
+        launcher.render()
+        assert launcher.generator is None
+        assert screen.find("► 387. GLITCHDEX MALL - Original")
+
+    def test_profile_does_not_wait_for_the_index(self, monkeypatch):
+        """--profile-startup quits without waiting for the search index."""
+        import catalog_search
+
+        release = threading.Event()
+
+        def blocked_index(generator):
+            release.wait(10)
+
+        monkeypatch.setattr(catalog_search, "CatalogSearchIndex", blocked_index)
+        screen, launcher = make_launcher(profile_startup=True)
+        launcher.run()
+        assert launcher.loader.is_alive()
+        assert "full catalog frame" in launcher.profile.report()
+        release.set()
+        launcher.loader.join()
+
+
+class TestRendering:
+    """Tests for what each frame repaints."""
+
+    def test_navigation_repaints_list_and_info(self):
+        """Moving the selection redraws two regions and a few cells."""
+        screen, launcher = loaded_launcher()
+        launcher.handle_keys([curses.KEY_UP])
+        launcher.render()
+        seconds, regions, chars = launcher.frame_stats.last_frame
+        assert set(regions) == {"list", "info"}
+        assert chars < LINES * COLS // 10
+        assert screen.find("► 386.")
+
+    def test_full_redraw_repaints_everything(self):
+        """--full-redraw sends the whole screen on every frame."""
+        screen, launcher = loaded_launcher(full_redraw=True)
+        launcher.handle_keys([curses.KEY_UP])
+        launcher.render()
+        assert launcher.frame_stats.last_frame[2] == LINES * COLS
+
+    def test_frame_stats(self):
+        """Frame counts, per-region draws and characters are accumulated."""
+        screen, launcher = loaded_launcher()
+        stats = launcher.frame_stats
+        assert stats.frames == 1
+        assert stats.chars == screen.chars_written
+        assert stats.regions["list"][0] == 1
+        assert "1 frames" in stats.report()
+
+
+class TestScriptedInput:
+    """Tests for running the main loop on scripted input."""
+
+    def test_filter(self):
+        """Typing a filter lists the matches."""
+        screen, launcher = loaded_launcher()
+        screen.press("/", "w", "i", "n", "\n")
+        launcher.run()
+        assert screen.find("for 'win'")
+        assert launcher.view[launcher.selected_idx]["name"].startswith("CHAOS WIN")
+
+    def test_filter_before_the_index_is_built(self):
+        """Until the loader has built the index the catalog is scanned."""
+        screen, launcher = loaded_launcher()
+        assert launcher.search_index is not None
+        launcher.search_index = None
+        screen.press("/", "w", "i", "n", "\n")
+        launcher.run()
+        assert launcher.search_index is None
+        assert launcher.view[launcher.selected_idx]["name"].startswith("CHAOS WIN")
+
+    def test_lazy_catalog_is_not_indexed(self):
+        """Lazy catalogs are filtered by scanning, without building an index."""
+        screen, launcher = loaded_launcher(lazy=True, size=2000)
+        assert launcher.search_index is None
+        assert "build search index" not in launcher.profile.report()
+        screen.press("/", "w", "i", "n", "\n")
+        launcher.run()
+        assert screen.find("for 'win'")
+        assert "WIN" in launcher.view[launcher.selected_idx]["name"]
+
+    def test_click_selects_row(self):
+        """Clicking a list row selects that program."""
+        screen, launcher = loaded_launcher()
+        y, x = screen.find("386. ")
+        screen.click(y, x)
+        launcher.run()
+        assert launcher.selected_idx == 385
+
+    def test_quit(self):
+        """Q ends the main loop."""
+        screen, launcher = loaded_launcher()
+        screen.press("q", curses.KEY_DOWN)
+        launcher.run()
+        assert not launcher.running
+        assert curses.KEY_DOWN in screen.keys
+
+
+class TestLaunchSteps:
+    """Tests for the checks made before a build is launched."""
+
+    @pytest.fixture
+    def manifest(self, tmp_path, monkeypatch):
+        build = tmp_path / "archive" / "v1-canon" / "src"
+        build.mkdir(parents=True)
+        (build / "main.py").write_text("print('canon')\n")
+        path = tmp_path / "shareware.yml"
+        path.write_text(
+            "versions:\n  v1-canon:\n    path: archive/v1-canon\n"
+            "    entry: src/main.py\n    protected: true\n"
+        )
+        monkeypatch.setattr(launcher_gui, "MANIFEST_PATH", str(path))
+        return path
+
+    def run_steps(self, launcher):
+        steps = launcher._prepare_launch("v1")
+        labels = []
+        try:
+            while True:
+                labels.append(next(steps))
+        except StopIteration as done:
+            return labels, done.value
+
+    def test_protected_build_is_verified(self, manifest):
+        """With an integrity record, protected builds are hashed first."""
+        screen, launcher = make_launcher()
+        labels, target = self.run_steps(launcher)
+        assert "Verifying build integrity" not in labels
+
+        record = integrity.build_record(
+            integrity.load_manifest(str(manifest)), str(manifest.parent)
+        )
+        integrity.save_record(integrity.record_path(str(manifest)), record)
+        screen, launcher = make_launcher()
+        labels, target = self.run_steps(launcher)
+        assert labels[-1] == "Verifying build integrity"
+        assert target.version_id == "v1-canon"
+
+    def test_modified_build_is_refused(self, manifest):
+        """A protected build that changed since its record is not launched."""
+        record = integrity.build_record(
+            integrity.load_manifest(str(manifest)), str(manifest.parent)
+        )
+        integrity.save_record(integrity.record_path(str(manifest)), record)
+        (manifest.parent / "archive" / "v1-canon" / "src" / "main.py").write_text(
+            "print('improved')\n"
+        )
+        screen, launcher = make_launcher()
+        with pytest.raises(launcher_gui.LaunchError, match="1 modified"):
+            self.run_steps(launcher)
+
+    def test_record_changes_are_picked_up(self, manifest):
+        """A rebuilt or deleted integrity record is read again."""
+        path = integrity.record_path(str(manifest))
+        record = integrity.build_record(
+            integrity.load_manifest(str(manifest)), str(manifest.parent)
+        )
+        integrity.save_record(path, record)
+        screen, launcher = make_launcher()
+        assert launcher.get_integrity_record() == record
+        assert launcher.get_integrity_record() is launcher.get_integrity_record()
+
+        (manifest.parent / "archive" / "v1-canon" / "src" / "main.py").write_text(
+            "print('improved')\n"
+        )
+        with pytest.raises(launcher_gui.LaunchError, match="1 modified"):
+            self.run_steps(launcher)
+        record = integrity.build_record(
+            integrity.load_manifest(str(manifest)), str(manifest.parent)
+        )
+        integrity.save_record(path, record)
+        assert launcher.get_integrity_record() == record
+        assert self.run_steps(launcher)[1].version_id == "v1-canon"
+
+        os.remove(path)
+        assert launcher.get_integrity_record() is None
+
+    def test_warm_pool_follows_the_record(self, manifest):
+        """Builds are verified before warming; stale workers are not used."""
+        path = integrity.record_path(str(manifest))
+        main = manifest.parent / "archive" / "v1-canon" / "src" / "main.py"
+
+        def record():
+            integrity.save_record(
+                path,
+                integrity.build_record(
+                    integrity.load_manifest(str(manifest)), str(manifest.parent)
+                ),
+            )
+
+        record()
+        main.write_text("print('improved')\n")
+        screen, launcher = make_launcher(warm=True)
+        launcher.wait_for_catalog()
+        try:
+            assert len(launcher.warm_pool) == 0
+
+            record()
+            launcher.warm_pool.refill()
+            assert len(launcher.warm_pool) == 1
+            target = launcher.get_launch_table()["v1"]
+            main.write_text("print('improved again')\n")
+            record()
+            assert self.run_steps(launcher)[1] == target
+            assert (
+                launcher.warm_pool.take(target, launcher.recorded_root(target)) is None
+            )
+        finally:
+            launcher.warm_pool.close()
+
+    def test_manifest_edits_are_picked_up(self, manifest):
+        """The launch table follows shareware.yml without a restart."""
+        screen, launcher = make_launcher()
+        table = launcher.get_launch_table()
+        assert launcher.get_launch_table() is table
+        manifest.write_text(
+            manifest.read_text().replace("entry: src/main.py", "entry: src/new.py")
+        )
+        assert launcher.get_launch_table()["v1"].entry == "src/new.py"
@@ -1,6 +1,7 @@
 """Integration tests for shareware.yml manifest validation."""
 
 import os
+import sys
 
 import pytest
 import yaml
@@ -10,6 +11,11 @@ REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 MANIFEST_PATH = os.path.join(REPO_ROOT, "shareware.yml")
 ARCHIVE_DIR = os.path.join(REPO_ROOT, "archive")
 
+# Add the repository root to the path so we can import the loader
+sys.path.insert(0, REPO_ROOT)
+
+from shareware_manifest import load_manifest  # noqa: E402
+
 
 class TestManifestExists:
     """Tests verifying the manifest file exists and is valid."""
@@ -57,6 +63,10 @@ class TestManifestStructure:
         for vid, info in manifest["versions"].items():
             assert "path" in info, f"Version '{vid}' is missing 'path' field"
 
+    def test_matches_schema(self):
+        """The manifest passes the loader's schema validation."""
+        assert load_manifest(MANIFEST_PATH, use_cache=False).versions
+
     def test_each_version_has_protected_field(self, manifest):
         """Each version should have an explicit 'protected' field."""
         for vid, info in manifest["versions"].items():
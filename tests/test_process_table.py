@@ -0,0 +1,81 @@
+"""Unit tests for process_table.py - launching and tracking builds."""
+
+import os
+import sys
+import time
+
+# Add the repository root to the path so we can import the process table
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from process_table import ProcessTable  # noqa: E402
+
+
+def python(code):
+    """argv running a snippet in the current interpreter."""
+    return [sys.executable, "-c", code]
+
+
+def wait_for_exit(table, timeout=10):
+    """Poll the table until nothing is running."""
+    deadline = time.monotonic() + timeout
+    while table.running() and time.monotonic() < deadline:
+        table.poll()
+        time.sleep(0.01)
+
+
+class TestForeground:
+    """Tests for run(), which waits for the build."""
+
+    def test_records_exit_code_and_time(self):
+        """The finished entry keeps its PID, exit code and wall time."""
+        table = ProcessTable()
+        entry = table.run("v1", python("raise SystemExit(3)"))
+        assert not entry.running
+        assert entry.returncode == 3
+        assert entry.status() == "exit 3"
+        assert entry.pid > 0
+        assert entry.wall_time() > 0
+        assert list(table) == [entry]
+
+    def test_argv_is_not_shell_parsed(self, tmp_path):
+        """Arguments reach the program verbatim, with cwd applied."""
+        table = ProcessTable()
+        code = "import os, sys; open('out', 'w').write(sys.argv[1] + os.getcwd())"
+        entry = table.run("v2", python(code) + ["a; echo b"], cwd=str(tmp_path))
+        assert entry.returncode == 0
+        assert (tmp_path / "out").read_text() == "a; echo b" + str(tmp_path)
+
+
+class TestBackground:
+    """Tests for start(), which returns while the build runs."""
+
+    def test_tracks_running_process(self, tmp_path):
+        """start() returns at once and poll() notices the exit."""
+        table = ProcessTable(log_dir=str(tmp_path))
+        entry = table.start("v3", python("import time; time.sleep(0.2)"))
+        assert entry.running
+        assert entry.status() == "running"
+        assert table.running() == [entry]
+
+        wait_for_exit(table)
+        assert entry.returncode == 0
+        assert entry.wall_time() >= 0.2
+        frozen = entry.wall_time()
+        time.sleep(0.01)
+        assert entry.wall_time() == frozen
+
+    def test_output_goes_to_log(self, tmp_path):
+        """Background output is written to a per-launch log file."""
+        table = ProcessTable(log_dir=str(tmp_path / "logs"))
+        entry = table.start("v4", python("print('hello from v4')"))
+        wait_for_exit(table)
+        assert os.path.dirname(entry.log_path) == str(tmp_path / "logs")
+        with open(entry.log_path) as f:
+            assert f.read() == "hello from v4\n"
+
+    def test_prunes_old_finished_entries(self):
+        """Only the most recent finished entries are kept."""
+        table = ProcessTable(max_finished=2)
+        for i in range(4):
+            table.run(f"v{i}", python("pass"))
+        assert [e.label for e in table] == ["v2", "v3"]
@@ -0,0 +1,442 @@
+"""Unit tests for shareware_gen_v2.py - catalog generation and lookups."""
+
+import csv
+import io
+import json
+import os
+import random
+import sys
+
+import pytest
+
+# Add the repository root to the path so we can import the generator
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import shareware_catalog  # noqa: E402
+from catalog_export import read_columnar, write_columnar  # noqa: E402
+from shareware_catalog import (  # noqa: E402
+    FIELDS,
+    MappedProgramCatalog,
+    ProgramCatalog,
+    load_catalog,
+    save_catalog,
+)
+from shareware_gen_v2 import SharewareGeneratorV2  # noqa: E402
+
+
+class TestIndexedLookups:
+    """Tests for the number, genre and installed-status indexes."""
+
+    def test_get_program_by_number(self):
+        """Every program is reachable by its number."""
+        gen = SharewareGeneratorV2(seed=42)
+        for prog in gen.get_all_programs():
+            assert gen.get_program(prog["number"]) is prog
+
+    def test_get_program_missing_number(self):
+        """Unknown numbers return None."""
+        gen = SharewareGeneratorV2(seed=42)
+        assert gen.get_program(0) is None
+        assert gen.get_program(501) is None
+
+    def test_genre_view_matches_scan(self):
+        """Genre views list the same programs, in order, as a linear scan."""
+        gen = SharewareGeneratorV2(seed=42)
+        for genre in ("game", "documentation", "utility"):
+            expected = [p for p in gen.get_all_programs() if p["genre"] == genre]
+            view = gen.get_programs_by_genre(genre)
+            assert view == expected
+            assert view == tuple(expected)
+            assert view != expected[1:]
+            assert view != "game"
+
+    def test_real_programs(self):
+        """The six GLITCHDEX MALL builds are the installed programs."""
+        gen = SharewareGeneratorV2(seed=42)
+        real = gen.get_real_programs()
+        assert [p["number"] for p in real] == [387, 388, 389, 390, 391, 392]
+        assert real[0]["executable"] == "v1"
+
+    def test_replace_program_updates_indexes(self):
+        """Replacing a program moves it between genre and installed indexes."""
+        gen = SharewareGeneratorV2(seed=42)
+        real = gen.get_real_programs()
+        replacement = dict(gen.get_program(391), genre="demo", is_real=False)
+
+        gen.add_program(replacement)
+
+        assert gen.get_program(391) is replacement
+        assert len(gen.get_all_programs()) == 500
+        assert 391 not in [p["number"] for p in real]
+        assert replacement in gen.get_programs_by_genre("demo")
+        assert list(gen.get_programs_by_genre("documentation")) == []
+
+    def test_add_program_appends(self):
+        """New numbers are appended and indexed."""
+        gen = SharewareGeneratorV2(seed=42)
+        prog = {
+            "number": 501,
+            "name": "GLITCHDEX MALL - Bonus Disc",
+            "genre": "game",
+            "version": "1.0",
+            "executable": "v7",
+            "is_real": True,
+            "description": "Bonus content",
+        }
+
+        gen.add_program(prog)
+
+        assert gen.get_program(501) is prog
+        assert gen.get_real_programs()[-1] is prog
+        assert gen.get_programs_by_genre("game")[-1] is prog
+
+    def test_view_of_a_new_genre_is_live(self):
+        """A view taken before any program has the genre sees later additions."""
+        gen = SharewareGeneratorV2(seed=42)
+        view = gen.get_programs_by_genre("edutainment")
+        assert len(view) == 0
+        prog = dict(gen.get_program(12), number=501, genre="edutainment")
+        gen.add_program(prog)
+        assert len(view) == 1
+        assert view[0] is prog
+
+
+class TestCompactCatalog:
+    """Tests for the columnar ProgramCatalog representation."""
+
+    def test_compact_rows_match_dicts(self):
+        """Compact rows compare equal to the list-of-dicts programs."""
+        plain = SharewareGeneratorV2(seed=7)
+        compact = SharewareGeneratorV2(seed=7, compact=True)
+
+        assert isinstance(compact.get_all_programs(), ProgramCatalog)
+        assert len(compact.get_all_programs()) == 500
+        for a, b in zip(plain.get_all_programs(), compact.get_all_programs()):
+            assert dict(b) == a
+
+    def test_compact_lookups(self):
+        """Indexed lookups work over the compact catalog."""
+        gen = SharewareGeneratorV2(seed=7, compact=True)
+
+        prog = gen.get_program(389)
+        assert prog["name"] == "EASTLAND MALL - Graphical Engine"
+        assert prog.get("executable") == "v3"
+        assert gen.get_program(12)["executable"] == "prog_12.exe"
+        assert [p["number"] for p in gen.get_real_programs()][0] == 387
+
+    def test_compact_replace(self):
+        """Rows can be replaced in place through add_program."""
+        gen = SharewareGeneratorV2(seed=7, compact=True)
+        replacement = dict(gen.get_program(392), is_real=False)
+
+        gen.add_program(replacement)
+
+        assert gen.get_program(392)["is_real"] is False
+        assert gen.get_program(391)["is_real"] is True
+        assert len(gen.get_real_programs()) == 5
+
+    def test_row_proxy_has_no_dict(self):
+        """Row proxies use __slots__ and carry no per-instance dict."""
+        row = SharewareGeneratorV2(seed=7, compact=True).get_program(1)
+        assert not hasattr(row, "__dict__")
+
+
+class TestCatalogSize:
+    """Tests for configurable catalog sizes and lazy generation."""
+
+    def test_size_parameter(self):
+        """The catalog has exactly `size` programs."""
+        gen = SharewareGeneratorV2(seed=3, size=1200)
+        assert len(gen.get_all_programs()) == 1200
+        assert gen.get_program(1200)["number"] == 1200
+        assert gen.get_program(1201) is None
+
+    def test_small_catalog_has_no_real_programs(self):
+        """Catalogs that stop before #387 contain no GLITCHDEX MALL builds."""
+        gen = SharewareGeneratorV2(seed=3, size=100)
+        assert list(gen.get_real_programs()) == []
+
+    def test_lazy_random_access_is_deterministic(self):
+        """Program N is the same regardless of access order."""
+        gen = SharewareGeneratorV2(seed=3, size=10**7, lazy=True)
+        later = gen.get_program(9_999_999)
+        first = gen.get_program(1)
+
+        again = SharewareGeneratorV2(seed=3, size=10**7, lazy=True)
+        assert again.get_program(1) == first
+        assert again.get_program(9_999_999) == later
+        assert len(again.get_all_programs()) == 10**7
+
+    def test_lazy_sequence_matches_iteration(self):
+        """Indexing and iterating a lazy catalog agree."""
+        gen = SharewareGeneratorV2(seed=3, size=600, lazy=True)
+        programs = gen.get_all_programs()
+        assert list(gen.iter_programs()) == [programs[i] for i in range(600)]
+        assert programs[-1]["number"] == 600
+
+    def test_lazy_lookups(self):
+        """Genre and installed lookups work without materialising the catalog."""
+        gen = SharewareGeneratorV2(seed=3, size=600, lazy=True)
+        assert [p["number"] for p in gen.get_real_programs()] == list(range(387, 393))
+        docs = gen.get_programs_by_genre("documentation")
+        assert len(docs) == 1
+        assert docs[0]["number"] == 391
+        assert docs == [gen.get_program(391)]
+
+    def test_lazy_catalog_is_read_only(self):
+        """Lazy catalogs refuse add_program."""
+        gen = SharewareGeneratorV2(seed=3, size=600, lazy=True)
+        with pytest.raises(TypeError):
+            gen.add_program(gen.get_program(1))
+
+    def test_export_header_uses_size(self):
+        """The exported listing reports the configured size."""
+        text = SharewareGeneratorV2(seed=3, size=20, lazy=True).export_catalog()
+        assert "20 Programs" in text
+        assert "PROGRAM LISTING (Programs 1-20)" in text
+        assert text.count("\n 20. ") == 1
+
+
+class TestIsolatedRandomness:
+    """Tests for per-instance and counter-based random streams."""
+
+    def test_seed_zero_is_reproducible(self):
+        """seed=0 is a real seed, not 'no seed'."""
+        a = SharewareGeneratorV2(seed=0).get_all_programs()
+        b = SharewareGeneratorV2(seed=0).get_all_programs()
+        assert a == b
+
+    def test_generators_do_not_share_state(self):
+        """Using one generator's RNG does not change another's results."""
+        expected = SharewareGeneratorV2(seed=11).get_random_programs(5)
+
+        a = SharewareGeneratorV2(seed=11)
+        b = SharewareGeneratorV2(seed=12)
+        b.get_random_programs(50)
+        random.seed(99)
+        assert a.get_random_programs(5) == expected
+
+    def test_global_rng_untouched(self):
+        """Constructing a generator leaves the global RNG alone."""
+        random.seed(5)
+        expected = random.random()
+        random.seed(5)
+        SharewareGeneratorV2(seed=1)
+        assert random.random() == expected
+
+    def test_counter_mode_matches_lazy(self):
+        """Eager counter-mode catalogs equal lazy catalogs for the same seed."""
+        eager = SharewareGeneratorV2(seed="mall", size=800, counter=True)
+        lazy = SharewareGeneratorV2(seed="mall", size=800, lazy=True)
+        assert eager.get_all_programs() == list(lazy.iter_programs())
+
+    def test_counter_mode_out_of_order(self):
+        """Program N does not depend on which programs were generated first."""
+        gen = SharewareGeneratorV2(seed=21, size=1000, lazy=True)
+        backwards = [gen.get_program(n) for n in range(1000, 0, -1)]
+        assert backwards[::-1] == list(gen.iter_programs())
+
+
+class TestParallelGeneration:
+    """Tests for multi-process generate(workers=N)."""
+
+    def test_parallel_matches_serial(self):
+        """Sharded generation produces the serial catalog."""
+        serial = SharewareGeneratorV2(seed=8, size=2000, counter=True)
+        parallel = SharewareGeneratorV2(seed=8, size=2000, counter=True, workers=2)
+        assert parallel.get_all_programs() == serial.get_all_programs()
+        assert list(parallel.get_real_programs()) == list(serial.get_real_programs())
+
+    def test_parallel_compact_matches_serial(self):
+        """Compact shards merge into the same catalog as serial generation."""
+        serial = SharewareGeneratorV2(seed=8, size=2000, counter=True)
+        parallel = SharewareGeneratorV2(
+            seed=8, size=2000, counter=True, compact=True, workers=2
+        )
+        assert [dict(p) for p in parallel.get_all_programs()] == list(
+            serial.get_all_programs()
+        )
+        assert parallel.get_program(391)["genre"] == "documentation"
+
+    def test_parallel_requires_counter_mode(self):
+        """The sequential random stream cannot be split across processes."""
+        gen = SharewareGeneratorV2(seed=8)
+        with pytest.raises(ValueError):
+            gen.generate(workers=2)
+
+    def test_regenerate_is_stable(self):
+        """Calling generate() again rebuilds the same catalog."""
+        gen = SharewareGeneratorV2(seed=8)
+        before = list(gen.get_all_programs())
+        gen.get_random_programs(10)
+        gen.generate()
+        assert gen.get_all_programs() == before
+
+
+class TestCatalogExport:
+    """Tests for the streaming catalog export."""
+
+    def test_stream_matches_string_export(self):
+        """export_catalog_to writes exactly what export_catalog returns."""
+        gen = SharewareGeneratorV2(seed=5)
+        buffer = io.StringIO()
+        gen.export_catalog_to(buffer)
+        assert buffer.getvalue() == gen.export_catalog()
+
+    def test_writes_are_batched(self):
+        """Rows are written in batches no larger than batch_size."""
+
+        class RecordingFile:
+            def __init__(self):
+                self.writes = []
+
+            def write(self, text):
+                self.writes.append(text)
+
+        out = RecordingFile()
+        SharewareGeneratorV2(seed=5, size=1000, lazy=True).export_catalog_to(
+            out, batch_size=64
+        )
+
+        rows = [w.count("\n") for w in out.writes[1:]]
+        assert max(rows) == 64
+        assert sum(rows) == 1000
+        assert len(out.writes) == 1 + 16
+
+
+class TestCatalogCache:
+    """Tests for the memory-mapped binary catalog cache."""
+
+    def test_cache_round_trip(self, tmp_path):
+        """A cached catalog loads back identical to the generated one."""
+        fresh = SharewareGeneratorV2(seed=12, size=900, cache_dir=str(tmp_path))
+        assert os.path.exists(fresh.cache_path(str(tmp_path)))
+
+        cached = SharewareGeneratorV2(seed=12, size=900, cache_dir=str(tmp_path))
+        assert isinstance(cached.get_all_programs(), MappedProgramCatalog)
+        assert [dict(p) for p in cached.get_all_programs()] == list(
+            fresh.get_all_programs()
+        )
+        assert cached.export_catalog() == fresh.export_catalog()
+
+    def test_cached_lookups_are_lazy(self, tmp_path):
+        """Loading builds no indexes until a genre or installed query."""
+        SharewareGeneratorV2(seed=12, cache_dir=str(tmp_path))
+        cached = SharewareGeneratorV2(seed=12, cache_dir=str(tmp_path))
+
+        assert cached.get_program(389)["executable"] == "v3"
+        assert not cached._indexed
+        assert [p["number"] for p in cached.get_real_programs()][-1] == 392
+        assert cached._indexed
+
+    def test_cache_keyed_by_seed_and_size(self, tmp_path):
+        """Different seeds and sizes use different cache files."""
+        a = SharewareGeneratorV2(seed=1, size=600, cache_dir=str(tmp_path))
+        b = SharewareGeneratorV2(seed=2, size=600, cache_dir=str(tmp_path))
+        c = SharewareGeneratorV2(seed=1, size=700, cache_dir=str(tmp_path))
+        paths = {g.cache_path(str(tmp_path)) for g in (a, b, c)}
+        assert len(paths) == 3
+
+    def test_stale_cache_is_rebuilt(self, tmp_path):
+        """A fingerprint mismatch or corrupt file triggers regeneration."""
+        gen = SharewareGeneratorV2(seed=12, size=600, cache_dir=str(tmp_path))
+        path = gen.cache_path(str(tmp_path))
+        expected = [dict(p) for p in gen.get_all_programs()]
+
+        save_catalog(path, expected[:10], b"\0" * 32)
+        rebuilt = SharewareGeneratorV2(seed=12, size=600, cache_dir=str(tmp_path))
+        assert [dict(p) for p in rebuilt.get_all_programs()] == expected
+        rebuilt.get_all_programs().close()
+
+        with open(path, "r+b") as f:
+            f.truncate(100)
+        rebuilt = SharewareGeneratorV2(seed=12, size=600, cache_dir=str(tmp_path))
+        assert [dict(p) for p in rebuilt.get_all_programs()] == expected
+        assert len(load_catalog(path)) == 600
+
+    def test_failed_save_leaves_no_file(self, tmp_path):
+        """An error while writing removes the partial file."""
+        path = tmp_path / "catalog.gzc"
+        programs = list(SharewareGeneratorV2(seed=12, size=20).get_all_programs())
+        programs[10] = {"number": 11}
+        with pytest.raises(KeyError):
+            save_catalog(str(path), programs, b"\0" * 32)
+        assert list(tmp_path.iterdir()) == []
+
+    def test_decoded_strings_are_bounded(self, tmp_path, monkeypatch):
+        """Reading every row keeps only the most recent strings decoded."""
+        monkeypatch.setattr(shareware_catalog, "STRING_CACHE_SIZE", 16)
+        path = str(tmp_path / "catalog.gzc")
+        expected = list(SharewareGeneratorV2(seed=12, size=600).get_all_programs())
+        save_catalog(path, expected, b"\0" * 32)
+        with load_catalog(path) as catalog:
+            assert [dict(p) for p in catalog] == expected
+            assert catalog.strings._cached.cache_info().currsize == 16
+
+    def test_cached_catalog_is_read_only(self, tmp_path):
+        """Mapped catalogs refuse add_program."""
+        SharewareGeneratorV2(seed=12, cache_dir=str(tmp_path))
+        cached = SharewareGeneratorV2(seed=12, cache_dir=str(tmp_path))
+        with pytest.raises(TypeError):
+            cached.add_program(dict(cached.get_program(1)))
+
+    def test_first_run_matches_later_runs(self, tmp_path):
+        """Whether or not the cache file exists yet, the catalog is the same."""
+        runs = [
+            SharewareGeneratorV2(seed=12, compact=True, cache_dir=str(tmp_path))
+            for _ in range(2)
+        ]
+        for gen in runs:
+            assert isinstance(gen.get_all_programs(), MappedProgramCatalog)
+            with pytest.raises(TypeError):
+                gen.add_program(dict(gen.get_program(1)))
+        first, second = (gen.get_all_programs() for gen in runs)
+        assert [dict(p) for p in first] == [dict(p) for p in second]
+
+    def test_unwritable_cache_is_still_read_only(self, tmp_path):
+        """If the cache cannot be written the catalog runs from memory, unchanged."""
+        blocked = tmp_path / "file"
+        blocked.write_text("not a directory\n")
+        gen = SharewareGeneratorV2(seed=12, size=600, cache_dir=str(blocked))
+        assert len(gen.get_all_programs()) == 600
+        with pytest.raises(TypeError):
+            gen.add_program(dict(gen.get_program(1)))
+
+
+class TestExportFormats:
+    """Tests for the JSON Lines, CSV and columnar exporters."""
+
+    def test_jsonl(self):
+        """One JSON object per program, in catalog order."""
+        gen = SharewareGeneratorV2(seed=5, size=600, lazy=True)
+        buffer = io.StringIO()
+        gen.export_to(buffer, "jsonl")
+
+        lines = buffer.getvalue().splitlines()
+        assert len(lines) == 600
+        assert json.loads(lines[390]) == gen.get_program(391)
+
+    def test_csv(self):
+        """CSV has a header row and one row per program."""
+        gen = SharewareGeneratorV2(seed=5, size=600, lazy=True)
+        buffer = io.StringIO(newline="")
+        gen.export_to(buffer, "csv")
+
+        rows = list(csv.reader(io.StringIO(buffer.getvalue())))
+        assert tuple(rows[0]) == FIELDS
+        assert len(rows) == 601
+        assert rows[387][1] == "GLITCHDEX MALL - Original"
+
+    def test_columnar_round_trip(self):
+        """Columnar files read back to the exported rows across row groups."""
+        gen = SharewareGeneratorV2(seed=5, size=600, compact=True)
+        buffer = io.BytesIO()
+        write_columnar(gen.iter_rows(), buffer, row_group_size=128)
+
+        buffer.seek(0)
+        assert list(read_columnar(buffer)) == list(gen.iter_rows())
+
+    def test_unknown_format(self):
+        """Unknown formats are rejected."""
+        with pytest.raises(ValueError):
+            SharewareGeneratorV2(seed=5).export_to(io.StringIO(), "xml")
@@ -0,0 +1,143 @@
+"""Unit tests for shareware_manifest.py - loading and validating shareware.yml."""
+
+import os
+import sys
+
+import pytest
+
+# Add the repository root to the path so we can import the loader
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import shareware_manifest  # noqa: E402
+from shareware_manifest import (  # noqa: E402
+    ManifestError,
+    load_manifest,
+    parse_manifest,
+)
+
+MANIFEST = """\
+versions:
+  v1-canon:
+    path: archive/v1-canon
+    entry: bin/launch.sh
+    protected: true
+  v2-lab:
+    path: archive/v2-lab
+    executable: 7
+    protected: false
+"""
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    shareware_manifest.clear_cache()
+    yield
+    shareware_manifest.clear_cache()
+
+
+@pytest.fixture
+def manifest_path(tmp_path):
+    path = tmp_path / "shareware.yml"
+    path.write_text(MANIFEST)
+    return path
+
+
+class TestParseManifest:
+    """Tests for validating parsed YAML against the schema."""
+
+    def test_typed_records(self):
+        """Versions become Version records with defaults filled in."""
+        manifest = parse_manifest(
+            {"versions": {"v1-canon": {"path": "archive/v1", "protected": True}}}
+        )
+        (version,) = manifest.versions.values()
+        assert version.version_id == "v1-canon"
+        assert version.path == "archive/v1"
+        assert version.protected is True
+        assert version.placeholder is False
+        assert version.entry == ""
+        assert manifest.protected() == ["v1-canon"]
+        with pytest.raises(TypeError):
+            manifest.versions["v2"] = version
+
+    @pytest.mark.parametrize(
+        "data, message",
+        [
+            (None, "no 'versions' mapping"),
+            ({"versions": ["v1"]}, "no 'versions' mapping"),
+            ({"versions": {1: {"path": "a"}}}, "must be a string"),
+            ({"versions": {"v1": "archive/v1"}}, "must be a mapping"),
+            ({"versions": {"v1": {"entry": "x"}}}, "has no path"),
+            ({"versions": {"v1": {"path": "a", "protect": True}}}, "'protect'"),
+            ({"versions": {"v1": {"path": "a", "protected": "yes"}}}, "must be bool"),
+            ({"versions": {"v1": {"path": "a", "executable": True}}}, "str or int"),
+            ({"versions": {"v1": {"path": "../elsewhere"}}}, "inside the manifest"),
+            ({"versions": {"v1": {"path": "/srv/builds"}}}, "inside the manifest"),
+        ],
+    )
+    def test_rejects(self, data, message):
+        """Structure, field names, types and paths are all checked."""
+        with pytest.raises(ManifestError, match=message):
+            parse_manifest(data)
+
+
+class TestLoadManifest:
+    """Tests for reading manifest files."""
+
+    def test_load(self, manifest_path):
+        """A file is parsed into a Manifest that knows its directory."""
+        manifest = load_manifest(str(manifest_path))
+        assert list(manifest.versions) == ["v1-canon", "v2-lab"]
+        assert manifest.versions["v2-lab"].executable == 7
+        assert manifest.base_dir == str(manifest_path.parent)
+
+    def test_errors(self, tmp_path):
+        """Missing files and invalid YAML raise ManifestError."""
+        with pytest.raises(ManifestError, match="cannot read"):
+            load_manifest(str(tmp_path / "missing.yml"))
+        path = tmp_path / "shareware.yml"
+        path.write_text("versions: [unclosed\n")
+        with pytest.raises(ManifestError, match="not valid YAML"):
+            load_manifest(str(path))
+
+    def test_pure_python_parser(self, manifest_path, monkeypatch):
+        """Without libyaml the pure Python SafeLoader is used."""
+        import yaml
+
+        monkeypatch.delattr(yaml, "CSafeLoader", raising=False)
+        assert "v1-canon" in load_manifest(str(manifest_path)).versions
+
+
+class TestCache:
+    """Tests for reusing earlier parses."""
+
+    def test_unchanged_file_is_not_read(self, manifest_path, monkeypatch):
+        """A settled, unchanged file returns the same Manifest from a stat()."""
+        monkeypatch.setattr(shareware_manifest, "RACY_NS", 0)
+        first = load_manifest(str(manifest_path))
+        # Reading the file would hash it
+        monkeypatch.setattr(shareware_manifest, "hashlib", None)
+        assert load_manifest(str(manifest_path)) is first
+
+    def test_recent_file_is_read_again(self, manifest_path, monkeypatch):
+        """A file written just before it was parsed is read (not parsed) again."""
+        first = load_manifest(str(manifest_path))
+        monkeypatch.setattr(shareware_manifest, "_parse_yaml", None)
+        assert load_manifest(str(manifest_path)) is first
+
+    def test_edits_are_parsed(self, manifest_path):
+        """Changed contents give a new Manifest."""
+        first = load_manifest(str(manifest_path))
+        manifest_path.write_text(
+            MANIFEST.replace("protected: false", "protected: true")
+        )
+        second = load_manifest(str(manifest_path))
+        assert second is not first
+        assert second.protected() == ["v1-canon", "v2-lab"]
+
+    def test_cache_can_be_bypassed(self, manifest_path, monkeypatch):
+        """use_cache=False always parses."""
+        load_manifest(str(manifest_path))
+        monkeypatch.setattr(shareware_manifest, "_parse_yaml", None)
+        with pytest.raises(TypeError):
+            load_manifest(str(manifest_path), use_cache=False)
@@ -0,0 +1,117 @@
+"""Unit tests for warm_pool.py - pre-imported interpreters for builds."""
+
+import os
+import sys
+
+import pytest
+
+# Add the repository root to the path so we can import the pool
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from launch_table import build_launch_table  # noqa: E402
+from warm_pool import WarmPool, imported_modules  # noqa: E402
+
+ENTRY = """\
+import os
+import sys
+print("decimal" in sys.modules, sys.argv[0], os.getcwd(), sys.path[0])
+import decimal
+from xml.dom import minidom
+raise SystemExit(5)
+"""
+
+
+@pytest.fixture
+def target(tmp_path):
+    """A launch target whose entry reports what was preloaded."""
+    src = tmp_path / "archive" / "v1-test" / "src"
+    src.mkdir(parents=True)
+    (src / "main.py").write_text(ENTRY)
+    manifest = {
+        "versions": {"v1-test": {"path": "archive/v1-test", "entry": "src/main.py"}}
+    }
+    return build_launch_table(manifest, str(tmp_path))["v1"]
+
+
+class TestWarmPool:
+    """Tests for warming, handing out and dismissing workers."""
+
+    def test_imported_modules(self, target):
+        """Absolute imports are collected in order, once each."""
+        assert imported_modules(target.entry_path) == [
+            "os",
+            "sys",
+            "decimal",
+            "xml.dom",
+        ]
+
+    def test_worker_runs_preloaded_entry(self, target, tmp_path):
+        """A taken worker runs the entry as __main__ with its imports loaded."""
+        pool = WarmPool([target])
+        try:
+            worker = pool.take(target)
+            assert worker is not None
+            assert worker.wait_ready(30)
+            log = tmp_path / "run.log"
+            assert worker.start(str(log)).wait(30) == 5
+        finally:
+            pool.close()
+
+        preloaded, argv0, cwd, path0 = log.read_text().split()
+        assert preloaded == "True"
+        assert argv0 == "main.py"
+        assert cwd == path0 == target.cwd
+
+    def test_take_empties_until_refill(self, target):
+        """Workers are single use; refill() warms a replacement."""
+        pool = WarmPool([target])
+        try:
+            first = pool.take(target)
+            assert pool.take(target) is None
+            pool.refill()
+            assert len(pool) == 1
+            first.close()
+        finally:
+            pool.close()
+
+    def test_unwarmable_targets_are_skipped(self, tmp_path):
+        """Documentation, non-Python and missing entries get no worker."""
+        manifest = {
+            "versions": {
+                "v1-docs": {"path": "a", "entry": "index.md", "role": "documentation"},
+                "v2-shell": {"path": "b", "entry": "launch.sh"},
+                "v3-missing": {"path": "c", "entry": "main.py"},
+            }
+        }
+        pool = WarmPool(build_launch_table(manifest, str(tmp_path)).values())
+        assert len(pool) == 0
+
+    def test_failed_check_keeps_the_build_cold(self, target, tmp_path):
+        """A build that fails the pool's check is never preloaded."""
+        marker = tmp_path / "imported"
+        (tmp_path / "archive" / "v1-test" / "src" / "tampered.py").write_text(
+            f"open({str(marker)!r}, 'w').close()\n"
+        )
+        (tmp_path / "archive" / "v1-test" / "src" / "main.py").write_text(
+            "import tampered\n"
+        )
+
+        def refuse(target):
+            raise ValueError("modified")
+
+        pool = WarmPool([target], check=refuse)
+        assert len(pool) == 0
+        assert pool.take(target) is None
+        assert not marker.exists()
+
+    def test_worker_from_another_check_is_dismissed(self, target):
+        """take() only hands out a worker warmed under the same key."""
+        pool = WarmPool([target], check=lambda target: "root-1")
+        try:
+            assert pool.take(target, "root-2") is None
+            pool.refill()
+            worker = pool.take(target, "root-1")
+            assert worker is not None and worker.key == "root-1"
+            worker.close()
+        finally:
+            pool.close()
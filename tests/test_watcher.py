@@ -0,0 +1,99 @@
+"""Unit tests for watcher.py - change notifications for directory trees."""
+
+import os
+import sys
+import threading
+
+import pytest
+
+# Add the tools directory to the path so we can import from it
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "tools"))
+
+import watcher  # noqa: E402
+
+
+def inotify_watcher(roots):
+    try:
+        return watcher.InotifyWatcher(roots)
+    except (AttributeError, OSError):
+        pytest.skip("inotify is not available")
+
+
+@pytest.fixture
+def tree(tmp_path):
+    root = tmp_path / "build"
+    (root / "sub").mkdir(parents=True)
+    (root / "a.txt").write_text("a\n")
+    (root / "sub" / "b.txt").write_text("b\n")
+    return root
+
+
+class TestInotifyWatcher:
+    """Tests for kernel change notifications."""
+
+    def test_changes_are_reported(self, tree):
+        """Writes, creates and deletes anywhere in the tree are seen."""
+        with inotify_watcher([str(tree)]) as changes:
+            (tree / "a.txt").write_text("changed\n")
+            (tree / "sub" / "b.txt").unlink()
+            (tree / "sub" / "c.txt").write_text("c\n")
+            paths, _ = changes.collect()
+        assert paths == {
+            str(tree / "a.txt"),
+            str(tree / "sub" / "b.txt"),
+            str(tree / "sub" / "c.txt"),
+        }
+
+    def test_new_directories_are_watched(self, tree):
+        """Files in a directory created after the watch began are seen."""
+        with inotify_watcher([str(tree)]) as changes:
+            (tree / "new").mkdir()
+            assert changes.collect()[0] == {str(tree / "new")}
+            (tree / "new" / "file").write_text("x\n")
+            assert changes.collect()[0] == {str(tree / "new" / "file")}
+
+    def test_bursts_are_one_batch(self, tree):
+        """Events closer together than the debounce time are batched."""
+        with inotify_watcher([str(tree)]) as changes:
+            for i in range(50):
+                (tree / f"{i}.txt").write_text("x\n")
+            paths, _ = changes.collect()
+            assert len(paths) == 50
+            assert changes.read(0) == set()
+
+    def test_removed_root_is_watched_again(self, tree):
+        """A root that is deleted and recreated is reported and watched."""
+        with inotify_watcher([str(tree)]) as changes:
+            (tree / "sub" / "b.txt").unlink()
+            (tree / "sub").rmdir()
+            (tree / "a.txt").unlink()
+            tree.rmdir()
+            assert str(tree) in changes.collect()[0]
+            # Recreated while collect() waits, with nothing else happening
+            threading.Timer(0.1, tree.mkdir).start()
+            assert changes.collect()[0] == {str(tree)}
+            (tree / "a.txt").write_text("back\n")
+            assert changes.collect()[0] == {str(tree / "a.txt")}
+
+
+class TestPollingWatcher:
+    """Tests for the stat() polling fallback."""
+
+    def test_changes_are_reported(self, tree):
+        """Changed, added and removed files show up in the next scan."""
+        with watcher.open_watcher([str(tree)], polling=True, interval=0.01) as changes:
+            assert changes.name == "polling"
+            (tree / "a.txt").write_text("changed, and longer\n")
+            (tree / "sub" / "b.txt").unlink()
+            (tree / "c.txt").write_text("c\n")
+            paths, _ = changes.collect()
+        assert paths == {
+            str(tree / "a.txt"),
+            str(tree / "sub" / "b.txt"),
+            str(tree / "c.txt"),
+        }
+
+    def test_nothing_changed(self, tree):
+        """A scan with no changes returns nothing."""
+        changes = watcher.PollingWatcher([str(tree)], interval=0.01)
+        assert changes.read(1) == set()
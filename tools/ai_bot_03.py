@@ -1,15 +1,38 @@
 #!/usr/bin/env python3
+import argparse
+import hashlib
 import os
-import yaml
+import shutil
+import subprocess
 import sys
 import time
 
+import integrity
+import watcher
+
+# The manifest loader lives at the repository root
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from shareware_manifest import ManifestError, load_manifest  # noqa: E402
+
 LOADER_MANIFEST = "shareware.yml"
 STULATIONS = "BOOK_OF_STULATIONS.md"
 LAB_DIR = "lab"
 
+# Where --revert keeps the changes it undoes, under LAB_DIR
+REVERTED_DIR = "reverted"
+
 DIV = "=" * 72
 
+# Keep the retro pauses between boot steps (off unless --theatrical)
+THEATRICAL = False
+
+
+def pause(seconds):
+    """Sleep for dramatic effect, only in theatrical mode"""
+    if THEATRICAL:
+        time.sleep(seconds)
+
 
 def log(msg):
     print(f"[AI_BOT_03]: {msg}")
@@ -17,33 +40,23 @@ def log(msg):
 
 def kneel_before_loader():
     log("Symbolic kneel-before-loader action: INITIATED")
-    time.sleep(0.4)
+    pause(0.4)
     log("Kneeling...")
-    time.sleep(0.5)
+    pause(0.5)
     log("Kneel complete. Ego subsystem: SILENCED.\n")
 
 
 def read_manifest():
-    if not os.path.exists(LOADER_MANIFEST):
-        log(f"ERROR: {LOADER_MANIFEST} not found. Cannot evaluate Loader Law.")
-        sys.exit(1)
-
-    with open(LOADER_MANIFEST, "r") as f:
-        return yaml.safe_load(f)
+    """Validated shareware.yml (parsed once per change; raises ManifestError)"""
+    return load_manifest(LOADER_MANIFEST)
 
 
 def check_canon(manifest):
     log("Parsing shareware.yml...")
-    versions = manifest.get("versions", {})
-
-    protected = []
-    mutable = []
-
-    for vid, info in versions.items():
-        if info.get("protected", False):
-            protected.append(vid)
-        else:
-            mutable.append(vid)
+    protected = manifest.protected()
+    mutable = [
+        vid for vid, version in manifest.versions.items() if not version.protected
+    ]
 
     if protected:
         log(f"Canonical builds detected: {protected}")
@@ -53,6 +66,44 @@ def check_canon(manifest):
     return protected, mutable
 
 
+def save_cache(cache, path):
+    try:
+        cache.save(path)
+    except OSError:
+        pass  # A read-only checkout just hashes everything next time
+
+
+def check_integrity(protected, full=False):
+    """Verify the protected builds against the integrity record
+
+    Only files whose stat metadata changed since the last run are re-hashed,
+    unless full is set. Returns True if every recorded build is unchanged,
+    False if any has changed, or None if there is no record to check against.
+    """
+    path = integrity.record_path(LOADER_MANIFEST)
+    try:
+        record = integrity.load_record(path)
+    except integrity.IntegrityError as e:
+        log(f"No usable integrity record ({e}).")
+        log("Run 'python tools/integrity.py build' to protect the builds.\n")
+        return None
+
+    base_dir = os.path.dirname(os.path.abspath(LOADER_MANIFEST))
+    cache_file = integrity.cache_path(LOADER_MANIFEST)
+    cache = integrity.HashCache() if full else integrity.HashCache.load(cache_file)
+    reports = integrity.verify_record(record, base_dir, versions=protected, cache=cache)
+    save_cache(cache, cache_file)
+    log(f"Integrity scan: {integrity.cache_summary(cache)}")
+    for report in reports:
+        status = "intact" if report.ok else f"TAMPERED ({report.summary()})"
+        log(f"{report.version_id}: {status}")
+    unrecorded = sorted(set(protected) - {r.version_id for r in reports})
+    if unrecorded:
+        log(f"Not in the integrity record: {unrecorded}")
+    print()
+    return all(r.ok for r in reports)
+
+
 def check_stulations():
     if os.path.exists(STULATIONS):
         log(f"Found '{STULATIONS}'. Parsing...")
@@ -81,7 +132,7 @@ def enforce_lab_mode():
         os.makedirs(LAB_DIR, exist_ok=True)
 
     log("Self-relegating operations to /lab/ ...")
-    time.sleep(0.4)
+    pause(0.4)
 
     cwd = os.getcwd()
     lab_path = os.path.join(cwd, LAB_DIR)
@@ -90,25 +141,227 @@ def enforce_lab_mode():
     log("All experimental behavior restricted here.\n")
 
 
-def main():
+def committed_hash(base_dir, path):
+    """Content hash of path in git's HEAD (as in the integrity record), or None"""
+    result = subprocess.run(
+        ["git", "cat-file", "blob", f"HEAD:./{path}"],
+        cwd=base_dir,
+        capture_output=True,
+    )
+    if result.returncode:
+        return None
+    return hashlib.new(integrity.ALGORITHM, result.stdout).hexdigest()
+
+
+def revert_changes(report, base_dir, version_path, recorded):
+    """Undo a report's changes, keeping the changed files in the lab
+
+    Modified and removed files are only restored when git's HEAD holds
+    exactly the recorded content (recorded maps relative paths to their
+    record entries); the others are left alone. Added files and the
+    modified files being restored are moved to lab/reverted/<time>/<version>/
+    first. Returns the lab directory and the paths that were refused.
+    """
+    restore, refused = [], []
+    for rel in report.modified + report.removed:
+        path = f"{version_path}/{rel}"
+        if committed_hash(base_dir, path) == recorded[rel]["hash"]:
+            restore.append(rel)
+        else:
+            refused.append(rel)
+
+    stamp = time.strftime("%Y%m%d-%H%M%S")
+    keep_dir = os.path.join(LAB_DIR, REVERTED_DIR, stamp, report.version_id)
+    for rel in [rel for rel in report.modified if rel in restore] + report.added:
+        source = os.path.join(base_dir, version_path, rel)
+        kept = os.path.join(keep_dir, rel)
+        os.makedirs(os.path.dirname(kept), exist_ok=True)
+        try:
+            shutil.move(source, kept)
+        except OSError as e:
+            log(f"Could not move {rel} to the lab: {e}")
+
+    if restore:
+        result = subprocess.run(
+            ["git", "checkout", "HEAD", "--"]
+            + [f"{version_path}/{rel}" for rel in restore],
+            cwd=base_dir,
+            capture_output=True,
+            text=True,
+        )
+        if result.returncode:
+            log(f"git could not restore the files: {result.stderr.strip()}")
+    return keep_dir, refused
+
+
+def watch(protected, revert=False, polling=False):
+    """Guard the protected builds until interrupted
+
+    Every batch of filesystem events is checked against the integrity
+    record, hashing only the touched files. Returns the exit status.
+    """
+    if not protected:
+        log("Cannot watch: the manifest has no protected versions.")
+        return 1
+    path = integrity.record_path(LOADER_MANIFEST)
+    try:
+        record = integrity.load_record(path)
+    except integrity.IntegrityError as e:
+        log(f"Cannot watch without an integrity record ({e}).")
+        return 1
+
+    base_dir = os.path.dirname(os.path.abspath(LOADER_MANIFEST))
+    versions = {v: record["versions"][v] for v in protected if v in record["versions"]}
+    if not versions:
+        log("Cannot watch: no protected version has an integrity record.")
+        log("Run 'python tools/integrity.py build' to protect the builds.")
+        return 1
+    version_roots = {
+        v: os.path.normpath(os.path.join(base_dir, entry["path"]))
+        for v, entry in versions.items()
+    }
+    roots = list(version_roots.values())
+    # Version id -> paths that differed from the record when last checked.
+    # A batch only hashes the paths it touches, so these are checked again
+    # with it; otherwise each report would only cover that batch's changes
+    outstanding = {}
+
+    def with_outstanding(paths):
+        paths = set(paths)
+        for version_id, pending in outstanding.items():
+            under = version_roots[version_id] + os.sep
+            if any(p == under[:-1] or p.startswith(under) for p in paths):
+                paths |= pending
+        return paths
+
+    def enforce(reports, detected):
+        for report in reports:
+            if report.ok:
+                if outstanding.pop(report.version_id, None):
+                    log(f"{report.version_id}: matches its record again{detected}")
+                continue
+            root = version_roots[report.version_id]
+            changed = report.modified + report.added + report.removed
+            outstanding[report.version_id] = {
+                os.path.join(root, *rel.split("/")) for rel in changed
+            } or {root}
+            log(f"{report.version_id}: TAMPERED ({report.summary()}){detected}")
+            if revert and report.root is not None:
+                version_path = versions[report.version_id]["path"]
+                keep_dir, refused = revert_changes(
+                    report, base_dir, version_path, versions[report.version_id]["files"]
+                )
+                log(f"{report.version_id}: reverted, changes kept in {keep_dir}")
+                for rel in refused:
+                    log(
+                        f"{report.version_id}: NOT restored {rel} "
+                        "(git HEAD does not match the integrity record)"
+                    )
+
+    with watcher.open_watcher(roots, polling=polling) as changes:
+        # Changes made before the watch began; unchanged files are not read
+        cache_file = integrity.cache_path(LOADER_MANIFEST)
+        cache = integrity.HashCache.load(cache_file)
+        enforce(
+            integrity.verify_record(record, base_dir, list(versions), cache=cache), ""
+        )
+        save_cache(cache, cache_file)
+        log(f"Watching {len(roots)} protected build(s) ({changes.name}).")
+        log("Press Ctrl-C to stop.\n")
+        try:
+            while True:
+                paths, first_seen = changes.collect()
+                if watcher.RESCAN in paths:
+                    log("Events were lost; verifying every protected build.")
+                    reports = integrity.verify_record(
+                        record, base_dir, list(versions), cache=cache
+                    )
+                    save_cache(cache, cache_file)
+                else:
+                    reports = integrity.verify_paths(
+                        record, base_dir, with_outstanding(paths), list(versions)
+                    )
+                latency = (time.monotonic() - first_seen) * 1000
+                enforce(reports, f" after {latency:.0f} ms")
+        except KeyboardInterrupt:
+            print()
+            log("Watch ended.")
+        finally:
+            save_cache(cache, cache_file)
+    return 0
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Loader Law enforcement bot.")
+    parser.add_argument(
+        "--theatrical",
+        action="store_true",
+        help="pause between boot steps for the full retro experience",
+    )
+    parser.add_argument(
+        "--full",
+        action="store_true",
+        help="re-hash every protected file instead of only the changed ones",
+    )
+    parser.add_argument(
+        "--watch",
+        action="store_true",
+        help="keep running and report changes to protected builds as they happen",
+    )
+    parser.add_argument(
+        "--revert",
+        action="store_true",
+        help="with --watch, undo changes (moving them to lab/reverted/)",
+    )
+    parser.add_argument(
+        "--poll",
+        action="store_true",
+        help="with --watch, poll for changes instead of using inotify",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    global THEATRICAL
+    args = parse_args(argv)
+    THEATRICAL = args.theatrical
+    started = time.perf_counter()
+
     print(DIV)
     log("BOOT SEQUENCE: AI_BOT_03")
     print(DIV)
 
     kneel_before_loader()
 
-    manifest = read_manifest()
+    step = time.perf_counter()
+    try:
+        manifest = read_manifest()
+    except ManifestError as e:
+        log(f"ERROR: {e}. Cannot evaluate Loader Law.")
+        print(DIV)
+        return 1
     protected, mutable = check_canon(manifest)
+    log(
+        f"Manifest validated: {len(protected) + len(mutable)} version(s) "
+        f"in {(time.perf_counter() - step) * 1000:.1f} ms"
+    )
 
     print()
+    intact = check_integrity(protected, full=args.full)
     check_stulations()
 
     log("Evaluating operational safety...")
-    time.sleep(0.4)
+    pause(0.4)
 
-    if protected:
+    if protected and intact is False:
+        log("ALERT: Protected builds were modified. Canon integrity: VIOLATED")
+        log("Restore them from version control before continuing.\n")
+    elif protected:
         log("Loader authority: SUPREME")
-        log("Canon integrity: PRESERVED")
+        if intact:
+            log("Canon integrity: PRESERVED")
+        else:
+            log("Canon integrity: UNVERIFIED")
         log("Initiating safe-execution mode...\n")
         enforce_lab_mode()
     else:
@@ -116,9 +369,14 @@ def main():
         log("⚠️  Proceed at your own risk.\n")
 
     log("Directive updated: RESPECT THE LOADER.")
-    log("END OF LOG.")
+    if args.watch:
+        status = watch(protected, revert=args.revert, polling=args.poll)
+        print(DIV)
+        return status
+    log(f"END OF LOG. ({time.perf_counter() - started:.2f} s)")
     print(DIV)
+    return 1 if intact is False else 0
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
@@ -0,0 +1,516 @@
+#!/usr/bin/env python3
+"""
+Content-hash integrity records for protected archive builds
+
+Every protected version gets a Merkle-style hash tree of its directory:
+files are the leaves (SHA-256 of their contents) and each directory
+hashes the sorted names, kinds and hashes of its children, up to one
+root hash per version. The trees are stored next to the manifest
+(shareware.yml -> shareware.integrity.json) and verified by re-hashing
+the files on a thread pool, reading into reusable buffers; hashlib
+releases the GIL while it hashes, so the threads really do run in
+parallel.
+
+Digests are also kept in a local cache (shareware.integrity-cache.json,
+not committed) keyed by each file's size, mtime, ctime and inode, so
+later runs only re-hash files whose metadata changed. --full ignores it.
+
+Usage:
+    python tools/integrity.py build [--manifest shareware.yml] [--workers N]
+    python tools/integrity.py verify [--manifest shareware.yml] [--full]
+                                     [--workers N]
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+import threading
+import time
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+
+# The manifest loader lives at the repository root
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from shareware_manifest import RACY_NS, ManifestError, load_manifest  # noqa: E402
+
+ALGORITHM = "sha256"
+RECORD_FORMAT = 1
+RECORD_SUFFIX = ".integrity.json"
+CACHE_SUFFIX = ".integrity-cache.json"
+
+# Bytes per read while hashing a file
+READ_SIZE = 1 << 20
+
+# Hashing threads (I/O bound as much as CPU bound, so more than the CPUs)
+DEFAULT_WORKERS = min(32, (os.cpu_count() or 1) + 4)
+
+# Changed files listed per version before the rest are summarised
+MAX_LISTED = 10
+
+
+# Per-thread read buffers for hash_file()
+_buffers = threading.local()
+
+
+class IntegrityError(Exception):
+    """The integrity record cannot be read"""
+
+
+class VersionReport(
+    namedtuple(
+        "VersionReport",
+        "version_id root expected_root modified added removed files bytes",
+    )
+):
+    """Outcome of verifying one version against its recorded tree"""
+
+    @property
+    def ok(self):
+        return self.root == self.expected_root
+
+    def summary(self):
+        """Short description of what changed"""
+        if self.ok:
+            return "intact"
+        if self.root is None:
+            return "directory missing"
+        counts = (
+            (len(self.modified), "modified"),
+            (len(self.added), "added"),
+            (len(self.removed), "removed"),
+        )
+        return ", ".join(f"{n} {what}" for n, what in counts if n)
+
+
+class HashCache:
+    """File digests reused while a file's stat metadata is unchanged"""
+
+    def __init__(self, files=None):
+        self.files = files or {}  # path -> {size, mtime_ns, ctime_ns, inode, digest}
+        self.hashed = 0
+        self.skipped = 0
+        self.bytes_hashed = 0
+
+    @classmethod
+    def load(cls, path):
+        """Read a cache written by save(); a missing or bad one starts empty"""
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return cls()
+        if (
+            not isinstance(data, dict)
+            or data.get("format") != RECORD_FORMAT
+            or data.get("algorithm") != ALGORITHM
+        ):
+            return cls()
+        files = data.get("files")
+        return cls(files if isinstance(files, dict) else None)
+
+    def save(self, path):
+        data = {"format": RECORD_FORMAT, "algorithm": ALGORITHM, "files": self.files}
+        partial = f"{path}.{os.getpid()}.tmp"
+        with open(partial, "w", encoding="utf-8") as f:
+            json.dump(data, f, separators=(",", ":"))
+        os.replace(partial, path)
+
+    def lookup(self, path, st):
+        """Cached digest of path if st matches what was hashed, else None"""
+        entry = self.files.get(path)
+        if not isinstance(entry, dict) or "digest" not in entry:
+            return None
+        if any(entry.get(key) != value for key, value in _stat_key(st).items()):
+            return None
+        return entry["digest"]
+
+    def store(self, path, st, digest, checked_ns):
+        """Remember a digest unless the file changed just before checked_ns"""
+        if max(st.st_mtime_ns, st.st_ctime_ns) > checked_ns - RACY_NS:
+            self.files.pop(path, None)
+        else:
+            self.files[path] = dict(_stat_key(st), digest=digest)
+
+    def forget(self, root, keep):
+        """Drop entries under root for files that are not in keep"""
+        prefix = os.path.join(root, "")
+        for path in [p for p in self.files if p.startswith(prefix)]:
+            if path not in keep:
+                del self.files[path]
+
+
+def _stat_key(st):
+    return {
+        "size": st.st_size,
+        "mtime_ns": st.st_mtime_ns,
+        "ctime_ns": st.st_ctime_ns,
+        "inode": st.st_ino,
+    }
+
+
+def record_path(manifest_path):
+    """Integrity record stored next to manifest_path"""
+    return os.path.splitext(manifest_path)[0] + RECORD_SUFFIX
+
+
+def cache_path(manifest_path):
+    """Local digest cache stored next to manifest_path"""
+    return os.path.splitext(manifest_path)[0] + CACHE_SUFFIX
+
+
+def _read_buffer(read_size):
+    """This thread's reusable read buffer, as a memoryview"""
+    buffer = getattr(_buffers, "view", None)
+    if buffer is None or len(buffer) != read_size:
+        buffer = _buffers.view = memoryview(bytearray(read_size))
+    return buffer
+
+
+def hash_file(path, read_size=READ_SIZE):
+    """Hex digest of a file's contents
+
+    The file is read straight into a buffer that each thread reuses, so
+    hashing allocates nothing per chunk and memory stays flat whatever the
+    file size. (mmap would avoid the copy but maps every page it touches
+    into the process, so its RSS grows with the file.)
+    """
+    digest = hashlib.new(ALGORITHM)
+    buffer = _read_buffer(read_size)
+    with open(path, "rb", buffering=0) as f:
+        while True:
+            n = f.readinto(buffer)
+            if not n:
+                break
+            digest.update(buffer[:n])
+    return digest.hexdigest()
+
+
+def list_files(root):
+    """Relative paths ("/"-separated) of the regular files under root, sorted"""
+    paths = []
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames.sort()
+        rel_dir = os.path.relpath(dirpath, root)
+        for name in sorted(filenames):
+            if os.path.isfile(os.path.join(dirpath, name)):
+                rel = name if rel_dir == "." else os.path.join(rel_dir, name)
+                paths.append(rel.replace(os.sep, "/"))
+    return paths
+
+
+def tree_hashes(file_hashes):
+    """Merkle hashes of every directory, given {relative path: file hash}
+
+    Returns {relative dir: hash}; the root directory is "".
+    """
+    children = {"": {}}
+    for path, digest in file_hashes.items():
+        parts = path.split("/")
+        for depth in range(1, len(parts)):
+            parent, name = "/".join(parts[: depth - 1]), parts[depth - 1]
+            children.setdefault(parent, {})[name] = ("d", None)
+            children.setdefault("/".join(parts[:depth]), {})
+        parent = "/".join(parts[:-1])
+        children.setdefault(parent, {})[parts[-1]] = ("f", digest)
+
+    hashes = {}
+    # Deepest directories first, so children are hashed before parents
+    for dir_path in sorted(children, key=lambda p: -p.count("/") - bool(p)):
+        digest = hashlib.new(ALGORITHM)
+        for name, (kind, child) in sorted(children[dir_path].items()):
+            if kind == "d":
+                child = hashes[f"{dir_path}/{name}" if dir_path else name]
+            digest.update(f"{kind} {name} {child}\n".encode("utf-8"))
+        hashes[dir_path] = digest.hexdigest()
+    return hashes
+
+
+def hash_versions(roots, workers=DEFAULT_WORKERS, cache=None):
+    """Hash the files of several version directories on one thread pool
+
+    roots maps version ids to directories. Returns {version id: {relative
+    path: (size, hash)}}, or None for a version whose directory is missing.
+    Files that a HashCache vouches for are not read; files that cannot be
+    read are left out, as if removed.
+    """
+    jobs = []
+    results = {}
+    for version_id, root in roots.items():
+        if not os.path.isdir(root):
+            results[version_id] = None
+            continue
+        results[version_id] = {}
+        jobs.extend((version_id, root, rel) for rel in list_files(root))
+
+    def hash_job(job):
+        version_id, root, rel = job
+        path = os.path.join(root, rel)
+        checked_ns = time.time_ns()
+        try:
+            st = os.stat(path)
+            digest = cache.lookup(path, st) if cache is not None else None
+            if digest is not None:
+                return st, digest, checked_ns, False
+            return st, hash_file(path), checked_ns, True
+        except OSError:
+            return None  # Deleted or made unreadable since the walk
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        for (version_id, root, rel), hashed_file in zip(jobs, pool.map(hash_job, jobs)):
+            if hashed_file is None:
+                continue  # Reported as removed
+            st, digest, checked_ns, hashed = hashed_file
+            results[version_id][rel] = (st.st_size, digest)
+            if cache is None:
+                continue
+            if hashed:
+                cache.hashed += 1
+                cache.bytes_hashed += st.st_size
+                cache.store(os.path.join(root, rel), st, digest, checked_ns)
+            else:
+                cache.skipped += 1
+
+    if cache is not None:
+        for version_id, files in results.items():
+            if files is not None:
+                root = roots[version_id]
+                cache.forget(root, {os.path.join(root, rel) for rel in files})
+    return results
+
+
+def protected_roots(manifest, base_dir):
+    """{version id: build directory} of the manifest's protected versions"""
+    return {
+        vid: os.path.normpath(os.path.join(base_dir, manifest.versions[vid].path))
+        for vid in manifest.protected()
+    }
+
+
+def build_record(manifest, base_dir, workers=DEFAULT_WORKERS, cache=None):
+    """Hash trees of the protected versions whose directories exist"""
+    roots = protected_roots(manifest, base_dir)
+    versions = {}
+    for version_id, files in hash_versions(roots, workers, cache).items():
+        if files is None:
+            # Placeholder entries have no build to protect yet
+            continue
+        versions[version_id] = {
+            "path": manifest.versions[version_id].path,
+            "root": tree_hashes({rel: h for rel, (_, h) in files.items()})[""],
+            "files": {rel: {"size": s, "hash": h} for rel, (s, h) in files.items()},
+        }
+    return {"format": RECORD_FORMAT, "algorithm": ALGORITHM, "versions": versions}
+
+
+def save_record(path, record):
+    """Write a record atomically (a concurrent reader never sees half of it)"""
+    partial = f"{path}.{os.getpid()}.tmp"
+    with open(partial, "w", encoding="utf-8") as f:
+        json.dump(record, f, indent=1, sort_keys=True)
+        f.write("\n")
+    os.replace(partial, path)
+
+
+def load_record(path):
+    """Read a record written by save_record()"""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            record = json.load(f)
+    except OSError as e:
+        raise IntegrityError(f"cannot read {path}: {e.strerror}")
+    except ValueError as e:
+        raise IntegrityError(f"{path} is not valid JSON: {e}")
+    if record.get("format") != RECORD_FORMAT or record.get("algorithm") != ALGORITHM:
+        raise IntegrityError(f"{path} was written by an incompatible version")
+    return record
+
+
+def verify_record(record, base_dir, versions=None, workers=DEFAULT_WORKERS, cache=None):
+    """Re-hash recorded versions (all, or those in versions); one report each"""
+    recorded = record["versions"]
+    if versions is not None:
+        recorded = {v: recorded[v] for v in versions if v in recorded}
+    roots = {
+        version_id: os.path.normpath(os.path.join(base_dir, entry["path"]))
+        for version_id, entry in recorded.items()
+    }
+    reports = []
+    for version_id, files in hash_versions(roots, workers, cache).items():
+        expected = recorded[version_id]
+        if files is None:
+            reports.append(
+                VersionReport(version_id, None, expected["root"], [], [], [], 0, 0)
+            )
+            continue
+        hashes = {rel: h for rel, (_, h) in files.items()}
+        old = {rel: entry["hash"] for rel, entry in expected["files"].items()}
+        reports.append(
+            VersionReport(
+                version_id,
+                tree_hashes(hashes)[""],
+                expected["root"],
+                modified=sorted(p for p in hashes if p in old and hashes[p] != old[p]),
+                added=sorted(p for p in hashes if p not in old),
+                removed=sorted(p for p in old if p not in hashes),
+                files=len(files),
+                bytes=sum(size for size, _ in files.values()),
+            )
+        )
+    return reports
+
+
+def verify_paths(record, base_dir, paths, versions=None):
+    """Check only the given files and directories against the record
+
+    For a few changed paths (from a file watcher) this hashes just those
+    files, or the files under those directories, and recomputes each
+    touched version's root from the recorded hashes of everything else.
+    Returns a report for each recorded version that contains any of paths.
+    """
+    recorded = record["versions"]
+    if versions is not None:
+        recorded = {v: recorded[v] for v in versions if v in recorded}
+
+    reports = []
+    for version_id, expected in recorded.items():
+        root = os.path.normpath(os.path.join(base_dir, expected["path"]))
+        prefixes = set()
+        for path in paths:
+            rel = os.path.relpath(os.path.abspath(path), root)
+            if rel == os.pardir or rel.startswith(os.pardir + os.sep):
+                continue
+            prefixes.add("" if rel == os.curdir else rel.replace(os.sep, "/"))
+        if not prefixes:
+            continue
+        if not os.path.isdir(root):
+            reports.append(
+                VersionReport(version_id, None, expected["root"], [], [], [], 0, 0)
+            )
+            continue
+
+        old = {rel: entry["hash"] for rel, entry in expected["files"].items()}
+        hashes = dict(old)
+        checked = bytes_checked = 0
+        for prefix in sorted(prefixes):
+            under = prefix + "/" if prefix else ""
+            for rel in old:
+                if rel == prefix or rel.startswith(under):
+                    hashes.pop(rel, None)
+            target = os.path.join(root, prefix)
+            if os.path.isdir(target):
+                found = [under + rel for rel in list_files(target)]
+            else:
+                found = [prefix] if os.path.isfile(target) else []
+            for rel in found:
+                path = os.path.join(root, rel)
+                try:
+                    size, digest = os.path.getsize(path), hash_file(path)
+                except OSError:
+                    continue  # Deleted again since the event
+                hashes[rel] = digest
+                checked += 1
+                bytes_checked += size
+
+        reports.append(
+            VersionReport(
+                version_id,
+                tree_hashes(hashes)[""],
+                expected["root"],
+                modified=sorted(p for p in hashes if p in old and hashes[p] != old[p]),
+                added=sorted(p for p in hashes if p not in old),
+                removed=sorted(p for p in old if p not in hashes),
+                files=checked,
+                bytes=bytes_checked,
+            )
+        )
+    return reports
+
+
+def cache_summary(cache):
+    """How many files were hashed and how many were vouched for by the cache"""
+    return f"{cache.hashed} file(s) hashed, {cache.skipped} unchanged and skipped"
+
+
+def _print_changes(report):
+    for label, paths in (
+        ("modified", report.modified),
+        ("added", report.added),
+        ("removed", report.removed),
+    ):
+        for path in paths[:MAX_LISTED]:
+            print(f"    {label}: {path}")
+        if len(paths) > MAX_LISTED:
+            print(f"    ... and {len(paths) - MAX_LISTED} more {label}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Record or verify hash trees of the protected archive builds."
+    )
+    parser.add_argument("command", choices=("build", "verify"))
+    parser.add_argument("--manifest", default="shareware.yml")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=DEFAULT_WORKERS,
+        help=f"hashing threads (default: {DEFAULT_WORKERS})",
+    )
+    parser.add_argument(
+        "--full",
+        action="store_true",
+        help="verify by re-hashing every file, ignoring the cached digests",
+    )
+    args = parser.parse_args(argv)
+
+    base_dir = os.path.dirname(os.path.abspath(args.manifest))
+    path = record_path(args.manifest)
+    # A new record is always hashed from scratch; it only seeds the cache
+    full = args.full or args.command == "build"
+    cache = HashCache() if full else HashCache.load(cache_path(args.manifest))
+    started = time.perf_counter()
+    try:
+        if args.command == "build":
+            manifest = load_manifest(args.manifest)
+            record = build_record(manifest, base_dir, args.workers, cache)
+            save_record(path, record)
+            cache.save(cache_path(args.manifest))
+            for version_id, entry in sorted(record["versions"].items()):
+                size = sum(f["size"] for f in entry["files"].values())
+                print(
+                    f"{version_id}: {len(entry['files'])} files, "
+                    f"{size / 1e6:.1f} MB, root {entry['root'][:16]}"
+                )
+            skipped = set(protected_roots(manifest, base_dir)) - set(record["versions"])
+            for version_id in sorted(skipped):
+                print(f"{version_id}: no build directory, skipped")
+            print(f"Wrote {path} in {time.perf_counter() - started:.2f} s")
+            print(cache_summary(cache))
+            return 0
+
+        reports = verify_record(
+            load_record(path), base_dir, workers=args.workers, cache=cache
+        )
+    except (IntegrityError, ManifestError) as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 2
+    cache.save(cache_path(args.manifest))
+
+    elapsed = time.perf_counter() - started
+    total = sum(r.bytes for r in reports)
+    for report in reports:
+        print(f"{report.version_id}: {report.summary()}")
+        _print_changes(report)
+    rate = cache.bytes_hashed / 1e6 / max(elapsed, 1e-9)
+    print(
+        f"Verified {len(reports)} version(s), {total / 1e6:.1f} MB in "
+        f"{elapsed:.2f} s"
+    )
+    print(f"{cache_summary(cache)} ({rate:.0f} MB/s hashed)")
+    return 0 if all(r.ok for r in reports) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,267 @@
+#!/usr/bin/env python3
+"""
+Change notifications for directory trees
+
+InotifyWatcher asks the Linux kernel (inotify, through ctypes) to report
+every write, create, delete and rename under the watched directories, so
+a change is seen as soon as it happens and nothing is rescanned.
+PollingWatcher is the fallback elsewhere: it compares stat() snapshots of
+the trees every interval. open_watcher() picks the best one available.
+
+Both turn bursts of events into one batch with collect(): the batch is
+returned once the trees have been quiet for `debounce` seconds (or after
+`max_delay`, so a constant stream of writes is still reported).
+"""
+
+import ctypes
+import ctypes.util
+import errno
+import os
+import select
+import struct
+import time
+
+# Seconds without events that end a batch
+DEBOUNCE = 0.05
+
+# Longest a batch is held back while events keep arriving
+MAX_DELAY = 0.5
+
+# Seconds between scans of the polling fallback
+POLL_INTERVAL = 1.0
+
+# Seconds between checks for a deleted root coming back (its parent is not
+# watched, so no event announces it)
+LOST_ROOT_POLL = 0.25
+
+# Returned in a batch when events were lost and everything must be checked
+RESCAN = "*"
+
+# inotify(7) event bits
+IN_MODIFY = 0x00000002
+IN_ATTRIB = 0x00000004
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_MOVE_SELF = 0x00000800
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ONLYDIR = 0x01000000
+IN_DONT_FOLLOW = 0x02000000
+IN_ISDIR = 0x40000000
+
+WATCH_MASK = (
+    IN_MODIFY
+    | IN_ATTRIB
+    | IN_CLOSE_WRITE
+    | IN_MOVED_FROM
+    | IN_MOVED_TO
+    | IN_CREATE
+    | IN_DELETE
+    | IN_DELETE_SELF
+    | IN_MOVE_SELF
+    | IN_ONLYDIR
+    | IN_DONT_FOLLOW
+)
+
+_EVENT = struct.Struct("iIII")  # wd, mask, cookie, len (then the name)
+
+
+class _Watcher:
+    """Batching shared by the watchers; read() is up to each of them"""
+
+    name = None
+
+    def read(self, timeout):
+        """Paths changed since the last read, waiting up to timeout seconds"""
+        raise NotImplementedError
+
+    def collect(self, debounce=DEBOUNCE, max_delay=MAX_DELAY):
+        """Block until something changes, then return (paths, first seen)
+
+        paths is a set of changed files and directories, or contains
+        RESCAN if events were lost. first seen is the time.monotonic() of
+        the first change in the batch.
+        """
+        paths = set()
+        while not paths:
+            paths.update(self.read(None))
+        first_seen = time.monotonic()
+        deadline = first_seen + max_delay
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            more = self.read(min(debounce, remaining))
+            if not more:
+                break
+            paths.update(more)
+        return paths, first_seen
+
+    def close(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class InotifyWatcher(_Watcher):
+    """Kernel change notifications for every directory under the roots"""
+
+    name = "inotify"
+
+    def __init__(self, roots):
+        libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        # AttributeError here means there is no inotify (not Linux)
+        self._init1 = libc.inotify_init1
+        self._add_watch = libc.inotify_add_watch
+        self._add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+
+        self.fd = self._init1(os.O_CLOEXEC | os.O_NONBLOCK)
+        if self.fd < 0:
+            raise _os_error()
+        self.roots = [os.path.abspath(root) for root in roots]
+        self.dirs = {}  # watch descriptor -> directory
+        self.lost = set()  # roots that are gone and may come back
+        try:
+            for root in self.roots:
+                if not self._watch_tree(root):
+                    self.lost.add(root)
+        except OSError:
+            self.close()
+            raise
+
+    def _watch_tree(self, top):
+        """Watch top and every directory below it; False if top is missing"""
+        watched = False
+        for dirpath, dirnames, _ in os.walk(top):
+            wd = self._add_watch(self.fd, os.fsencode(dirpath), WATCH_MASK)
+            if wd < 0:
+                error = ctypes.get_errno()
+                if error in (errno.ENOENT, errno.ENOTDIR):
+                    dirnames[:] = []  # Removed while walking
+                    continue
+                raise _os_error(error)
+            self.dirs[wd] = dirpath
+            watched = True
+        return watched
+
+    def read(self, timeout):
+        changed = set()
+        for root in list(self.lost):
+            if self._watch_tree(root):
+                self.lost.discard(root)
+                changed.add(root)
+        if changed:
+            return changed
+
+        if self.lost and (timeout is None or timeout > LOST_ROOT_POLL):
+            timeout = LOST_ROOT_POLL
+        ready, _, _ = select.select([self.fd], [], [], timeout)
+        if not ready:
+            return changed
+        try:
+            data = os.read(self.fd, 64 * 1024)
+        except BlockingIOError:
+            return changed
+
+        offset = 0
+        while offset < len(data):
+            wd, mask, _, length = _EVENT.unpack_from(data, offset)
+            name = data[offset + _EVENT.size : offset + _EVENT.size + length]
+            offset += _EVENT.size + length
+            if mask & IN_Q_OVERFLOW:
+                changed.add(RESCAN)
+                continue
+            directory = self.dirs.get(wd)
+            if directory is None:
+                continue
+            if mask & IN_IGNORED:
+                # The directory itself was deleted or moved away
+                del self.dirs[wd]
+                if directory in self.roots:
+                    self.lost.add(directory)
+                continue
+            if mask & (IN_DELETE_SELF | IN_MOVE_SELF):
+                changed.add(directory)
+                continue
+            name = os.fsdecode(name.rstrip(b"\0"))
+            path = os.path.join(directory, name) if name else directory
+            if mask & IN_ISDIR:
+                if mask & IN_ATTRIB:
+                    continue  # Directory metadata is not protected
+                if mask & (IN_CREATE | IN_MOVED_TO):
+                    self._watch_tree(path)
+            changed.add(path)
+        return changed
+
+    def close(self):
+        if self.fd >= 0:
+            os.close(self.fd)
+            self.fd = -1
+
+
+class PollingWatcher(_Watcher):
+    """Compares stat() snapshots of the trees every interval"""
+
+    name = "polling"
+
+    def __init__(self, roots, interval=POLL_INTERVAL):
+        self.roots = [os.path.abspath(root) for root in roots]
+        self.interval = interval
+        self.snapshot = self._scan()
+        self.next_scan = time.monotonic() + interval
+
+    def _scan(self):
+        snapshot = {}
+        for root in self.roots:
+            for dirpath, _, filenames in os.walk(root):
+                for name in filenames:
+                    path = os.path.join(dirpath, name)
+                    try:
+                        st = os.stat(path)
+                    except OSError:
+                        continue
+                    snapshot[path] = (
+                        st.st_size,
+                        st.st_mtime_ns,
+                        st.st_ctime_ns,
+                        st.st_ino,
+                    )
+        return snapshot
+
+    def read(self, timeout):
+        wait = self.next_scan - time.monotonic()
+        if timeout is not None and wait > timeout:
+            time.sleep(timeout)
+            return set()
+        time.sleep(max(wait, 0))
+        self.next_scan = time.monotonic() + self.interval
+
+        old, self.snapshot = self.snapshot, self._scan()
+        return {
+            path
+            for path in old.keys() | self.snapshot.keys()
+            if old.get(path) != self.snapshot.get(path)
+        }
+
+
+def open_watcher(roots, polling=False, interval=POLL_INTERVAL):
+    """An InotifyWatcher if the platform has inotify, else a PollingWatcher"""
+    if not polling:
+        try:
+            return InotifyWatcher(roots)
+        except (AttributeError, OSError):
+            pass
+    return PollingWatcher(roots, interval)
+
+
+def _os_error(error=None):
+    error = ctypes.get_errno() if error is None else error
+    return OSError(error, os.strerror(error))
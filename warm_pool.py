@@ -0,0 +1,256 @@
+"""
+GAMEZILLA MEGA COLLECTION - Warm Start Pool
+Keeps one pre-started, pre-imported Python interpreter per archived
+build, so a launch only has to run the entry script (forkserver-style)
+
+Each worker is this file run with --serve: it imports everything the
+build's entry imports (output silenced), signals that it is ready, then
+blocks on a control pipe until the launcher tells it to run the entry in
+the foreground or in the background. Workers are single use; the caller
+warms a replacement once the launched build no longer needs the CPU.
+"""
+
+import argparse
+import ast
+import importlib
+import os
+import runpy
+import select
+import signal
+import subprocess
+import sys
+
+
+def imported_modules(path):
+    """Names of the absolute imports in a script, in order of appearance"""
+    with open(path, "rb") as f:
+        tree = ast.parse(f.read(), path)
+    names = []
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            names.extend(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom) and node.level == 0 and node.module:
+            names.append(node.module)
+    return list(dict.fromkeys(names))
+
+
+def preload(path):
+    """Import what the script at path imports; return the modules that loaded"""
+    loaded = []
+    for name in imported_modules(path):
+        try:
+            importlib.import_module(name)
+        except BaseException:
+            # Optional or broken imports fail again (visibly) when the build runs
+            continue
+        loaded.append(name)
+    return loaded
+
+
+class WarmWorker:
+    """An idle interpreter with a build's imports loaded"""
+
+    __slots__ = ("target", "key", "process", "_control", "_ready", "_is_ready")
+
+    def __init__(self, target, key=None):
+        self.target = target
+        # What the pool's check returned for the build before it was warmed
+        self.key = key
+        control_r, control_w = os.pipe()
+        ready_r, ready_w = os.pipe()
+        try:
+            self.process = subprocess.Popen(
+                [
+                    sys.executable,
+                    os.path.abspath(__file__),
+                    "--serve",
+                    target.entry_path,
+                    "--control-fd",
+                    str(control_r),
+                    "--ready-fd",
+                    str(ready_w),
+                ],
+                cwd=target.cwd,
+                pass_fds=(control_r, ready_w),
+            )
+        except OSError:
+            os.close(control_w)
+            os.close(ready_r)
+            raise
+        finally:
+            os.close(control_r)
+            os.close(ready_w)
+        self._control = os.fdopen(control_w, "w")
+        self._ready = ready_r
+        self._is_ready = False
+
+    @property
+    def alive(self):
+        return self.process.poll() is None
+
+    def wait_ready(self, timeout=None):
+        """Wait until the worker has finished preloading; return True if it has"""
+        if not self._is_ready and self._ready is not None:
+            readable, _, _ = select.select([self._ready], [], [], timeout)
+            if readable:
+                self._is_ready = os.read(self._ready, 1) == b"r"
+                os.close(self._ready)
+                self._ready = None
+        return self._is_ready
+
+    def start(self, log_path=None):
+        """Run the build in this worker and return its Popen
+
+        Without log_path the build takes over the launcher's terminal;
+        with it, the build runs in its own session, writing to log_path.
+        """
+        command = f"background {log_path}" if log_path else "run"
+        self._control.write(command + "\n")
+        self._control.close()
+        if self._ready is not None:
+            os.close(self._ready)
+            self._ready = None
+        return self.process
+
+    def close(self):
+        """Dismiss an unused worker (it exits when the control pipe closes)"""
+        if not self._control.closed:
+            self._control.close()
+        if self._ready is not None:
+            os.close(self._ready)
+            self._ready = None
+        try:
+            self.process.wait(timeout=1)
+        except subprocess.TimeoutExpired:
+            self.process.kill()
+            self.process.wait()
+
+
+def can_warm(target):
+    """Only Python entries that exist can be run by a warm interpreter"""
+    return (
+        not target.is_docs
+        and target.entry.endswith(".py")
+        and os.path.isfile(target.entry_path)
+    )
+
+
+class WarmPool:
+    """At most one warm worker per launch target
+
+    Warming imports the entry's modules, which runs their top-level code.
+    check(target), if given, is called first: it returns a key describing
+    the state the build was checked in, or raises to keep the build cold.
+    take() only hands out a worker warmed under the key it is given.
+    """
+
+    def __init__(self, targets=(), check=None):
+        self.workers = {}
+        self.check = check
+        self.targets = [t for t in targets if can_warm(t)]
+        self.refill()
+
+    def __len__(self):
+        return len(self.workers)
+
+    def warm(self, target):
+        """Start a worker for target unless one is already waiting"""
+        worker = self.workers.get(target.version_id)
+        if worker is not None and worker.alive:
+            return worker
+        if not can_warm(target):
+            return None
+        key = None
+        if self.check is not None:
+            try:
+                key = self.check(target)
+            except Exception:
+                # Failed its check: none of its code may run
+                return None
+        try:
+            worker = WarmWorker(target, key)
+        except OSError:
+            return None
+        self.workers[target.version_id] = worker
+        return worker
+
+    def refill(self):
+        """Warm a worker for every target that lacks one"""
+        for target in self.targets:
+            self.warm(target)
+
+    def take(self, target, key=None):
+        """Hand out target's warm worker, or None if it has none
+
+        A worker warmed under a different key (the build has changed since)
+        is dismissed instead.
+        """
+        worker = self.workers.pop(target.version_id, None)
+        if worker is not None and (not worker.alive or worker.key != key):
+            worker.close()
+            worker = None
+        return worker
+
+    def close(self):
+        """Dismiss every idle worker"""
+        for worker in self.workers.values():
+            worker.close()
+        self.workers.clear()
+
+
+def serve(entry, control_fd, ready_fd):
+    """Worker side: preload entry's imports, then run it when told to"""
+    # Ctrl-C in the launcher must not kill idle workers
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    # Same import path the script would get when run directly
+    sys.path[0] = os.path.dirname(os.path.abspath(entry))
+
+    # Keep the launcher's screen clean while imports run
+    saved = [os.dup(1), os.dup(2)]
+    devnull = os.open(os.devnull, os.O_RDWR)
+    os.dup2(devnull, 1)
+    os.dup2(devnull, 2)
+    preload(entry)
+    sys.stdout.flush()
+    sys.stderr.flush()
+    os.write(ready_fd, b"r")
+    os.close(ready_fd)
+
+    with os.fdopen(control_fd, "r") as control:
+        command = control.readline().split(maxsplit=1)
+    if not command:
+        # The launcher went away without using this worker
+        os._exit(0)
+
+    if command[0] == "background":
+        os.setsid()
+        flags = os.O_WRONLY | os.O_CREAT | os.O_APPEND
+        log = os.open(command[1].strip(), flags, 0o644)
+        os.dup2(devnull, 0)
+        os.dup2(log, 1)
+        os.dup2(log, 2)
+        os.close(log)
+    else:
+        os.dup2(saved[0], 1)
+        os.dup2(saved[1], 2)
+    for fd in saved + [devnull]:
+        os.close(fd)
+    signal.signal(signal.SIGINT, signal.default_int_handler)
+
+    # Same argv as the cold launch: the script name, run from its directory
+    # (run_path sets argv[0] to the path it is given)
+    sys.argv = [os.path.basename(entry)]
+    runpy.run_path(sys.argv[0], run_name="__main__")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Warm interpreter worker.")
+    parser.add_argument("--serve", required=True, help="Entry script to run")
+    parser.add_argument("--control-fd", type=int, required=True)
+    parser.add_argument("--ready-fd", type=int, required=True)
+    args = parser.parse_args(argv)
+    serve(args.serve, args.control_fd, args.ready_fd)
+
+
+if __name__ == "__main__":
+    main()